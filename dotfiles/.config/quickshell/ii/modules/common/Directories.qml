@@ -38,10 +38,12 @@ Singleton {
     property string generatedWallpaperCategoryPath: FileUtils.trimFileProtocol(`${Directories.state}/user/generated/wallpaper/category.txt`)
     property string liveCaptionsDir: FileUtils.trimFileProtocol(`${Directories.state}/user/live-captions`)
     property string liveCaptionsStatePath: `${Directories.liveCaptionsDir}/state.json`
+    property string liveCaptionsStreamPath: `${Directories.liveCaptionsDir}/state.ndjson`
     property string liveCaptionsVenvPath: `${Directories.liveCaptionsDir}/venv`
     property string liveCaptionsPythonPath: `${Directories.liveCaptionsVenvPath}/bin/python`
     property string liveCaptionsModelCachePath: `${Directories.liveCaptionsDir}/models`
     property string liveCaptionsPidPath: `${Directories.liveCaptionsDir}/backend.pid`
+    property string liveCaptionsSocketPath: `${Directories.liveCaptionsDir}/daemon.sock`
     property string liveCaptionsLogPath: `${Directories.liveCaptionsDir}/backend.log`
     property string liveCaptionsInstallScriptPath: FileUtils.trimFileProtocol(`${Directories.scriptPath}/live_captions/install_backend.sh`)
     property string liveCaptionsBackendScriptPath: FileUtils.trimFileProtocol(`${Directories.scriptPath}/live_captions/live_captions.py`)
@@ -264,10 +264,12 @@ StyledOverlayWidget {
                     Repeater {
                         model: [
                             { id: "system", label: Translation.tr("System audio") },
-                            { id: "mic",    label: Translation.tr("Microphone") }
+                            { id: "mic",    label: Translation.tr("Microphone") },
+                            { id: "both",   label: Translation.tr("Both") }
                         ]
                         delegate: DialogButton {
                             required property var modelData
+                            visible: modelData.id !== "both" || LiveCaptions.bothSourcesAvailable
                             buttonText: modelData.label
                             colBackground: LiveCaptions.sourceMode === modelData.id
                                 ? Appearance.colors.colPrimaryContainer
@@ -43,6 +43,34 @@ def find_least_busy_region(image_path, region_width=300, region_height=200, scre
         if verbose:
             print(f"Using original image size: {orig_w}x{orig_h}")
     arr = img.astype(np.float64)
+    return least_busy_window(arr, region_width, region_height, stride, horizontal_padding, vertical_padding, busiest, verbose)
+
+def window_variances(integral, integral_sq, xs, ys, region_w, region_h):
+    # Variance of every region_w x region_h window with its top-left corner in xs x ys (ranges),
+    # from cv2.integral outputs (zero first row and column). Yields (first row index into ys,
+    # variances) for bands of rows so 4K maps at stride 1 stay small. The arithmetic is done in
+    # the same order as the old per-window region_sum, so the values are bit-identical.
+    if not len(xs) or not len(ys):
+        return
+    area = region_w * region_h
+    cols = slice(xs.start, xs.stop, xs.step)
+    right_cols = slice(xs.start + region_w, xs.stop + region_w, xs.step)
+    band = max(1, (1 << 20) // len(xs))
+    for first in range(0, len(ys), band):
+        rows = ys[first:first + band]
+        top_rows = slice(rows.start, rows.stop, rows.step)
+        bottom_rows = slice(rows.start + region_h, rows.stop + region_h, rows.step)
+        sums = []
+        for ii in (integral, integral_sq):
+            total = ii[bottom_rows, right_cols] - ii[bottom_rows, cols]
+            total -= ii[top_rows, right_cols]
+            total += ii[top_rows, cols]
+            sums.append(total)
+        s, s2 = sums
+        mean = s / area
+        yield first, (s2 / area) - (mean ** 2)
+
+def least_busy_window(arr, region_width=300, region_height=200, stride=2, horizontal_padding=50, vertical_padding=50, busiest=False, verbose=False):
     h, w = arr.shape
     # Validate & adjust stride
     stride = max(1, int(stride) if stride else 1)
@@ -64,23 +92,12 @@ def find_least_busy_region(image_path, region_width=300, region_height=200, scre
             print(f"Requested region_height {region_height} too large; clamping to {max_region_h}")
         region_height = max_region_h
     # Use OpenCV's integral for fast computation
-    integral = cv2.integral(arr, sdepth=cv2.CV_64F)[1:,1:]
-    integral_sq = cv2.integral(arr**2, sdepth=cv2.CV_64F)[1:,1:]
-    def region_sum(ii, x1, y1, x2, y2):
-        # Assume bounds have been checked before calling
-        total = ii[y2, x2]
-        if x1 > 0:
-            total -= ii[y2, x1-1]
-        if y1 > 0:
-            total -= ii[y1-1, x2]
-        if x1 > 0 and y1 > 0:
-            total += ii[y1-1, x1-1]
-        return total
+    integral = cv2.integral(arr, sdepth=cv2.CV_64F)
+    integral_sq = cv2.integral(arr**2, sdepth=cv2.CV_64F)
     min_var = None
     max_var = None
     min_coords = (horizontal_padding, vertical_padding)
     max_coords = (horizontal_padding, vertical_padding)
-    area = region_width * region_height
     x_start = horizontal_padding
     y_start = vertical_padding
     x_end = w - region_width - horizontal_padding + 1
@@ -89,22 +106,20 @@ def find_least_busy_region(image_path, region_width=300, region_height=200, scre
         x_end = x_start
     if y_end < y_start:
         y_end = y_start
-    for y in range(y_start, y_end + 1, stride):
-        for x in range(x_start, x_end + 1, stride):
-            x1, y1 = x, y
-            x2, y2 = x + region_width - 1, y + region_height - 1
-            if x2 >= w or y2 >= h:
-                continue  # Skip out-of-bounds window
-            s = region_sum(integral, x1, y1, x2, y2)
-            s2 = region_sum(integral_sq, x1, y1, x2, y2)
-            mean = s / area
-            var = (s2 / area) - (mean ** 2)
-            if (min_var is None) or (var < min_var):
-                min_var = var
-                min_coords = (x, y)
-            if (max_var is None) or (var > max_var):
-                max_var = var
-                max_coords = (x, y)
+    # Windows running past the image edge are skipped
+    xs = range(x_start, min(x_end, w - region_width) + 1, stride)
+    ys = range(y_start, min(y_end, h - region_height) + 1, stride)
+    # argmin/argmax return the first extreme in row-major order, and only a strictly
+    # better band replaces the best so far, so ties resolve like the old scan did
+    for first, variances in window_variances(integral, integral_sq, xs, ys, region_width, region_height):
+        row, col = np.unravel_index(np.argmin(variances), variances.shape)
+        if (min_var is None) or (variances[row, col] < min_var):
+            min_var = variances[row, col]
+            min_coords = (xs[col], ys[first + row])
+        row, col = np.unravel_index(np.argmax(variances), variances.shape)
+        if (max_var is None) or (variances[row, col] > max_var):
+            max_var = variances[row, col]
+            max_coords = (xs[col], ys[first + row])
     if busiest:
         return max_coords, max_var
     else:
@@ -136,6 +151,9 @@ def find_largest_region(image_path, screen_width=None, screen_height=None, verbo
         if verbose:
             print(f"Using original image size: {orig_w}x{orig_h}")
     arr = img.astype(np.float64)
+    return largest_window(arr, stride, threshold, aspect_ratio, horizontal_padding, vertical_padding)
+
+def largest_window(arr, stride=2, threshold=100.0, aspect_ratio=1.0, horizontal_padding=50, vertical_padding=50):
     h, w = arr.shape
     stride = max(1, int(stride) if stride else 1)
     threshold = max(0.0, float(threshold))
@@ -144,17 +162,8 @@ def find_largest_region(image_path, screen_width=None, screen_height=None, verbo
         horizontal_padding = max(0, min(horizontal_padding, (w - 1) // 2))
         vertical_padding = max(0, min(vertical_padding, (h - 1) // 2))
     # Use OpenCV's integral for fast computation
-    integral = cv2.integral(arr, sdepth=cv2.CV_64F)[1:,1:]
-    integral_sq = cv2.integral(arr**2, sdepth=cv2.CV_64F)[1:,1:]
-    def region_sum(ii, x1, y1, x2, y2):
-        total = ii[y2, x2]
-        if x1 > 0:
-            total -= ii[y2, x1-1]
-        if y1 > 0:
-            total -= ii[y1-1, x2]
-        if x1 > 0 and y1 > 0:
-            total += ii[y1-1, x1-1]
-        return total
+    integral = cv2.integral(arr, sdepth=cv2.CV_64F)
+    integral_sq = cv2.integral(arr**2, sdepth=cv2.CV_64F)
     min_size = 10
     # Determine maximum feasible size respecting padding
     effective_w = w - 2 * horizontal_padding
@@ -188,22 +197,15 @@ def find_largest_region(image_path, screen_width=None, screen_height=None, verbo
         y_start = vertical_padding
         x_end = w - region_w - horizontal_padding
         y_end = h - region_h - vertical_padding
-        for y in range(y_start, y_end + 1, stride):
-            for x in range(x_start, x_end + 1, stride):
-                x1, y1 = x, y
-                x2, y2 = x + region_w - 1, y + region_h - 1
-                if x2 >= w or y2 >= h:
-                    continue
-                s = region_sum(integral, x1, y1, x2, y2)
-                s2 = region_sum(integral_sq, x1, y1, x2, y2)
-                area = region_w * region_h
-                mean = s / area
-                var = (s2 / area) - (mean ** 2)
-                if var <= threshold:
-                    found = True
-                    best = (x, y, region_w, region_h, var)
-                    break
-            if found:
+        xs = range(x_start, min(x_end, w - region_w) + 1, stride)
+        ys = range(y_start, min(y_end, h - region_h) + 1, stride)
+        # First window under the threshold in row-major order, as the old scan found it;
+        # later bands are never computed once one has a match
+        for first, variances in window_variances(integral, integral_sq, xs, ys, region_w, region_h):
+            row, col = np.unravel_index(np.argmax(variances <= threshold), variances.shape)
+            if variances[row, col] <= threshold:
+                found = True
+                best = (xs[col], ys[first + row], region_w, region_h, variances[row, col])
                 break
         if found:
             min_size = mid + 1
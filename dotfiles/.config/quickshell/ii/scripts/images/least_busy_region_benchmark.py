@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for least_busy_region.py, old per-window Python loops against the
+NumPy versions, on the same grayscale arrays. Every run also checks that both
+return the same coordinates and variance.
+
+  least-busy  find_least_busy_region's search (least busy and busiest window)
+              at 1080p/1440p/4K and strides 1/2/10
+  largest     find_largest_region's binary search over region sizes, across
+              variance thresholds
+
+    python least_busy_region_benchmark.py least-busy
+    python least_busy_region_benchmark.py least-busy --sizes 1920x1080 --strides 10 --image wall.png
+    python least_busy_region_benchmark.py largest --thresholds 100 1000 5000
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ["OPENCV_LOG_LEVEL"] = "SILENT"
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import least_busy_region  # noqa: E402
+
+SIZES = ["1920x1080", "2560x1440", "3840x2160"]
+STRIDES = [1, 2, 10]
+
+
+def legacy_least_busy_window(arr, region_width=300, region_height=200, stride=2, horizontal_padding=50, vertical_padding=50, busiest=False, verbose=False):
+    # The search as it was: four region_sum lookups per window in a Python double loop.
+    h, w = arr.shape
+    stride = max(1, int(stride) if stride else 1)
+    if horizontal_padding * 2 >= w or vertical_padding * 2 >= h:
+        horizontal_padding = max(0, min(horizontal_padding, (w - 1) // 2))
+        vertical_padding = max(0, min(vertical_padding, (h - 1) // 2))
+    max_region_w = w - 2 * horizontal_padding
+    max_region_h = h - 2 * vertical_padding
+    if max_region_w <= 0 or max_region_h <= 0:
+        raise ValueError("Image too small for the specified padding.")
+    region_width = min(region_width, max_region_w)
+    region_height = min(region_height, max_region_h)
+    integral = cv2.integral(arr, sdepth=cv2.CV_64F)[1:, 1:]
+    integral_sq = cv2.integral(arr**2, sdepth=cv2.CV_64F)[1:, 1:]
+
+    def region_sum(ii, x1, y1, x2, y2):
+        total = ii[y2, x2]
+        if x1 > 0:
+            total -= ii[y2, x1-1]
+        if y1 > 0:
+            total -= ii[y1-1, x2]
+        if x1 > 0 and y1 > 0:
+            total += ii[y1-1, x1-1]
+        return total
+    min_var = None
+    max_var = None
+    min_coords = (horizontal_padding, vertical_padding)
+    max_coords = (horizontal_padding, vertical_padding)
+    area = region_width * region_height
+    x_start = horizontal_padding
+    y_start = vertical_padding
+    x_end = max(x_start, w - region_width - horizontal_padding + 1)
+    y_end = max(y_start, h - region_height - vertical_padding + 1)
+    for y in range(y_start, y_end + 1, stride):
+        for x in range(x_start, x_end + 1, stride):
+            x1, y1 = x, y
+            x2, y2 = x + region_width - 1, y + region_height - 1
+            if x2 >= w or y2 >= h:
+                continue
+            s = region_sum(integral, x1, y1, x2, y2)
+            s2 = region_sum(integral_sq, x1, y1, x2, y2)
+            mean = s / area
+            var = (s2 / area) - (mean ** 2)
+            if (min_var is None) or (var < min_var):
+                min_var = var
+                min_coords = (x, y)
+            if (max_var is None) or (var > max_var):
+                max_var = var
+                max_coords = (x, y)
+    if busiest:
+        return max_coords, max_var
+    return min_coords, min_var
+
+
+def legacy_largest_window(arr, stride=2, threshold=100.0, aspect_ratio=1.0, horizontal_padding=50, vertical_padding=50):
+    # The search as it was: every binary search probe scans windows in Python until one is under the threshold.
+    h, w = arr.shape
+    stride = max(1, int(stride) if stride else 1)
+    threshold = max(0.0, float(threshold))
+    if horizontal_padding * 2 >= w or vertical_padding * 2 >= h:
+        horizontal_padding = max(0, min(horizontal_padding, (w - 1) // 2))
+        vertical_padding = max(0, min(vertical_padding, (h - 1) // 2))
+    integral = cv2.integral(arr, sdepth=cv2.CV_64F)[1:, 1:]
+    integral_sq = cv2.integral(arr**2, sdepth=cv2.CV_64F)[1:, 1:]
+
+    def region_sum(ii, x1, y1, x2, y2):
+        total = ii[y2, x2]
+        if x1 > 0:
+            total -= ii[y2, x1-1]
+        if y1 > 0:
+            total -= ii[y1-1, x2]
+        if x1 > 0 and y1 > 0:
+            total += ii[y1-1, x1-1]
+        return total
+    min_size = 10
+    effective_w = w - 2 * horizontal_padding
+    effective_h = h - 2 * vertical_padding
+    if effective_w <= 0 or effective_h <= 0:
+        return None, (0, 0), None
+    if aspect_ratio >= 1.0:
+        max_size = min(effective_h, int(effective_w / aspect_ratio))
+    else:
+        max_size = min(int(effective_h * aspect_ratio), effective_w)
+    if max_size < min_size:
+        min_size = 1
+        max_size = max(1, max_size)
+    best = None
+    while min_size <= max_size:
+        mid = (min_size + max_size) // 2
+        if aspect_ratio >= 1.0:
+            region_h = mid
+            region_w = int(round(mid * aspect_ratio))
+        else:
+            region_w = mid
+            region_h = int(round(mid / aspect_ratio if aspect_ratio != 0 else mid))
+        if region_w <= 0 or region_h <= 0:
+            break
+        if region_w > effective_w or region_h > effective_h:
+            max_size = mid - 1
+            continue
+        found = False
+        x_end = w - region_w - horizontal_padding
+        y_end = h - region_h - vertical_padding
+        for y in range(vertical_padding, y_end + 1, stride):
+            for x in range(horizontal_padding, x_end + 1, stride):
+                x2, y2 = x + region_w - 1, y + region_h - 1
+                if x2 >= w or y2 >= h:
+                    continue
+                s = region_sum(integral, x, y, x2, y2)
+                s2 = region_sum(integral_sq, x, y, x2, y2)
+                area = region_w * region_h
+                mean = s / area
+                var = (s2 / area) - (mean ** 2)
+                if var <= threshold:
+                    found = True
+                    best = (x, y, region_w, region_h, var)
+                    break
+            if found:
+                break
+        if found:
+            min_size = mid + 1
+        else:
+            max_size = mid - 1
+    if best:
+        x, y, region_w, region_h, var = best
+        return (x + region_w // 2, y + region_h // 2), (region_w, region_h), var
+    return None, (0, 0), None
+
+
+def synthetic_wallpaper(width, height):
+    # Gradient sky, flat bands (exact variance ties) and a few noisy, busy patches.
+    rng = np.random.default_rng(0)
+    img = np.tile(np.linspace(40, 200, width), (height, 1))
+    img[height // 2:height // 2 + height // 8] = 128
+    img[:, :width // 6] = 60
+    patch = max(1, min(200, width // 4, height // 4))
+    for _ in range(12):
+        x, y = int(rng.integers(0, width - patch + 1)), int(rng.integers(0, height - patch + 1))
+        img[y:y + patch, x:x + patch] += rng.normal(0, 40, (patch, patch))
+    return np.clip(img, 0, 255).astype(np.uint8)
+
+
+def load_array(image, width, height):
+    if image is None:
+        return synthetic_wallpaper(width, height).astype(np.float64)
+    img = cv2.imread(image, cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        raise FileNotFoundError(f"Image not found: {image}")
+    img = cv2.resize(img, (width, height), interpolation=cv2.INTER_LANCZOS4)
+    return img.astype(np.float64)
+
+
+def window_count(width, height, region_width, region_height, padding, stride):
+    # Same clamping as least_busy_window, then the windows that fit inside the image.
+    horizontal_padding = vertical_padding = padding
+    if padding * 2 >= width or padding * 2 >= height:
+        horizontal_padding = max(0, min(padding, (width - 1) // 2))
+        vertical_padding = max(0, min(padding, (height - 1) // 2))
+    region_width = min(region_width, width - 2 * horizontal_padding)
+    region_height = min(region_height, height - 2 * vertical_padding)
+    xs = range(horizontal_padding, max(horizontal_padding, width - region_width - horizontal_padding + 1) + 1, stride)
+    ys = range(vertical_padding, max(vertical_padding, height - region_height - vertical_padding + 1) + 1, stride)
+    return sum(x + region_width <= width for x in xs) * sum(y + region_height <= height for y in ys)
+
+
+def timed(function, *args, **kwargs):
+    started = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def bench_least_busy(args):
+    print(f"region {args.width}x{args.height}, padding {args.padding}; times cover the least busy and busiest search,")
+    print("each including the two cv2.integral calls both versions make (listed separately)")
+    print(f"  {'screen':<10} {'stride':>6} {'windows':>9} {'integral s':>10} {'loop s':>9} {'numpy s':>9} {'speedup':>8}  result")
+    mismatches = 0
+    for size in args.sizes:
+        width, height = (int(value) for value in size.split("x"))
+        arr = load_array(args.image, width, height)
+        _, integral_time = timed(lambda: (cv2.integral(arr, sdepth=cv2.CV_64F), cv2.integral(arr**2, sdepth=cv2.CV_64F)))
+        for stride in args.strides:
+            options = dict(region_width=args.width, region_height=args.height, stride=stride,
+                           horizontal_padding=args.padding, vertical_padding=args.padding)
+            windows = window_count(width, height, args.width, args.height, args.padding, stride)
+            legacy_time = new_time = 0.0
+            same = True
+            for busiest in (False, True):
+                legacy, elapsed = timed(legacy_least_busy_window, arr, busiest=busiest, **options)
+                legacy_time += elapsed
+                new, elapsed = timed(least_busy_region.least_busy_window, arr, busiest=busiest, **options)
+                new_time += elapsed
+                same = same and legacy == new
+            mismatches += not same
+            print(f"  {size:<10} {stride:>6} {windows:>9} {integral_time * 2:10.3f} {legacy_time:9.2f} {new_time:9.3f} "
+                  f"{legacy_time / new_time:7.0f}x  {'identical' if same else 'DIFFERENT'}")
+    return 1 if mismatches else 0
+
+
+def bench_largest(args):
+    print(f"aspect ratio {args.aspect_ratio}, padding {args.padding}, stride {args.stride}; "
+          "times include the two cv2.integral calls both versions make (listed separately)")
+    print(f"  {'screen':<10} {'threshold':>9} {'integral s':>10} {'loop s':>9} {'numpy s':>9} {'speedup':>8}  result")
+    mismatches = 0
+    for size in args.sizes:
+        width, height = (int(value) for value in size.split("x"))
+        arr = load_array(args.image, width, height)
+        _, integral_time = timed(lambda: (cv2.integral(arr, sdepth=cv2.CV_64F), cv2.integral(arr**2, sdepth=cv2.CV_64F)))
+        for threshold in args.thresholds:
+            options = dict(stride=args.stride, threshold=threshold, aspect_ratio=args.aspect_ratio,
+                           horizontal_padding=args.padding, vertical_padding=args.padding)
+            legacy, legacy_time = timed(legacy_largest_window, arr, **options)
+            new, new_time = timed(least_busy_region.largest_window, arr, **options)
+            same = legacy == new
+            mismatches += not same
+            found = f"{new[1][0]}x{new[1][1]} at {new[0]}" if new[0] else "none"
+            print(f"  {size:<10} {threshold:>9g} {integral_time:10.3f} {legacy_time:9.2f} {new_time:9.3f} "
+                  f"{legacy_time / new_time:7.0f}x  {'identical' if same else 'DIFFERENT'} ({found})")
+    return 1 if mismatches else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    least_busy = subparsers.add_parser("least-busy", help="Least busy / busiest window search")
+    least_busy.add_argument("--image", help="Wallpaper to scale to each size (default: a synthetic one)")
+    least_busy.add_argument("--sizes", nargs="+", default=SIZES)
+    least_busy.add_argument("--strides", nargs="+", type=int, default=STRIDES)
+    least_busy.add_argument("--width", type=int, default=300, help="Region width")
+    least_busy.add_argument("--height", type=int, default=200, help="Region height")
+    least_busy.add_argument("--padding", type=int, default=50, help="Horizontal and vertical padding")
+    least_busy.set_defaults(handler=bench_least_busy)
+
+    largest = subparsers.add_parser("largest", help="Largest region under a variance threshold")
+    largest.add_argument("--image", help="Wallpaper to scale to each size (default: a synthetic one)")
+    largest.add_argument("--sizes", nargs="+", default=SIZES)
+    largest.add_argument("--thresholds", nargs="+", type=float, default=[10.0, 100.0, 1000.0, 5000.0])
+    largest.add_argument("--stride", type=int, default=10, help="Stride, as least_busy_region.py's default")
+    largest.add_argument("--aspect-ratio", type=float, default=1.78)
+    largest.add_argument("--padding", type=int, default=50, help="Horizontal and vertical padding")
+    largest.set_defaults(handler=bench_largest)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,7 +24,7 @@ export VOSK_MODEL_URLS_STR="$(printf '%s\n' "${VOSK_MODEL_URLS[@]}")"
 
 python3 -m venv "${VENV_DIR}"
 "${VENV_DIR}/bin/pip" install --upgrade pip setuptools wheel
-"${VENV_DIR}/bin/pip" install faster-whisper vosk "${GPU_RUNTIME_PACKAGES[@]}"
+"${VENV_DIR}/bin/pip" install faster-whisper vosk webrtcvad-wheels "${GPU_RUNTIME_PACKAGES[@]}"
 "${VENV_DIR}/bin/python" - <<'PY'
 from faster_whisper.utils import download_model
 from pathlib import Path
@@ -2,18 +2,33 @@
 from __future__ import annotations
 
 import argparse
+import collections
+import contextlib
+import ctypes
+import ctypes.util
+import gc
+import inspect
 import json
 import os
+import queue
 import shutil
 import signal
+import socket
+import stat
 import subprocess
 import sys
 import threading
 import time
+import unicodedata
+import wave
 from pathlib import Path
 
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "translation"))
+from translation_cache import TranslationCache  # noqa: E402
+from translator_backends import BACKEND_NAMES, TranslatorBackend, create_backend  # noqa: E402
+
 RUNNING = True
 SAMPLE_RATE = 16000
 MAX_BUFFER_SECS = 8.0
@@ -21,11 +36,22 @@ REVISABLE_COMMITTED_WORDS = 5
 TAIL_GUESS_CONFIRMATIONS = 3
 SMALL_REVISION_CONFIRMATIONS = 2
 MAX_SMALL_REVISION_WORDS = 3
-HALLUCINATION_PHRASES = [
-    "copyright wdr 2021",
-    "copyright wdr mediagroup digital gmbh",
-]
+# Known Whisper hallucinations per language; "*" applies to every language.
+HALLUCINATIONS_FILE = Path(__file__).resolve().with_name("hallucinations.json")
 VOSK_SUPPORTED_LANGUAGES = {"en", "de", "it"}
+SENTENCE_ENDINGS = (".", "!", "?", "…", "。", "！", "？")
+MAX_SEGMENT_WORDS = 24
+MAX_TRANSLATED_SEGMENTS = 8
+TRANSLATION_DEBOUNCE_SECS = 0.3
+TRANSLATION_MAX_WAIT_SECS = 1.2
+TRANSLATION_MEMO_ENTRIES = 512
+TRANSLATION_BATCH_SIZE = 8
+TRANSLATION_RETRY_SECS = 2.0
+TRANSLATION_MAX_RETRY_SECS = 60.0
+LIVE_WINDOW_WORDS = 96
+# Speaker labels for --source both, in display order.
+SOURCE_LABELS = {"mic": "You", "system": "Remote"}
+VOSK_LIVE_SEGMENTS = 4
 
 
 def handle_signal(signum, frame):
@@ -37,25 +63,73 @@ for _sig in (signal.SIGINT, signal.SIGTERM):
     signal.signal(_sig, handle_signal)
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser()
-    parser.add_argument("--state-file", required=True)
+    parser.add_argument("--state-file", default="")
     parser.add_argument("--backend", choices=["whisper", "asr"], default="whisper")
-    parser.add_argument("--source", choices=["system", "mic"], default="system")
+    parser.add_argument("--source", choices=["system", "mic", "both"], default="system",
+                        help="Audio to caption; both captions the microphone and system audio as labelled streams")
     parser.add_argument("--display-mode", choices=["captions", "translated", "bilingual"], default="bilingual")
     parser.add_argument("--language", default="auto")
     parser.add_argument("--target-language", choices=["en", "fr", "de", "es", "it", "pt", "nl", "ru", "zh", "ja", "ko", "pl", "ar", "hi", "tr", "sv", "da", "fi", "cs", "ro"], default="en")
-    parser.add_argument("--model", default="tiny")
-    parser.add_argument("--preset", choices=["realtime", "snappy", "balanced", "accurate"], default="realtime")
+    parser.add_argument("--translator", choices=BACKEND_NAMES, default="trans",
+                        help="Translation backend: trans (translate-shell), argos (offline, worker process) or loopback")
+    parser.add_argument("--model", default="tiny",
+                        help="Whisper model name or path; auto benchmarks the machine once and picks one")
+    parser.add_argument("--target-latency", type=float, default=0.35,
+                        help="--model auto: longest acceptable decode time for one fast-window pass, in seconds")
+    parser.add_argument("--retune-model", action="store_true",
+                        help="--model auto: ignore the recorded benchmark and probe again")
+    parser.add_argument("--preset", choices=["realtime", "snappy", "balanced", "accurate", "auto"], default="realtime",
+                        help="Decode cadence; auto starts from balanced and retunes from measured decode time")
     parser.add_argument("--model-cache-dir", default="")
+    parser.add_argument("--mel-cache", choices=["on", "off"], default="on",
+                        help="Reuse log-mel frames across the overlapping fast and stabilize windows")
     parser.add_argument("--step-seconds", type=float, default=0.12)
     parser.add_argument("--commit-ratio", type=float, default=0.45)
     parser.add_argument("--min-buffer-seconds", type=float, default=0.18)
     parser.add_argument("--silence-threshold", type=float, default=0.0035)
     parser.add_argument("--stabilize-seconds", type=float, default=0.34)
     parser.add_argument("--fast-window-seconds", type=float, default=2.4)
-    parser.add_argument("--history-limit", type=int, default=8)
-    return parser.parse_args()
+    parser.add_argument("--history-limit", type=int, default=8,
+                        help="Scrollback entries kept in the state file once text leaves the live window")
+    parser.add_argument("--history-max-bytes", type=int, default=8192,
+                        help="Upper bound on the total UTF-8 size of the scrollback entries")
+    parser.add_argument("--transcript-file", default="",
+                        help="Append every finished caption (and its translation) to this file")
+    parser.add_argument("--vad", choices=["off", "energy", "webrtc", "silero"], default="off",
+                        help="Voice activity detector gating the whisper decoder")
+    parser.add_argument("--vad-aggressiveness", type=int, choices=[0, 1, 2, 3], default=2)
+    parser.add_argument("--capture", choices=["auto", "pulse", "ffmpeg"], default="auto",
+                        help="Capture through libpulse-simple (pulse), an ffmpeg pipe (ffmpeg), or pulse with ffmpeg fallback")
+    parser.add_argument("--input-file", default="",
+                        help="Replay a WAV or raw 16 kHz mono s16le file, or stream raw s16le from a FIFO or '-' (stdin), "
+                             "instead of capturing from PulseAudio. With --source both, give one per source "
+                             "separated by commas, microphone first")
+    parser.add_argument("--input-speed", type=float, default=1.0,
+                        help="Replay speed for --input-file (1.0 is real time, 0 is as fast as possible)")
+    parser.add_argument("--state-stream", default="",
+                        help="Append changed state fields to this NDJSON file as they happen")
+    parser.add_argument("--state-max-rate", type=float, default=20.0,
+                        help="Maximum state updates per second (0 writes every change)")
+    parser.add_argument("--snapshot-interval", type=float, default=1.0,
+                        help="Seconds between state file snapshots while --state-stream is active")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Stay resident with models loaded and run sessions on request over --daemon-socket")
+    parser.add_argument("--daemon-command", choices=["start", "stop", "reconfigure", "status", "shutdown"], default="",
+                        help="Send a command to the caption daemon (start launches the daemon if needed)")
+    parser.add_argument("--daemon-socket", default="",
+                        help="Unix socket of the caption daemon")
+    parser.add_argument("--pid-file", default="",
+                        help="Daemon only: file holding the daemon pid while a session is running")
+    parser.add_argument("--idle-unload-seconds", type=float, default=600.0,
+                        help="Daemon only: unload models after this long without a session")
+    args = parser.parse_args(argv)
+    if (args.daemon or args.daemon_command) and not args.daemon_socket:
+        parser.error("--daemon and --daemon-command need --daemon-socket")
+    if not args.state_file and not args.daemon and args.daemon_command in ("", "start"):
+        parser.error("--state-file is required")
+    return args
 
 
 PRESET_DEFAULTS = {
@@ -94,6 +168,18 @@ PRESET_DEFAULTS = {
 }
 
 
+# Bounds for `--preset auto`, a little wider than the fixed presets span.
+ADAPTIVE_LIMITS = {
+    "step_seconds": (0.04, 0.5),
+    "stabilize_seconds": (0.3, 1.6),
+    "fast_window_seconds": (1.0, 3.0),
+}
+ADAPTIVE_TARGET_LOAD = 0.7
+ADAPTIVE_INTERVAL_SECS = 1.0
+# Passes faster than this returned early on silence and say nothing about decode cost.
+ADAPTIVE_MIN_DECODE_SECS = 0.002
+
+
 def apply_preset(args: argparse.Namespace) -> argparse.Namespace:
     preset = PRESET_DEFAULTS.get(args.preset, PRESET_DEFAULTS["balanced"])
     args.step_seconds = preset["step_seconds"]
@@ -112,6 +198,93 @@ def write_state(path: Path, payload: dict) -> None:
     temp_path.replace(path)
 
 
+class StateWriter:
+    """
+    Publishes backend state for the QML side. The state file is an atomic
+    JSON snapshot; with a stream path, every change is also appended to an
+    NDJSON log as {"seq", "changes"} carrying only the fields that changed,
+    and the snapshot drops to one write per `snapshot_interval`. Hot-loop
+    updates go through publish() and are coalesced to `max_rate` per second;
+    write() is for status changes and always goes out immediately.
+    """
+
+    MAX_STREAM_BYTES = 4 * 1024 * 1024
+
+    def __init__(self, state_path: Path, stream_path: Path | None = None, max_rate: float = 20.0,
+                 snapshot_interval: float = 1.0):
+        self.state_path = state_path
+        self.stream_path = stream_path
+        self.min_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self.snapshot_interval = snapshot_interval
+        self._seq = 0
+        self._emitted: dict = {}
+        self._pending: dict | None = None
+        self._last_emit = 0.0
+        self._last_snapshot = 0.0
+        self._snapshot_stale = False
+        self._stream = None
+        if stream_path is not None:
+            stream_path.parent.mkdir(parents=True, exist_ok=True)
+            self._stream = stream_path.open("w", encoding="utf-8")
+
+    def publish(self, state: dict) -> None:
+        self._pending = dict(state)
+        self.poll()
+
+    def poll(self) -> None:
+        now = time.monotonic()
+        if self._pending is not None and now - self._last_emit >= self.min_interval:
+            self._emit(self._pending)
+        elif self._snapshot_stale and now - self._last_snapshot >= self.snapshot_interval:
+            self._write_snapshot(now)
+
+    def write(self, state: dict) -> None:
+        self._emit(dict(state), snapshot=True)
+
+    def close(self) -> None:
+        if self._pending is not None:
+            self._emit(self._pending, snapshot=True)
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _emit(self, state: dict, snapshot: bool = False) -> None:
+        now = time.monotonic()
+        self._pending = None
+        self._last_emit = now
+
+        if self._stream is not None:
+            reset = self._seq == 0 or self._stream.tell() > self.MAX_STREAM_BYTES
+            if reset:
+                self._stream.seek(0)
+                self._stream.truncate()
+                changes = state
+            else:
+                changes = {key: value for key, value in state.items() if self._emitted.get(key) != value}
+            if changes:
+                self._seq += 1
+                event = {"seq": self._seq, "changes": changes}
+                if reset:
+                    event["reset"] = True
+                self._stream.write(json.dumps(event, ensure_ascii=False) + "\n")
+                self._stream.flush()
+            snapshot = snapshot or now - self._last_snapshot >= self.snapshot_interval
+        else:
+            snapshot = True
+
+        self._emitted = state
+        if snapshot:
+            self._write_snapshot(now)
+        else:
+            self._snapshot_stale = True
+
+    def _write_snapshot(self, now: float) -> None:
+        self._last_snapshot = now
+        self._snapshot_stale = False
+        # The sequence number lets readers skip a snapshot older than the stream.
+        write_state(self.state_path, {**self._emitted, "seq": self._seq})
+
+
 def build_base_state(args: argparse.Namespace) -> dict:
     return {
         "status": "starting",
@@ -128,6 +301,7 @@ def build_base_state(args: argparse.Namespace) -> dict:
         "speech_active": False,
         "runtime_device": "",
         "backend_ready": True,
+        "tuning": {},
     }
 
 
@@ -159,10 +333,495 @@ def start_audio_capture(device_name: str) -> subprocess.Popen:
     )
 
 
+def read_aligned(stream, buffer: memoryview) -> int:
+    """Blocking readinto that never splits a 16-bit sample; returns 0 only at end of stream."""
+    size = stream.readinto(buffer) or 0
+    while size % 2:
+        extra = stream.readinto(buffer[size:size + 1]) or 0
+        if not extra:
+            return size - 1
+        size += extra
+    return size
+
+
+class PulseAudioCapture:
+    """Captures a pulse device through ffmpeg as 16 kHz mono s16le."""
+
+    finished = False
+
+    def __init__(self, device_name: str):
+        self._proc = start_audio_capture(device_name)
+
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def read(self, size: int) -> bytes:
+        return self._proc.stdout.read(size)
+
+    def readinto(self, buffer: memoryview) -> int:
+        return read_aligned(self._proc.stdout, buffer)
+
+    def close(self) -> None:
+        self._proc.terminate()
+        try:
+            self._proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+
+
+class PulseSampleSpec(ctypes.Structure):
+    _fields_ = [("format", ctypes.c_int), ("rate", ctypes.c_uint32), ("channels", ctypes.c_uint8)]
+
+
+class PulseBufferAttr(ctypes.Structure):
+    _fields_ = [(name, ctypes.c_uint32) for name in ("maxlength", "tlength", "prebuf", "minreq", "fragsize")]
+
+
+class PulseSimpleCapture:
+    """
+    Records a pulse device (PipeWire serves the same API) through
+    libpulse-simple as 16 kHz mono s16le. The server does the resampling and
+    reads block until a fragment is ready, so there is no helper process and
+    no polling.
+    """
+
+    PA_SAMPLE_S16LE = 3
+    PA_STREAM_RECORD = 2
+    FRAGMENT_SECONDS = 0.02
+
+    finished = False
+
+    def __init__(self, device_name: str):
+        library_name = ctypes.util.find_library("pulse-simple") or "libpulse-simple.so.0"
+        self._lib = ctypes.CDLL(library_name)
+        self._lib.pa_simple_new.restype = ctypes.c_void_p
+        self._lib.pa_simple_new.argtypes = [
+            ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p,
+            ctypes.POINTER(PulseSampleSpec), ctypes.c_void_p, ctypes.POINTER(PulseBufferAttr),
+            ctypes.POINTER(ctypes.c_int),
+        ]
+        self._lib.pa_simple_read.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.POINTER(ctypes.c_int)]
+        self._lib.pa_simple_free.argtypes = [ctypes.c_void_p]
+        self._lib.pa_strerror.restype = ctypes.c_char_p
+
+        spec = PulseSampleSpec(self.PA_SAMPLE_S16LE, SAMPLE_RATE, 1)
+        unset = 0xFFFFFFFF
+        fragment_bytes = int(self.FRAGMENT_SECONDS * SAMPLE_RATE) * 2
+        attributes = PulseBufferAttr(unset, unset, unset, unset, fragment_bytes)
+        error = ctypes.c_int(0)
+        self._stream = self._lib.pa_simple_new(
+            None, b"live-captions", self.PA_STREAM_RECORD, device_name.encode("utf-8"), b"captions",
+            ctypes.byref(spec), None, ctypes.byref(attributes), ctypes.byref(error),
+        )
+        if not self._stream:
+            raise RuntimeError(f"Could not open {device_name}: {self._strerror(error)}")
+        self._error = ctypes.c_int(0)
+        self._buffer = bytearray(4096)
+
+    def _strerror(self, error: ctypes.c_int) -> str:
+        return (self._lib.pa_strerror(error.value) or b"unknown error").decode("utf-8", "replace")
+
+    def alive(self) -> bool:
+        return self._stream is not None
+
+    def readinto(self, buffer: memoryview) -> int:
+        size = len(buffer) - len(buffer) % 2
+        if self._stream is None or size == 0:
+            return 0
+        target = (ctypes.c_char * size).from_buffer(buffer)
+        # ctypes drops the GIL for the call, so decode workers keep running while this blocks.
+        if self._lib.pa_simple_read(self._stream, target, size, ctypes.byref(self._error)) < 0:
+            print(f"Pulse capture failed: {self._strerror(self._error)}", file=sys.stderr)
+            self.close()
+            return 0
+        return size
+
+    def read(self, size: int) -> bytes:
+        if len(self._buffer) < size:
+            self._buffer = bytearray(size)
+        view = memoryview(self._buffer)[:size]
+        return bytes(view[:self.readinto(view)])
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._lib.pa_simple_free(self._stream)
+            self._stream = None
+
+
+class StreamAudioSource:
+    """
+    Reads raw 16 kHz mono s16le from a FIFO or stdin with blocking reads, as
+    a headless stand-in for a capture device.
+    """
+
+    def __init__(self, path: str):
+        self._stream = sys.stdin.buffer.raw if path == "-" else open(path, "rb", buffering=0)
+        self.finished = False
+
+    def alive(self) -> bool:
+        return True
+
+    def readinto(self, buffer: memoryview) -> int:
+        size = read_aligned(self._stream, buffer)
+        self.finished = size == 0
+        return size
+
+    def read(self, size: int) -> bytes:
+        buffer = bytearray(size)
+        return bytes(memoryview(buffer)[:self.readinto(memoryview(buffer))])
+
+    def close(self) -> None:
+        if self._stream is not sys.stdin.buffer.raw:
+            self._stream.close()
+
+
+def read_pcm_file(path: str) -> bytes:
+    """Loads a WAV file (any rate/channel count) or raw s16le file as 16 kHz mono s16le."""
+    if not path.lower().endswith(".wav"):
+        return Path(path).read_bytes()
+
+    with wave.open(path, "rb") as wav:
+        channels = wav.getnchannels()
+        rate = wav.getframerate()
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM WAV files are supported.")
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+    if channels == 1 and rate == SAMPLE_RATE:
+        return samples.tobytes()
+    audio = samples.reshape(-1, channels).mean(axis=1)
+    if rate != SAMPLE_RATE:
+        positions = np.arange(0, len(audio), rate / SAMPLE_RATE)
+        audio = np.interp(positions, np.arange(len(audio)), audio)
+    return np.clip(np.round(audio), -32768, 32767).astype(np.int16).tobytes()
+
+
+class FileAudioSource:
+    """
+    Streams a recorded file like a capture device, paced to `speed` times
+    real time (0 streams as fast as the caller reads).
+    """
+
+    def __init__(self, path: str, speed: float = 1.0):
+        self._pcm = read_pcm_file(path)
+        self.speed = max(0.0, speed)
+        self.duration = len(self._pcm) / 2 / SAMPLE_RATE
+        self._offset = 0
+        self._started_at: float | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self._offset >= len(self._pcm)
+
+    def alive(self) -> bool:
+        return True
+
+    def read(self, size: int) -> bytes:
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+        chunk = self._pcm[self._offset:self._offset + size]
+        self._offset += len(chunk)
+        if self.speed > 0 and chunk:
+            due_at = self._started_at + self._offset / 2 / SAMPLE_RATE / self.speed
+            delay = due_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        return chunk
+
+    def readinto(self, buffer: memoryview) -> int:
+        chunk = self.read(len(buffer) - len(buffer) % 2)
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self) -> None:
+        pass
+
+
+def open_audio_source(args: argparse.Namespace, source_mode: str = "", input_file: str | None = None):
+    input_file = args.input_file if input_file is None else input_file
+    if input_file == "-" or (input_file and stat.S_ISFIFO(os.stat(input_file).st_mode)):
+        return StreamAudioSource(input_file)
+    if input_file:
+        return FileAudioSource(input_file, args.input_speed)
+
+    device_name = resolve_pulse_device(source_mode or args.source)
+    if args.capture in ("auto", "pulse"):
+        try:
+            return PulseSimpleCapture(device_name)
+        except (OSError, RuntimeError) as error:
+            if args.capture == "pulse":
+                raise
+            print(f"Native pulse capture unavailable ({error}), using ffmpeg.", file=sys.stderr)
+    return PulseAudioCapture(device_name)
+
+
 def pcm_to_float(pcm_bytes: bytes) -> np.ndarray:
     return np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.float32) / 32768.0
 
 
+def audio_rms(audio: np.ndarray) -> float:
+    if len(audio) == 0:
+        return 0.0
+    return float(np.sqrt(np.dot(audio, audio) / len(audio)))
+
+
+class RunningRms:
+    """RMS of the newest `window_samples` samples from a running sum of squares, O(chunk) per update."""
+
+    def __init__(self, window_samples: int):
+        self.window_samples = window_samples
+        self._squares: collections.deque[np.ndarray] = collections.deque()
+        self._count = 0
+        self._sum = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def extend(self, samples: np.ndarray) -> None:
+        squares = np.square(samples[-self.window_samples:], dtype=np.float64)
+        self._squares.append(squares)
+        self._count += len(squares)
+        self._sum += float(squares.sum())
+        excess = self._count - self.window_samples
+        while excess > 0:
+            oldest = self._squares[0]
+            if len(oldest) <= excess:
+                self._squares.popleft()
+                self._sum -= float(oldest.sum())
+                removed = len(oldest)
+            else:
+                self._squares[0] = oldest[excess:]
+                self._sum -= float(oldest[:excess].sum())
+                removed = excess
+            self._count -= removed
+            excess -= removed
+        if not self._squares:
+            self._sum = 0.0
+
+    def value(self) -> float:
+        if self._count == 0:
+            return 0.0
+        return float(np.sqrt(max(0.0, self._sum) / self._count))
+
+
+class AudioRingBuffer:
+    """
+    Rolling float32 audio store backed by one preallocated array of twice the
+    capacity. Samples are appended in place and compacted to the front only
+    when the write cursor reaches the end, so the newest audio is always a
+    contiguous slice and `view()` never copies.
+    """
+
+    PCM_SCALE = np.float32(1.0 / 32768.0)
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, int(capacity))
+        self._data = np.zeros(self.capacity * 2, dtype=np.float32)
+        self._start = 0
+        self._end = 0
+        self._written = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def start_index(self) -> int:
+        """Absolute sample index of the oldest buffered sample."""
+        return self._written - len(self)
+
+    def _reserve(self, count: int) -> np.ndarray:
+        self._written += count
+        if count >= self.capacity:
+            self._start = 0
+            self._end = self.capacity
+            return self._data[:self.capacity]
+
+        if self._end + count > len(self._data):
+            keep = min(len(self), self.capacity - count)
+            self._data[:keep] = self._data[self._end - keep:self._end]
+            self._start = 0
+            self._end = keep
+
+        target = self._data[self._end:self._end + count]
+        self._end += count
+        if len(self) > self.capacity:
+            self._start = self._end - self.capacity
+        return target
+
+    def extend(self, chunk: np.ndarray) -> None:
+        if len(chunk) == 0:
+            return
+        chunk = chunk[-self.capacity:]
+        self._reserve(len(chunk))[:] = chunk
+
+    def extend_pcm(self, pcm_bytes: bytes) -> None:
+        samples = np.frombuffer(pcm_bytes, dtype=np.int16, count=len(pcm_bytes) // 2)
+        if len(samples) == 0:
+            return
+        samples = samples[-self.capacity:]
+        np.multiply(samples, self.PCM_SCALE, out=self._reserve(len(samples)), casting="unsafe")
+
+    def view(self, last_samples: int | None = None) -> np.ndarray:
+        if last_samples is None or last_samples >= len(self):
+            return self._data[self._start:self._end]
+        if last_samples <= 0:
+            return self._data[self._end:self._end]
+        return self._data[self._end - last_samples:self._end]
+
+    def drop_front(self, count: int) -> None:
+        self._start = min(self._end, self._start + max(0, int(count)))
+
+    def drop_until(self, index: int) -> None:
+        self.drop_front(index - self.start_index)
+
+    def clear(self) -> None:
+        self._start = 0
+        self._end = 0
+
+    def window(self, last_samples: int | None = None, align: int = 1) -> tuple[np.ndarray, int]:
+        """
+        A copy of the newest audio and its absolute start index, with the
+        start moved forward (by less than `align` samples) onto a multiple
+        of `align`.
+        """
+        audio = self.view(last_samples)
+        start_index = self._written - len(audio)
+        skip = -start_index % align
+        return audio[skip:].copy(), start_index + skip
+
+
+class MelFrameCache:
+    """
+    Log-mel frames of one audio stream, keyed by absolute frame index (the
+    frame's centre sample / hop), in a ring big enough for the audio buffer.
+    Values are stored before Whisper's per-window clamp and scaling, which
+    depend on the whole window and are reapplied on every call.
+    """
+
+    def __init__(self, n_mels: int, capacity_frames: int):
+        self._values = np.zeros((n_mels, capacity_frames), dtype=np.float32)
+        self._ids = np.full(capacity_frames, -1, dtype=np.int64)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, ids: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Copies cached frames into `out` columns and returns the mask of ids that were found."""
+        slots = ids % len(self._ids)
+        with self._lock:
+            found = self._ids[slots] == ids
+            out[:, found] = self._values[:, slots[found]]
+        hits = int(np.count_nonzero(found))
+        self.hits += hits
+        self.misses += len(ids) - hits
+        return found
+
+    def store(self, ids: np.ndarray, values: np.ndarray) -> None:
+        slots = ids % len(self._ids)
+        with self._lock:
+            self._values[:, slots] = values
+            self._ids[slots] = ids
+
+
+class IncrementalMelExtractor:
+    """
+    Wraps faster-whisper's FeatureExtractor so passes over overlapping
+    windows of the same stream only run the STFT and mel projection for
+    frames not seen before. Inside `stream_window()` the caller says where
+    the window starts in the stream; frames that lie wholly inside the window
+    come from the stream's MelFrameCache, and only the few edge frames that
+    see Whisper's reflection and end padding are computed per call. Outside
+    a stream window, calls go straight to the wrapped extractor.
+    """
+
+    def __init__(self, extractor):
+        self._extractor = extractor
+        self._context = threading.local()
+        self.n_fft = extractor.n_fft
+        self.hop_length = extractor.hop_length
+        self._mel_filters = np.asarray(extractor.mel_filters, dtype=np.float32)
+        self._fft_window = np.hanning(self.n_fft + 1)[:-1].astype(np.float32)
+
+    @staticmethod
+    def supports(extractor) -> bool:
+        # Older releases pad every call with 30 s of zeros (padding=True); only the hop-padded API is handled.
+        try:
+            padding = inspect.signature(extractor.__call__).parameters["padding"].default
+        except (KeyError, TypeError, ValueError):
+            return False
+        return padding == getattr(extractor, "hop_length", None) and hasattr(extractor, "mel_filters")
+
+    def __getattr__(self, name: str):
+        return getattr(self.__dict__["_extractor"], name)
+
+    def new_cache(self, max_samples: int) -> MelFrameCache:
+        return MelFrameCache(self._mel_filters.shape[0], max_samples // self.hop_length + 8)
+
+    @contextlib.contextmanager
+    def stream_window(self, cache: MelFrameCache, start_index: int):
+        self._context.cache = cache
+        self._context.start_index = start_index
+        try:
+            yield
+        finally:
+            self._context.cache = None
+
+    def __call__(self, waveform: np.ndarray, padding: int = 160, chunk_length: int | None = None, **kwargs):
+        cache = getattr(self._context, "cache", None)
+        hop = self.hop_length
+        half = self.n_fft // 2
+        if cache is None or kwargs or padding != hop or len(waveform) < 2 * self.n_fft:
+            return self._extractor(waveform, padding=padding, chunk_length=chunk_length, **kwargs)
+        if chunk_length is not None:
+            self._extractor.n_samples = chunk_length * self._extractor.sampling_rate
+            self._extractor.nb_max_frames = self._extractor.n_samples // hop
+
+        waveform = np.asarray(waveform, dtype=np.float32)
+        count = len(waveform) // hop + 1
+        log_mel = np.empty((self._mel_filters.shape[0], count), dtype=np.float32)
+
+        # Frame i is centred on sample i * hop and reads [i * hop - half, i * hop + half).
+        first_inner = -(-half // hop)
+        last_inner = (len(waveform) - half) // hop
+        inner = np.arange(first_inner, last_inner + 1)
+        ids = self._context.start_index // hop + inner
+        found = cache.lookup(ids, log_mel[:, first_inner:last_inner + 1])
+        missing = inner[~found]
+        if len(missing):
+            low, high = int(missing[0]), int(missing[-1])
+            frames = np.lib.stride_tricks.sliding_window_view(
+                waveform[low * hop - half:high * hop + half], self.n_fft,
+            )[::hop]
+            values = self._log_mel(frames)
+            log_mel[:, low:high + 1] = values
+            cache.store(ids[low - first_inner:high - first_inner + 1], values)
+
+        # Edge frames see the reflection and the end padding exactly as the wrapped extractor does.
+        padded = np.pad(np.pad(waveform, (0, padding)), half, mode="reflect")
+        edges = [*range(0, first_inner), *range(last_inner + 1, count)]
+        if edges:
+            log_mel[:, edges] = self._log_mel(np.stack([padded[i * hop:i * hop + self.n_fft] for i in edges]))
+
+        log_mel = np.maximum(log_mel, log_mel.max() - 8.0)
+        return (log_mel + 4.0) / 4.0
+
+    def _log_mel(self, frames: np.ndarray) -> np.ndarray:
+        spectrum = np.fft.rfft(frames * self._fft_window, axis=1)
+        power = (spectrum.real ** 2 + spectrum.imag ** 2).astype(np.float32)
+        return np.log10(np.maximum(self._mel_filters @ power.T, 1e-10))
+
+
+def install_mel_cache(model) -> bool:
+    """Wraps the model's feature extractor once; the wrapper is inert unless a transcriber opts in."""
+    extractor = getattr(model, "feature_extractor", None)
+    if isinstance(extractor, IncrementalMelExtractor):
+        return True
+    if extractor is None or not IncrementalMelExtractor.supports(extractor):
+        return False
+    model.feature_extractor = IncrementalMelExtractor(extractor)
+    return True
+
+
 def normalize_text(text: str) -> str:
     return " ".join((text or "").split()).strip()
 
@@ -172,85 +831,254 @@ def normalized_words(text: str) -> list[str]:
     return normalized.split() if normalized else []
 
 
+# ASCII punctuation (plus the backtick) handled by str.strip; other Unicode
+# punctuation, such as "。" or "「", is only looked up when a word ends in it.
+ASCII_PUNCTUATION = "".join(ch for ch in map(chr, range(128)) if unicodedata.category(ch).startswith("P")) + "`"
+
+# Scripts written without spaces between words: Thai, Lao, Myanmar, Khmer,
+# kana and CJK ideographs. Hallucination rules match these per character.
+UNSPACED_SCRIPT_RANGES = (
+    (0x0E00, 0x0EFF), (0x1000, 0x109F), (0x1780, 0x17FF), (0x3040, 0x30FF),
+    (0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF), (0xFF66, 0xFF9F), (0x20000, 0x3FFFF),
+)
+
+
+def is_punctuation(ch: str) -> bool:
+    return ch == "`" or unicodedata.category(ch).startswith("P")
+
+
+def is_unspaced_script(ch: str) -> bool:
+    code = ord(ch)
+    return any(low <= code <= high for low, high in UNSPACED_SCRIPT_RANGES)
+
+
 def comparable_word(word: str) -> str:
-    return word.lower().strip(".,!?;:()[]{}\"'`")
+    key = word.lower().strip(ASCII_PUNCTUATION)
+    if key and not (key[0].isascii() and key[-1].isascii()):
+        start, end = 0, len(key)
+        while start < end and is_punctuation(key[start]):
+            start += 1
+        while end > start and is_punctuation(key[end - 1]):
+            end -= 1
+        key = key[start:end]
+    return key
+
+
+def match_keys(keys: list[str]) -> list[str]:
+    """
+    Word keys as hallucination-rule keys: text in unspaced scripts becomes one
+    key per character (punctuation dropped), so a phrase is found inside
+    running CJK text; other runs stay whole words.
+    """
+    matched: list[str] = []
+    for key in keys:
+        if key.isascii() or not any(is_unspaced_script(ch) for ch in key):
+            if key:
+                matched.append(key)
+            continue
+        run = ""
+        for ch in key:
+            if is_unspaced_script(ch) or is_punctuation(ch):
+                if run:
+                    matched.append(run)
+                    run = ""
+                if not is_punctuation(ch):
+                    matched.append(ch)
+            else:
+                run += ch
+        if run:
+            matched.append(run)
+    return matched
 
 
-def collapse_repeated_words(text: str, max_run: int = 2) -> str:
-    words = normalized_words(text)
-    if not words:
-        return ""
+class PhraseAutomaton:
+    """
+    Aho-Corasick automaton over word keys. One pass over a text finds
+    whether any of the phrases occurs in it, however many phrases there are.
+    """
 
-    collapsed: list[str] = []
-    previous_key = ""
-    run_length = 0
+    def __init__(self, phrases: list[tuple[str, ...]]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail = [0]
+        self._match = [False]
+        self.longest = 0
+        for phrase in phrases:
+            if not phrase:
+                continue
+            self.longest = max(self.longest, len(phrase))
+            state = 0
+            for key in phrase:
+                if key not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._match.append(False)
+                    self._goto[state][key] = len(self._goto) - 1
+                state = self._goto[state][key]
+            self._match[state] = True
+
+        pending = collections.deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for key, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and key not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(key, 0)
+                self._match[child] = self._match[child] or self._match[self._fail[child]]
+                pending.append(child)
+
+    def search(self, keys: list[str]) -> bool:
+        goto, fail, match = self._goto, self._fail, self._match
+        state = 0
+        for key in keys:
+            while state and key not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(key, 0)
+            if match[state]:
+                return True
+        return False
+
+
+def load_hallucination_rules(path: Path = HALLUCINATIONS_FILE) -> dict[str, dict[str, list[str]]]:
+    try:
+        with open(path, encoding="utf-8") as handle:
+            rules = json.load(handle)
+    except (OSError, ValueError) as error:
+        print(f"Could not load hallucination rules from {path}: {error}", file=sys.stderr)
+        return {}
+    return rules if isinstance(rules, dict) else {}
 
-    for word in words:
-        key = comparable_word(word)
-        if key and key == previous_key:
-            run_length += 1
-        else:
-            previous_key = key
-            run_length = 1
 
-        if run_length <= max_run:
-            collapsed.append(word)
+def phrase_keys(phrase: str) -> tuple[str, ...]:
+    return tuple(match_keys([comparable_word(word) for word in normalized_words(phrase)]))
 
-    if not collapsed:
-        return ""
 
-    keys = [comparable_word(word) for word in collapsed if comparable_word(word)]
-    if len(keys) >= 6:
-        unique_ratio = len(set(keys)) / len(keys)
-        if unique_ratio <= 0.34:
-            deduped: list[str] = []
+class CaptionFilter:
+    """
+    Repeat collapsing and hallucination rules for one caption language.
+    Word keys are computed once per call, doubled phrases are found with
+    rolling hashes and known hallucinations with one automaton pass, so the
+    cost is linear in the text and does not grow with the rule lists.
+
+    `contains` phrases reject any text they occur in; `exact` phrases only
+    reject a text that consists of nothing else (short sign-offs that are
+    also said for real inside longer speech). Rules match on match_keys, so
+    CJK phrases are found by character inside unspaced text.
+    """
+
+    HASH_MODULUS = (1 << 61) - 1
+    HASH_BASE = 1_000_003
+
+    def __init__(self, contains: list[str], exact: list[str]):
+        self.contains = PhraseAutomaton([phrase_keys(phrase) for phrase in contains])
+        self.exact = {phrase_keys(phrase) for phrase in exact} - {()}
+
+    def clean(self, text: str) -> str:
+        words = normalized_words(text)
+        keys = [comparable_word(word) for word in words]
+        words, keys = self.collapse_words(words, keys, max_run=2)
+        words, keys = self.collapse_phrases(words, keys)
+        if self.hallucinated(keys):
+            return ""
+        return " ".join(words)
+
+    def hallucinated(self, keys: list[str]) -> bool:
+        """Whether these keys are, or contain, a known hallucination."""
+        present = match_keys(keys)
+        return tuple(present) in self.exact or self.contains.search(present)
+
+    def contains_hallucination(self, keys: list[str]) -> bool:
+        return self.contains.search(match_keys(keys))
+
+    @staticmethod
+    def collapse_words(words: list[str], keys: list[str], max_run: int = 2) -> tuple[list[str], list[str]]:
+        """Drops words repeated more than `max_run` times in a row; a text of mostly one few words shrinks to them."""
+        kept_words: list[str] = []
+        kept_keys: list[str] = []
+        previous_key = ""
+        run_length = 0
+        for word, key in zip(words, keys):
+            if key and key == previous_key:
+                run_length += 1
+            else:
+                previous_key = key
+                run_length = 1
+            if run_length <= max_run:
+                kept_words.append(word)
+                kept_keys.append(key)
+
+        present = [key for key in kept_keys if key]
+        if len(present) >= 6 and len(set(present)) / len(present) <= 0.34:
+            deduped_words: list[str] = []
+            deduped_keys: list[str] = []
             seen: set[str] = set()
-            for word in collapsed:
-                key = comparable_word(word)
+            for word, key in zip(kept_words, kept_keys):
                 if not key or key in seen:
                     continue
-                deduped.append(word)
+                deduped_words.append(word)
+                deduped_keys.append(key)
                 seen.add(key)
-            if deduped:
-                return " ".join(deduped[:4])
+            return deduped_words[:4], deduped_keys[:4]
+        return kept_words, kept_keys
 
-    return " ".join(collapsed)
-
-
-def collapse_repeated_phrases(text: str, max_phrase_words: int = 4) -> str:
-    words = normalized_words(text)
-    if len(words) < 4:
-        return " ".join(words)
+    def collapse_phrases(
+        self,
+        words: list[str],
+        keys: list[str],
+        max_phrase_words: int = 4,
+    ) -> tuple[list[str], list[str]]:
+        """Keeps one copy of a phrase of 2..max_phrase_words words said twice in a row (longest first)."""
+        count = len(words)
+        if count < 4:
+            return words, keys
+
+        modulus, base = self.HASH_MODULUS, self.HASH_BASE
+        prefix = [0] * (count + 1)
+        for index, key in enumerate(keys):
+            prefix[index + 1] = (prefix[index] * base + hash(key)) % modulus
+        powers = [1] * (max_phrase_words + 1)
+        for size in range(1, max_phrase_words + 1):
+            powers[size] = powers[size - 1] * base % modulus
+
+        kept_words: list[str] = []
+        kept_keys: list[str] = []
+        index = 0
+        while index < count:
+            for size in range(min(max_phrase_words, (count - index) // 2), 1, -1):
+                middle = index + size
+                first = (prefix[middle] - prefix[index] * powers[size]) % modulus
+                second = (prefix[middle + size] - prefix[middle] * powers[size]) % modulus
+                if first == second and keys[index:middle] == keys[middle:middle + size]:
+                    kept_words.extend(words[index:middle])
+                    kept_keys.extend(keys[index:middle])
+                    index += 2 * size
+                    break
+            else:
+                kept_words.append(words[index])
+                kept_keys.append(keys[index])
+                index += 1
+        return kept_words, kept_keys
 
-    collapsed: list[str] = []
-    i = 0
-    while i < len(words):
-        repeated = False
-        max_size = min(max_phrase_words, (len(words) - i) // 2)
-        for size in range(max_size, 1, -1):
-            phrase = [comparable_word(word) for word in words[i:i + size]]
-            next_phrase = [comparable_word(word) for word in words[i + size:i + (size * 2)]]
-            if phrase and phrase == next_phrase:
-                collapsed.extend(words[i:i + size])
-                i += size * 2
-                repeated = True
-                break
 
-        if repeated:
-            continue
+_CAPTION_FILTERS: dict[str, CaptionFilter] = {}
 
-        collapsed.append(words[i])
-        i += 1
 
-    return " ".join(collapsed)
+def caption_filter(language: str | None = "") -> CaptionFilter:
+    """The filter for a caption language; unknown or auto-detected languages get every language's rules."""
+    code = (language or "").split("-")[0].lower()
+    if code == "auto":
+        code = ""
+    if code not in _CAPTION_FILTERS:
+        rules = load_hallucination_rules()
+        languages = ["*", code] if code in rules else list(rules)
+        contains = [phrase for name in languages for phrase in rules.get(name, {}).get("contains", [])]
+        exact = [phrase for name in languages for phrase in rules.get(name, {}).get("exact", [])]
+        _CAPTION_FILTERS[code] = CaptionFilter(contains, exact)
+    return _CAPTION_FILTERS[code]
 
 
-def clean_transcript_text(text: str) -> str:
-    cleaned = collapse_repeated_phrases(collapse_repeated_words(text, max_run=2))
-    normalized_lower = comparable_word(cleaned)
-    if any(phrase in normalized_lower for phrase in HALLUCINATION_PHRASES):
-        return ""
-    return cleaned
+def clean_transcript_text(text: str, language: str | None = "") -> str:
+    return caption_filter(language).clean(text)
 
 
 def strip_committed_overlap(committed_text: str, partial_text: str) -> str:
@@ -296,6 +1124,18 @@ def merge_continuous_text(base_text: str, next_text: str) -> str:
     return f"{base} {nxt}"
 
 
+def split_sentences(text: str, max_words: int = MAX_SEGMENT_WORDS) -> tuple[list[str], str]:
+    """Splits text into finished sentences and the unfinished remainder."""
+    sentences: list[str] = []
+    current: list[str] = []
+    for word in normalized_words(text):
+        current.append(word)
+        if word.rstrip("\"'”’»)]").endswith(SENTENCE_ENDINGS) or len(current) >= max_words:
+            sentences.append(" ".join(current))
+            current = []
+    return sentences, " ".join(current)
+
+
 def build_display_text(committed_words: list[str], partial_text: str, revisable_words: int = REVISABLE_COMMITTED_WORDS) -> str:
     stable_text, unstable_text = split_display_text(committed_words, partial_text, revisable_words)
     return merge_continuous_text(stable_text, unstable_text)
@@ -322,22 +1162,9 @@ def split_display_text(committed_words: list[str], partial_text: str, revisable_
     return frozen_text, unstable_text
 
 
-def translate_text(text: str, target_language: str) -> str:
-    if not text:
-        return ""
-    try:
-        result = subprocess.run(
-            ["trans", "-brief", f":{target_language}", text],
-            capture_output=True, text=True, timeout=10, check=True,
-        )
-    except Exception:
-        return ""
-    return normalize_text(result.stdout or result.stderr)
-
-
-def set_status(path: Path, state: dict, status: str, message: str, *, backend_ready: bool = True) -> None:
+def set_status(state_writer: StateWriter, state: dict, status: str, message: str, *, backend_ready: bool = True) -> None:
     state.update({"status": status, "message": message, "backend_ready": backend_ready})
-    write_state(path, state)
+    state_writer.write(state)
 
 
 def is_cuda_runtime_error(error: Exception) -> bool:
@@ -350,6 +1177,102 @@ def is_cuda_runtime_error(error: Exception) -> bool:
     )
 
 
+def energy_frame_classifier(silence_threshold: float):
+    def classify(frame: bytes) -> bool:
+        return audio_rms(pcm_to_float(frame)) >= silence_threshold
+    return classify
+
+
+def webrtc_frame_classifier(aggressiveness: int):
+    import webrtcvad
+    vad = webrtcvad.Vad(aggressiveness)
+
+    def classify(frame: bytes) -> bool:
+        return vad.is_speech(frame, SAMPLE_RATE)
+    return classify
+
+
+def silero_frame_classifier(aggressiveness: int):
+    from faster_whisper.vad import get_vad_model
+    model = get_vad_model()
+    threshold = (0.35, 0.5, 0.6, 0.7)[aggressiveness]
+
+    def classify(frame: bytes) -> bool:
+        probabilities = np.asarray(model(pcm_to_float(frame)))
+        return float(probabilities.max(initial=0.0)) >= threshold
+    return classify
+
+
+class VoiceActivityGate:
+    """
+    Frame-by-frame voice activity detection on the 16 kHz capture stream.
+    Only voiced spans (plus a short pre-roll) are passed on to the
+    transcriber, and the end of each span is reported so the caller can cut
+    the audio buffer at the VAD boundary.
+    """
+
+    def __init__(
+        self,
+        classify,
+        frame_samples: int,
+        start_frames: int = 3,
+        end_seconds: float = 0.45,
+        preroll_seconds: float = 0.3,
+    ):
+        self._classify = classify
+        self.frame_bytes = frame_samples * 2
+        self.start_frames = start_frames
+        self.end_frames = max(1, int(end_seconds * SAMPLE_RATE / frame_samples))
+        self._preroll: collections.deque[bytes] = collections.deque(
+            maxlen=max(start_frames, int(preroll_seconds * SAMPLE_RATE / frame_samples))
+        )
+        self._remainder = b""
+        self._voiced_run = 0
+        self._unvoiced_run = 0
+        self.active = False
+
+    def process(self, pcm_bytes: bytes) -> tuple[bytes, bool]:
+        """Returns (audio to transcribe, whether a voiced segment just ended)."""
+        data = self._remainder + pcm_bytes
+        usable = len(data) - len(data) % self.frame_bytes
+        self._remainder = data[usable:]
+        passed: list[bytes] = []
+        segment_ended = False
+
+        for offset in range(0, usable, self.frame_bytes):
+            frame = data[offset:offset + self.frame_bytes]
+            voiced = self._classify(frame)
+
+            if not self.active:
+                self._preroll.append(frame)
+                self._voiced_run = self._voiced_run + 1 if voiced else 0
+                if self._voiced_run >= self.start_frames:
+                    self.active = True
+                    self._unvoiced_run = 0
+                    passed.extend(self._preroll)
+                    self._preroll.clear()
+                continue
+
+            passed.append(frame)
+            self._unvoiced_run = 0 if voiced else self._unvoiced_run + 1
+            if self._unvoiced_run >= self.end_frames:
+                self.active = False
+                self._voiced_run = 0
+                segment_ended = True
+
+        return b"".join(passed), segment_ended
+
+
+def build_vad_gate(mode: str, silence_threshold: float, aggressiveness: int = 2) -> VoiceActivityGate | None:
+    if mode == "webrtc":
+        return VoiceActivityGate(webrtc_frame_classifier(aggressiveness), frame_samples=480)
+    if mode == "silero":
+        return VoiceActivityGate(silero_frame_classifier(aggressiveness), frame_samples=512)
+    if mode == "energy":
+        return VoiceActivityGate(energy_frame_classifier(silence_threshold), frame_samples=480)
+    return None
+
+
 class CaptionRuntimeFallback(RuntimeError):
     pass
 
@@ -358,14 +1281,14 @@ def model_is_complete(path: Path) -> bool:
     return path.joinpath("model.bin").is_file()
 
 
-def ensure_model(model_name: str, cache_root: str, state_path: Path, state: dict) -> str:
+def ensure_model(model_name: str, cache_root: str, state_writer: StateWriter, state: dict) -> str:
     from faster_whisper.utils import download_model
     model_dir = Path(cache_root) / model_name
     if not model_is_complete(model_dir):
         shutil.rmtree(model_dir, ignore_errors=True)
     if model_is_complete(model_dir):
         return str(model_dir)
-    set_status(state_path, state, "downloading", f"Preparing the {model_name} speech model…")
+    set_status(state_writer, state, "downloading", f"Preparing the {model_name} speech model…")
     try:
         resolved_path = download_model(model_name, output_dir=str(model_dir), cache_dir=str(model_dir))
     except Exception:
@@ -457,13 +1380,23 @@ def validate_model_runtime(model, device: str) -> None:
         raise RuntimeError(f"CUDA warmup failed: {error}") from error
 
 
-def load_model(model_path: str, force_device: str | None = None):
+def default_cpu_threads() -> int:
+    return max(4, min(16, os.cpu_count() or 4))
+
+
+def load_model(model_path: str, force_device: str | None = None, compute_type: str = "", cpu_threads: int = 0):
+    """
+    Loads a WhisperModel, walking the (device, compute type) fallback ladder.
+    A tuned compute type, when given, is tried first on its device.
+    """
     from faster_whisper import WhisperModel
     if force_device == "cpu":
         preferred_device, preferred_compute_type = "cpu", "int8"
     else:
         preferred_device, preferred_compute_type = resolve_model_runtime()
-    cpu_threads = max(4, min(16, os.cpu_count() or 4))
+    if compute_type and not (force_device == "cpu" and compute_type_device(compute_type) == "cuda"):
+        preferred_device, preferred_compute_type = compute_type_device(compute_type), compute_type
+    cpu_threads = cpu_threads or default_cpu_threads()
     last_error: Exception | None = None
 
     for device, compute_type in model_runtime_candidates(preferred_device, preferred_compute_type):
@@ -473,7 +1406,9 @@ def load_model(model_path: str, force_device: str | None = None):
                 device=device,
                 compute_type=compute_type,
                 cpu_threads=cpu_threads,
-                num_workers=1,
+                # One CTranslate2 worker per DecodeWorker thread so the partial
+                # and stabilizer passes can decode at the same time.
+                num_workers=2,
                 local_files_only=True,
             )
             validate_model_runtime(model, device)
@@ -484,152 +1419,937 @@ def load_model(model_path: str, force_device: str | None = None):
     raise RuntimeError(f"Could not initialize any caption runtime: {last_error}")
 
 
-class AsyncTranslator:
+# Most to least accurate. Distilled models are English-only.
+AUTO_MODEL_CANDIDATES = ["small", "distil-small.en", "base", "tiny"]
+AUTO_MODEL_HF_REPOS = {
+    "tiny": "openai/whisper-tiny",
+    "base": "openai/whisper-base",
+    "small": "openai/whisper-small",
+    "distil-small.en": "distil-whisper/distil-small.en",
+}
+CPU_COMPUTE_TYPES = ["int8", "int8_float32", "int8_bfloat16", "float32"]
+CUDA_COMPUTE_TYPES = ["int8_float16", "float16"]
+CPU_ISA_FLAGS = ("avx2", "fma", "f16c", "avx512f", "avx512_vnni", "avx512_bf16", "avx_vnni", "asimd", "asimddp", "sve")
+MODEL_TUNING_VERSION = 1
+
+
+def compute_type_device(compute_type: str) -> str:
+    return "cuda" if compute_type in CUDA_COMPUTE_TYPES else "cpu"
+
+
+def cpu_isa_flags() -> list[str]:
+    try:
+        cpuinfo = Path("/proc/cpuinfo").read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return []
+    for line in cpuinfo.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip() in ("flags", "Features"):
+            flags = set(value.split())
+            return [flag for flag in CPU_ISA_FLAGS if flag in flags]
+    return []
+
+
+def probe_audio(seconds: float) -> np.ndarray:
+    """Syllable-rate modulated noise: gives the encoder and decoder realistic work without a sample file."""
+    rng = np.random.default_rng(0)
+    count = int(seconds * SAMPLE_RATE)
+    t = np.arange(count, dtype=np.float32) / SAMPLE_RATE
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4.0 * t) ** 2
+    carrier = sum(np.sin(2 * np.pi * f * t) for f in (180.0, 360.0, 720.0, 1440.0))
+    noise = rng.standard_normal(count).astype(np.float32) * 0.3
+    return (0.1 * envelope * (carrier + noise)).astype(np.float32)
+
+
+def quantized_model_dir(cache_root: str, model_name: str, compute_type: str) -> Path:
+    return Path(cache_root) / "quantized" / f"{model_name}-{compute_type}"
+
+
+def ensure_quantized_model(model_name: str, compute_type: str, cache_root: str, fallback_path: str) -> str:
+    """
+    Converts the original checkpoint to CTranslate2 with the weights already
+    quantized, so loads skip the per-start float to int8 conversion. Needs
+    `transformers`; without it the downloaded float16 model is used and
+    quantized at load time as before.
+    """
+    target = quantized_model_dir(cache_root, model_name, compute_type)
+    if model_is_complete(target):
+        return str(target)
+    repo = AUTO_MODEL_HF_REPOS.get(model_name)
+    if repo is None:
+        return fallback_path
+    try:
+        from ctranslate2.converters import TransformersConverter
+    except ImportError:
+        return fallback_path
+
+    shutil.rmtree(target, ignore_errors=True)
+    try:
+        TransformersConverter(repo, copy_files=["tokenizer.json", "preprocessor_config.json"]).convert(
+            str(target), quantization=compute_type,
+        )
+    except Exception as error:
+        print(f"Could not convert {model_name} to {compute_type}: {error}", file=sys.stderr)
+        shutil.rmtree(target, ignore_errors=True)
+        return fallback_path
+    return str(target) if model_is_complete(target) else fallback_path
+
+
+class ModelTuner:
+    """
+    `--model auto`: benchmarks this machine once and records the result under
+    the model cache, keyed by what the numbers depend on (CPU ISA flags,
+    core count, CTranslate2 version, CUDA, target latency, window length),
+    so later starts load the recorded choice without probing.
+
+    The probe times one fast-window decode per candidate. Thread count and
+    compute type are tuned on the smallest model, then the most accurate
+    model whose decode fits the target latency wins; if none does, the
+    fastest measured combination is used.
+    """
+
+    def __init__(self, args: argparse.Namespace, state_writer: StateWriter, state: dict):
+        self.args = args
+        self.state_writer = state_writer
+        self.state = state
+        self.cache_root = args.model_cache_dir or str(
+            Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "quickshell" / "live-captions-models"
+        )
+        self.record_path = Path(self.cache_root) / "model-tuning.json"
+        self.window_seconds = args.fast_window_seconds
+        self.audio = probe_audio(self.window_seconds)
+        self.results: list[dict] = []
+
+    def fingerprint(self) -> dict:
+        try:
+            import ctranslate2
+            ctranslate2_version = ctranslate2.__version__
+            cuda = bool(ctranslate2.get_cuda_device_count())
+        except Exception:
+            ctranslate2_version, cuda = "", False
+        return {
+            "version": MODEL_TUNING_VERSION,
+            "ctranslate2": ctranslate2_version,
+            "cpu_isa": cpu_isa_flags(),
+            "cpu_count": os.cpu_count() or 0,
+            "cuda": cuda,
+            "english_only": self.english_only(),
+            "target_latency": round(self.args.target_latency, 3),
+            "window_seconds": round(self.window_seconds, 3),
+        }
+
+    def english_only(self) -> bool:
+        return self.args.language.split("-")[0].lower() == "en"
+
+    def choose(self) -> dict:
+        fingerprint = self.fingerprint()
+        if not self.args.retune_model:
+            recorded = self.load_record()
+            if recorded and recorded.get("fingerprint") == fingerprint:
+                return recorded["choice"]
+
+        set_status(self.state_writer, self.state, "loading", "Benchmarking caption models for this machine…")
+        choice = self.probe(fingerprint["cuda"])
+        self.save_record({"fingerprint": fingerprint, "choice": choice, "results": self.results, "probed_at": time.time()})
+        return choice
+
+    def load_record(self) -> dict | None:
+        try:
+            return json.loads(self.record_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def save_record(self, record: dict) -> None:
+        try:
+            self.record_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.record_path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(record, indent=2), encoding="utf-8")
+            temp_path.replace(self.record_path)
+        except OSError as error:
+            print(f"Could not record model benchmark: {error}", file=sys.stderr)
+
+    def candidate_models(self) -> list[str]:
+        return [name for name in AUTO_MODEL_CANDIDATES if not name.endswith(".en") or self.english_only()]
+
+    def compute_types(self, device: str) -> list[str]:
+        try:
+            import ctranslate2
+            supported = ctranslate2.get_supported_compute_types(device)
+        except Exception:
+            supported = {"int8", "float32"} if device == "cpu" else set()
+        return [name for name in (CUDA_COMPUTE_TYPES if device == "cuda" else CPU_COMPUTE_TYPES) if name in supported]
+
+    def thread_counts(self) -> list[int]:
+        cores = os.cpu_count() or 4
+        return sorted({min(cores, count) for count in (2, 4, cores // 2, default_cpu_threads(), min(16, cores))} - {0})
+
+    def measure(self, model_name: str, compute_type: str, cpu_threads: int) -> dict | None:
+        """Decode timing for one combination, measured once per probe."""
+        for result in self.results:
+            if (result["model"], result["compute_type"], result["cpu_threads"]) == (model_name, compute_type, cpu_threads):
+                return result
+
+        from faster_whisper import WhisperModel
+
+        device = compute_type_device(compute_type)
+        model = None
+        try:
+            model_path = ensure_model(model_name, self.cache_root, self.state_writer, self.state)
+            model_path = ensure_quantized_model(model_name, compute_type, self.cache_root, model_path)
+            started = time.perf_counter()
+            model = WhisperModel(
+                model_path, device=device, compute_type=compute_type, cpu_threads=cpu_threads, local_files_only=True,
+            )
+            load_seconds = time.perf_counter() - started
+            decode_times = []
+            for _ in range(3):
+                started = time.perf_counter()
+                segments, _info = model.transcribe(
+                    self.audio, language=None if self.args.language == "auto" else self.args.language,
+                    beam_size=1, best_of=1, vad_filter=False, condition_on_previous_text=False,
+                    temperature=0.0, word_timestamps=False,
+                )
+                list(segments)
+                decode_times.append(time.perf_counter() - started)
+        except Exception as error:
+            print(f"Model probe {model_name}/{compute_type}/{cpu_threads} failed: {error}", file=sys.stderr)
+            return None
+        finally:
+            model = None
+            gc.collect()
+
+        # The first decode pays for lazy initialisation; keep the better of the rest.
+        result = {
+            "model": model_name,
+            "model_path": model_path,
+            "device": device,
+            "compute_type": compute_type,
+            "cpu_threads": cpu_threads,
+            "load_seconds": round(load_seconds, 3),
+            "decode_seconds": round(min(decode_times[1:]), 4),
+        }
+        self.results.append(result)
+        return result
+
+    def probe(self, cuda: bool) -> dict:
+        device = "cuda" if cuda and self.compute_types("cuda") else "cpu"
+        models = self.candidate_models()
+        smallest = models[-1]
+        best_threads = default_cpu_threads()
+        compute_types = self.compute_types(device) or ["int8"]
+
+        if device == "cpu":
+            timings = [result for threads in self.thread_counts() if (result := self.measure(smallest, compute_types[0], threads))]
+            if timings:
+                best_threads = min(timings, key=lambda result: result["decode_seconds"])["cpu_threads"]
+
+        timings = [result for compute_type in compute_types if (result := self.measure(smallest, compute_type, best_threads))]
+        if not timings:
+            raise RuntimeError("Could not run any caption model while benchmarking.")
+        best_compute_type = min(timings, key=lambda result: result["decode_seconds"])["compute_type"]
+
+        for model_name in models:
+            result = self.measure(model_name, best_compute_type, best_threads)
+            if result and result["decode_seconds"] <= self.args.target_latency:
+                return {**result, "met_target": True}
+        return {**min(self.results, key=lambda result: result["decode_seconds"]), "met_target": False}
+
+
+def load_vosk_model(model_path: str):
+    from vosk import Model, SetLogLevel
+
+    SetLogLevel(-1)
+    return Model(model_path)
+
+
+class ResidentModels:
+    """
+    Loaded speech models, keyed by model path (and, for Whisper, compute
+    type and CPU thread count). A one-shot run uses a fresh instance; the
+    daemon keeps one across sessions so changing source, language or preset
+    does not reload anything.
+    """
+
     def __init__(self):
+        self._lock = threading.Lock()
+        self._whisper: dict[tuple[str, str, int], tuple[object, str]] = {}
+        self._vosk: dict[str, object] = {}
+
+    def whisper(
+        self,
+        model_path: str,
+        force_device: str | None = None,
+        compute_type: str = "",
+        cpu_threads: int = 0,
+    ) -> tuple[object, str]:
+        with self._lock:
+            key = (model_path, compute_type, cpu_threads)
+            cached = self._whisper.get(key)
+            if cached is None or (force_device and cached[1] != force_device):
+                cached = load_model(model_path, force_device=force_device, compute_type=compute_type, cpu_threads=cpu_threads)
+                install_mel_cache(cached[0])
+                self._whisper[key] = cached
+            return cached
+
+    def vosk(self, model_path: str):
+        with self._lock:
+            if model_path not in self._vosk:
+                self._vosk[model_path] = load_vosk_model(model_path)
+            return self._vosk[model_path]
+
+    def loaded(self) -> list[str]:
+        with self._lock:
+            return [*dict.fromkeys(path for path, _compute_type, _cpu_threads in self._whisper), *self._vosk]
+
+    def unload(self) -> None:
+        with self._lock:
+            self._whisper.clear()
+            self._vosk.clear()
+        gc.collect()
+
+
+class IncrementalTranslator:
+    """
+    Translates captions one finished segment at a time. Finished segments are
+    translated once and memoized (and persisted in the shared cache); only the
+    still-changing tail is retranslated, after it has settled for a moment.
+    Everything is keyed on (text, source language, target language), and a
+    text whose translation failed is retried after a growing backoff.
+    """
+
+    def __init__(
+        self,
+        backend: TranslatorBackend,
+        debounce_seconds: float = TRANSLATION_DEBOUNCE_SECS,
+        max_wait_seconds: float = TRANSLATION_MAX_WAIT_SECS,
+    ):
+        self._backend = backend
+        self.debounce_seconds = debounce_seconds
+        self.max_wait_seconds = max_wait_seconds
         self._lock = threading.Lock()
         self._wake_event = threading.Event()
         self._stop_event = threading.Event()
-        self._pending: tuple[str, str, str] | None = None
-        self._current: tuple[str, str, str] | None = None
-        self._cache: dict[tuple[str, str], str] = {}
-        self._latest_by_target: dict[str, tuple[str, str]] = {}
+        self._cache = TranslationCache()
+        self._memo: collections.OrderedDict[tuple[str, str, str], str] = collections.OrderedDict()
+        # key -> (monotonic time of the next attempt, failures so far)
+        self._failed: dict[tuple[str, str, str], tuple[float, int]] = {}
+        self._segment_queue: collections.deque[tuple[str, str, str]] = collections.deque()
+        self._queued: set[tuple[str, str, str]] = set()
+        self._pending_tail: tuple[str, str, str] | None = None
+        self._tail_key: tuple[str, str, str] | None = None
+        self._tail_text = ""
+        self._tail_changed_at = 0.0
+        self._tail_submitted_at = 0.0
+        self._tail_translation = ""
         self._thread = threading.Thread(target=self._run, name="live-captions-translator", daemon=True)
         self._thread.start()
 
-    def request(self, text: str, target_language: str, source_language: str = "") -> str:
-        normalized_text = normalize_text(text)
-        source_code = source_language.split("-")[0].lower()
+    def update(
+        self,
+        segments: list[str],
+        tail: str,
+        target_language: str,
+        source_language: str = "",
+        joiner: str = " ",
+    ) -> tuple[str, str]:
+        """Returns (translated finished segments, translated tail) from whatever is ready."""
+        segments = [normalize_text(segment) for segment in segments[-MAX_TRANSLATED_SEGMENTS:]]
+        segments = [segment for segment in segments if segment]
+        tail = normalize_text(tail)
 
-        if not normalized_text:
-            return ""
+        source_code = source_language.split("-")[0].lower()
         if source_code and source_code == target_language:
-            return normalized_text
+            return joiner.join(segments), tail
 
-        cache_key = (normalized_text, target_language)
+        now = time.monotonic()
         with self._lock:
-            if cache_key in self._cache:
-                return self._cache[cache_key]
-
-            latest = self._latest_by_target.get(target_language)
-            pending_key = self._pending[:2] if self._pending else None
-            if pending_key != cache_key:
-                self._pending = (normalized_text, target_language, source_language)
-                self._wake_event.set()
-
-            if latest is not None:
-                latest_source, latest_translation = latest
-                if latest_translation and self._is_reusable_translation(latest_source, normalized_text):
-                    return latest_translation
-        return ""
-
-    @staticmethod
-    def _is_reusable_translation(previous_source: str, next_source: str) -> bool:
-        previous_words = normalized_words(previous_source)
-        next_words = normalized_words(next_source)
-        if not previous_words or not next_words:
-            return False
+            translated_segments = []
+            for segment in segments:
+                key = (segment, source_language, target_language)
+                translated = self._lookup(key)
+                if translated:
+                    translated_segments.append(translated)
+                elif not self._backing_off(key, now) and key not in self._queued:
+                    cached = self._cache.get(segment, target_language, source_language)
+                    if cached is not None:
+                        self._remember(key, cached)
+                        translated_segments.append(cached)
+                    else:
+                        self._queued.add(key)
+                        self._segment_queue.append(key)
+                        self._wake_event.set()
+
+            if tail != self._tail_text:
+                self._tail_text = tail
+                self._tail_changed_at = now
+                if not tail:
+                    self._tail_key = None
+                    self._tail_translation = ""
+
+            if tail:
+                key = (tail, source_language, target_language)
+                self._tail_key = key
+                translated = self._lookup(key)
+                if translated:
+                    self._tail_translation = translated
+                elif (
+                    not self._backing_off(key, now)
+                    and self._pending_tail != key
+                    and (
+                        now - self._tail_changed_at >= self.debounce_seconds
+                        or now - self._tail_submitted_at >= self.max_wait_seconds
+                    )
+                ):
+                    self._pending_tail = key
+                    self._tail_submitted_at = now
+                    self._wake_event.set()
 
-        shared_prefix = 0
-        for previous_word, next_word in zip(previous_words, next_words):
-            if comparable_word(previous_word) != comparable_word(next_word):
-                break
-            shared_prefix += 1
+            return joiner.join(translated_segments), self._tail_translation
 
-        min_words = min(len(previous_words), len(next_words))
-        return (
-            shared_prefix >= 4
-            or (min_words > 0 and shared_prefix / min_words >= 0.72)
-        )
+    def translated(self, segment: str, target_language: str, source_language: str = "") -> str:
+        """The translation of a finished segment if it is already known; never queues work."""
+        segment = normalize_text(segment)
+        source_code = source_language.split("-")[0].lower()
+        if not segment or (source_code and source_code == target_language):
+            return segment
+        with self._lock:
+            translated = self._lookup((segment, source_language, target_language))
+        return translated or self._cache.get(segment, target_language, source_language) or ""
 
-    def stop(self) -> None:
+    def stop(self, close_backend: bool = True) -> None:
+        """Stops the worker; pass close_backend=False when other translators still share the backend."""
         self._stop_event.set()
         self._wake_event.set()
         self._thread.join(timeout=1.0)
+        if close_backend:
+            self._backend.close()
+        stats = self._cache.stats()
+        print(
+            f"Translation cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} entries",
+            file=sys.stderr,
+        )
+        self._cache.close()
+
+    def _backing_off(self, key: tuple[str, str, str], now: float) -> bool:
+        failure = self._failed.get(key)
+        return failure is not None and now < failure[0]
+
+    def _record_failure(self, key: tuple[str, str, str]) -> None:
+        _retry_at, failures = self._failed.pop(key, (0.0, 0))
+        delay = min(TRANSLATION_MAX_RETRY_SECS, TRANSLATION_RETRY_SECS * 2 ** failures)
+        self._failed[key] = (time.monotonic() + delay, failures + 1)
+        while len(self._failed) > TRANSLATION_MEMO_ENTRIES:
+            del self._failed[next(iter(self._failed))]  # oldest failure first
+
+    def _lookup(self, key: tuple[str, str, str]) -> str:
+        translated = self._memo.get(key, "")
+        if translated:
+            self._memo.move_to_end(key)
+        return translated
+
+    def _remember(self, key: tuple[str, str, str], translated: str) -> None:
+        self._memo[key] = translated
+        self._memo.move_to_end(key)
+        while len(self._memo) > TRANSLATION_MEMO_ENTRIES:
+            self._memo.popitem(last=False)
 
     def _run(self) -> None:
         while not self._stop_event.is_set():
             self._wake_event.wait(timeout=0.1)
             self._wake_event.clear()
 
-            while True:
+            while not self._stop_event.is_set():
                 with self._lock:
-                    task = self._pending
-                    self._pending = None
-
-                if task is None:
+                    batch = self._take_batch()
+                if not batch:
                     break
 
-                self._current = task
-                text, target_language, _source_language = task
-                translated = translate_text(text, target_language)
-                cache_key = (text, target_language)
+                _text, source_language, target_language = batch[0][0]
+                translations = self._backend.translate_batch(
+                    [key[0] for key, _finished in batch],
+                    target_language,
+                    source_language,
+                )
+
+                for (key, finished), translated in zip(batch, translations):
+                    translated = normalize_text(translated)
+                    if finished:
+                        self._cache.put(key[0], target_language, translated, source_language)
+
+                    with self._lock:
+                        if finished:
+                            self._queued.discard(key)
+                        elif self._pending_tail == key:
+                            self._pending_tail = None
+                        if translated:
+                            self._failed.pop(key, None)
+                            self._remember(key, translated)
+                            if key == self._tail_key:
+                                self._tail_translation = translated
+                        else:
+                            self._record_failure(key)
+
+    def _take_batch(self) -> list[tuple[tuple[str, str, str], bool]]:
+        """Pops queued finished segments (oldest first) plus the pending tail, all for one language pair."""
+        batch: list[tuple[tuple[str, str, str], bool]] = []
+        languages = None
+        while self._segment_queue and len(batch) < TRANSLATION_BATCH_SIZE:
+            key = self._segment_queue[0]
+            if languages is not None and key[1:] != languages:
+                break
+            languages = key[1:]
+            batch.append((self._segment_queue.popleft(), True))
 
-                with self._lock:
-                    self._cache[cache_key] = translated
-                    if translated:
-                        self._latest_by_target[target_language] = (text, translated)
+        tail_key = self._pending_tail
+        if tail_key is not None and len(batch) < TRANSLATION_BATCH_SIZE and languages in (None, tail_key[1:]):
+            batch.append((tail_key, False))
+        return batch
 
-                if self._stop_event.is_set():
-                    break
 
+class CaptionHistory:
+    """
+    Scrollback for text that has left the live caption window, newest first
+    as the overlay expects, capped by entry count and total bytes so the
+    state file stays the same size however long the session runs. With a
+    transcript path every entry is also appended to disk, so the caps only
+    limit what the overlay sees.
+    """
 
-class VoskStreamingTranscriber:
-    RECENT_AUDIO_SAMPLES = int(0.35 * SAMPLE_RATE)
+    def __init__(self, max_items: int, max_bytes: int, transcript_path: str = ""):
+        self.max_items = max(0, max_items)
+        self.max_bytes = max(0, max_bytes)
+        self.version = 0
+        self._items: list[dict] = []
+        self._sizes: list[int] = []
+        self._total_bytes = 0
+        self._transcript = None
+        if transcript_path:
+            try:
+                path = Path(transcript_path).expanduser()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._transcript = path.open("a", encoding="utf-8", buffering=1)
+            except OSError as error:
+                print(f"Could not open transcript file {transcript_path}: {error}", file=sys.stderr)
+
+    def items(self) -> list[dict]:
+        return self._items
+
+    def add(self, text: str, translated: str = "") -> None:
+        text = normalize_text(text)
+        if not text:
+            return
+        translated = normalize_text(translated)
+        self._write_transcript(text, translated)
+        if self.max_items == 0:
+            return
 
-    def __init__(self, model_path: str, language: str, silence_threshold: float = 0.005):
-        from vosk import KaldiRecognizer, Model, SetLogLevel
+        size = len(text.encode("utf-8")) + len(translated.encode("utf-8"))
+        # A new list per change: the state writer compares fields by value and keeps the old one.
+        items = [{"text": text, "translated": translated}] + self._items
+        sizes = [size] + self._sizes
+        total = self._total_bytes + size
+        while len(items) > 1 and (len(items) > self.max_items or total > self.max_bytes):
+            items.pop()
+            total -= sizes.pop()
+        self._items, self._sizes, self._total_bytes = items, sizes, total
+        self.version += 1
+
+    def close(self, live_text: str = "", live_translated: str = "") -> None:
+        """Writes whatever is still in the live window to the transcript and closes it."""
+        if self._transcript is None:
+            return
+        live_text = normalize_text(live_text)
+        if live_text:
+            self._write_transcript(live_text, normalize_text(live_translated))
+        self._transcript.close()
+        self._transcript = None
+
+    def _write_transcript(self, text: str, translated: str) -> None:
+        if self._transcript is None:
+            return
+        try:
+            self._transcript.write(f"{text}\n")
+            if translated and translated != text:
+                self._transcript.write(f"    {translated}\n")
+        except OSError as error:
+            print(f"Could not write transcript: {error}", file=sys.stderr)
+            self._transcript.close()
+            self._transcript = None
+
+
+def add_history_entries(
+    history: CaptionHistory,
+    groups: list[list[str]],
+    translator: IncrementalTranslator,
+    target_language: str,
+    source_language: str,
+) -> None:
+    for group in groups:
+        translations = (translator.translated(segment, target_language, source_language) for segment in group)
+        history.add(" ".join(group), " ".join(translation for translation in translations if translation))
+
+
+class DecodeResults:
+    """
+    Result hand-off shared by DecodeWorker and SharedDecoder slots. A final
+    request (`submit(True)`) is sticky: newer regular requests replace it in
+    the queue but not the flag, so the next pass that runs is the final one.
+    """
 
-        SetLogLevel(-1)
-        self.language = language
-        self.silence_threshold = silence_threshold
-        self.model = Model(model_path)
-        self.recognizer = KaldiRecognizer(self.model, SAMPLE_RATE)
-        self.recognizer.SetWords(True)
-        self.committed_segments: list[str] = []
+    def __init__(self, decode):
+        self._decode = decode
+        self._lock = threading.Lock()
+        self._final_pending = False
+        self._result = None
+        self._has_result = False
+        self._error: Exception | None = None
+        self.last_latency = 0.0
+        self.last_decode_seconds = 0.0
+
+    def take_result(self) -> tuple[bool, object]:
+        """Returns (True, value) once per finished pass and re-raises decode errors."""
+        with self._lock:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            if not self._has_result:
+                return False, None
+            self._has_result = False
+            return True, self._result
+
+    def _note_final(self, args: tuple) -> None:
+        if args and args[0] is True:
+            with self._lock:
+                self._final_pending = True
+
+    def _execute(self, requested_at: float, args: tuple) -> None:
+        with self._lock:
+            if self._final_pending:
+                self._final_pending = False
+                args = (True,)
+        started_at = time.monotonic()
+        try:
+            value = self._decode(*args)
+        except Exception as error:
+            with self._lock:
+                self._error = error
+            return
+
+        finished_at = time.monotonic()
+        with self._lock:
+            self._result = value
+            self._has_result = True
+            self.last_latency = finished_at - requested_at
+            self.last_decode_seconds = finished_at - started_at
+
+
+class DecodeWorker(DecodeResults):
+    """
+    Runs one decode pass on its own thread. Requests go through a one-slot
+    queue, so a worker that is still busy only ever picks up the newest
+    request (a pending final one stays final) and the pass itself always
+    reads the newest audio.
+    """
+
+    def __init__(self, name: str, decode):
+        super().__init__(decode)
+        self._requests: queue.Queue[tuple[float, tuple]] = queue.Queue(maxsize=1)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, *args) -> None:
+        self._note_final(args)
+        try:
+            self._requests.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._requests.put_nowait((time.monotonic(), args))
+        except queue.Full:
+            pass
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.submit()
+        self._thread.join(timeout=1.0)
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                requested_at, args = self._requests.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if self._stop_event.is_set():
+                break
+            self._execute(requested_at, args)
+
+
+class SharedDecoder:
+    """
+    One decode thread for several caption streams, so they share one model
+    instead of each loading a copy and decoding over the top of each other.
+    Every registered pass gets a slot that behaves like a DecodeWorker (one
+    pending request, newest wins). When several slots are waiting, the
+    highest priority runs first and equal priorities take turns, except that
+    a waiting slot that a higher priority has overtaken since its own last
+    pass goes next, so stabilize passes cannot starve the partials.
+    """
+
+    def __init__(self, name: str):
+        self._condition = threading.Condition()
+        self._slots: list[SharedDecodeSlot] = []
+        self._turn = 0
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def slot(self, decode, priority: int = 0) -> "SharedDecodeSlot":
+        slot = SharedDecodeSlot(self, decode, priority)
+        with self._condition:
+            self._slots.append(slot)
+        return slot
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._thread.join(timeout=1.0)
+
+    def _submit(self, slot: "SharedDecodeSlot", args: tuple) -> None:
+        with self._condition:
+            slot.request = (time.monotonic(), args)
+            self._condition.notify()
+
+    def _next_request(self) -> tuple["SharedDecodeSlot", tuple[float, tuple]] | None:
+        pending = [slot for slot in self._slots if slot.request is not None]
+        if not pending:
+            return None
+        overtaken = [
+            slot for slot in pending
+            if any(other.priority > slot.priority and other.served_turn > slot.served_turn for other in self._slots)
+        ]
+        candidates = overtaken or pending
+        priority = max(slot.priority for slot in candidates)
+        slot = min((slot for slot in candidates if slot.priority == priority), key=lambda slot: slot.served_turn)
+        self._turn += 1
+        slot.served_turn = self._turn
+        request, slot.request = slot.request, None
+        return slot, request
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                item = self._next_request()
+                while item is None and not self._stopped:
+                    self._condition.wait(timeout=0.1)
+                    item = self._next_request()
+                if self._stopped:
+                    return
+            slot, (requested_at, args) = item
+            slot._execute(requested_at, args)
+
+
+class SharedDecodeSlot(DecodeResults):
+    def __init__(self, decoder: SharedDecoder, decode, priority: int):
+        super().__init__(decode)
+        self.decoder = decoder
+        self.priority = priority
+        self.request: tuple[float, tuple] | None = None
+        self.served_turn = 0
+
+    def submit(self, *args) -> None:
+        self._note_final(args)
+        self.decoder._submit(self, args)
+
+
+class AdaptivePreset:
+    """
+    `--preset auto`: retunes the decode cadence from how long passes really
+    take. A worker asked to decode more often than it can finish just runs
+    back to back and falls behind, so each interval the step moves toward
+    decode time / target load. Once the step is at its slowest, the fast
+    window shrinks to make passes cheaper; with time to spare at the fastest
+    step, the window grows again for accuracy. Changes are rate-limited so
+    one slow pass does not make the cadence jump.
+    """
+
+    def __init__(
+        self,
+        args: argparse.Namespace,
+        target_load: float = ADAPTIVE_TARGET_LOAD,
+        interval_seconds: float = ADAPTIVE_INTERVAL_SECS,
+    ):
+        self.args = args
+        self.target_load = target_load
+        self.interval_seconds = interval_seconds
+        self.partial_decode_seconds = 0.0
+        self.stabilize_decode_seconds = 0.0
+        self.decision = "measuring"
+        self._last_update = time.monotonic()
+
+    def observe(self, partial_seconds: float = 0.0, stabilize_seconds: float = 0.0) -> None:
+        # Exponential moving averages; the first sample seeds them.
+        if partial_seconds >= ADAPTIVE_MIN_DECODE_SECS:
+            previous = self.partial_decode_seconds
+            self.partial_decode_seconds = partial_seconds if previous <= 0 else previous * 0.7 + partial_seconds * 0.3
+        if stabilize_seconds >= ADAPTIVE_MIN_DECODE_SECS:
+            previous = self.stabilize_decode_seconds
+            self.stabilize_decode_seconds = stabilize_seconds if previous <= 0 else previous * 0.7 + stabilize_seconds * 0.3
+
+    def load(self) -> float:
+        return self.partial_decode_seconds / self.args.step_seconds if self.args.step_seconds > 0 else 0.0
+
+    def update(self, now: float) -> bool:
+        """Retunes args once per interval; returns True when it did, so the report can be republished."""
+        if now - self._last_update < self.interval_seconds or self.partial_decode_seconds <= 0:
+            return False
+        self._last_update = now
+
+        args = self.args
+        step_low, step_high = ADAPTIVE_LIMITS["step_seconds"]
+        load = self.load()
+
+        step = self._approach("step_seconds", args.step_seconds, self.partial_decode_seconds / self.target_load)
+        window = args.fast_window_seconds
+        if load > self.target_load * 1.15 and step >= step_high:
+            window = self._approach("fast_window_seconds", window, window * 0.85)
+        elif load < self.target_load * 0.5 and step <= step_low:
+            window = self._approach("fast_window_seconds", window, window * 1.1)
+
+        if window < args.fast_window_seconds:
+            self.decision = "shrinking window"
+        elif window > args.fast_window_seconds:
+            self.decision = "growing window"
+        elif step > args.step_seconds:
+            self.decision = "slowing cadence"
+        elif step < args.step_seconds:
+            self.decision = "speeding up cadence"
+        else:
+            self.decision = "holding"
+
+        stabilize = args.stabilize_seconds
+        if self.stabilize_decode_seconds > 0:
+            stabilize = self._approach("stabilize_seconds", stabilize, self.stabilize_decode_seconds / self.target_load)
+
+        args.step_seconds = round(step, 3)
+        args.stabilize_seconds = round(stabilize, 3)
+        args.fast_window_seconds = round(window, 3)
+        return True
+
+    def report(self) -> dict:
+        return {
+            "preset": "auto",
+            "decision": self.decision,
+            "step_ms": round(self.args.step_seconds * 1000),
+            "stabilize_ms": round(self.args.stabilize_seconds * 1000),
+            "fast_window_ms": round(self.args.fast_window_seconds * 1000),
+            "partial_decode_ms": round(self.partial_decode_seconds * 1000, 1),
+            "stabilize_decode_ms": round(self.stabilize_decode_seconds * 1000, 1),
+            "load": round(self.load(), 2),
+        }
+
+    @staticmethod
+    def _approach(name: str, current: float, desired: float) -> float:
+        low, high = ADAPTIVE_LIMITS[name]
+        desired = min(max(desired, current * 0.75), current * 1.33)
+        return min(max(desired, low), high)
+
+
+class VoskStreamingTranscriber:
+    """
+    Vosk decodes every 128 ms chunk, but its partial result usually repeats
+    for several chunks. The raw partial JSON is compared before any parsing
+    or cleaning, and `version` only moves when the captions actually change,
+    so callers can skip all per-chunk text work in between.
+    """
+
+    RECENT_AUDIO_SAMPLES = int(0.35 * SAMPLE_RATE)
+
+    def __init__(self, model, language: str, silence_threshold: float = 0.005, recognizer=None):
+        self.language = language
+        self.silence_threshold = silence_threshold
+        self.model = model
+        if recognizer is None:
+            from vosk import KaldiRecognizer
+
+            recognizer = KaldiRecognizer(self.model, SAMPLE_RATE)
+            recognizer.SetWords(True)
+        self.recognizer = recognizer
+        self.committed_segments: list[str] = []
+        self.rolled_segments: list[str] = []
         self.partial_text = ""
         self.source_language = language
         self.runtime_device = "vosk"
-        self.recent_audio = np.zeros(0, dtype=np.float32)
+        self.recent_rms = RunningRms(self.RECENT_AUDIO_SAMPLES)
+        self.rules = caption_filter(language)
+        self.version = 0
+        self._raw_partial = ""
+        self._committed_word_count = 0
+        self._texts: tuple[int, tuple[str, str, str]] = (-1, ("", "", ""))
 
-    def feed(self, pcm_bytes: bytes) -> None:
-        audio_chunk = pcm_to_float(pcm_bytes)
-        self.recent_audio = np.concatenate([self.recent_audio, audio_chunk])
-        if len(self.recent_audio) > self.RECENT_AUDIO_SAMPLES:
-            self.recent_audio = self.recent_audio[-self.RECENT_AUDIO_SAMPLES:]
+    def feed(self, pcm_bytes: bytes) -> bool:
+        """Returns whether the captions changed."""
+        self.recent_rms.extend(pcm_to_float(pcm_bytes))
 
         if self.recognizer.AcceptWaveform(pcm_bytes):
             result = json.loads(self.recognizer.Result() or "{}")
-            final_text = clean_transcript_text(result.get("text", ""))
+            final_text = self.rules.clean(result.get("text", ""))
             if final_text:
                 self._append_committed_segment(final_text)
-            self.partial_text = ""
-            return
+            self._raw_partial = ""
+            self._set_partial("")
+            self.version += 1
+            return True
 
-        result = json.loads(self.recognizer.PartialResult() or "{}")
-        partial = clean_transcript_text(result.get("partial", ""))
+        raw = self.recognizer.PartialResult() or ""
+        if raw == self._raw_partial:
+            return False
+        self._raw_partial = raw
+        result = json.loads(raw or "{}")
+        partial = self.rules.clean(result.get("partial", ""))
         if partial and self.committed_segments:
             partial = strip_committed_overlap(self.committed_segments[-1], partial)
-            partial = clean_transcript_text(partial)
+            partial = self.rules.clean(partial)
+        return self._set_partial(partial)
+
+    def finish(self) -> None:
+        result = json.loads(self.recognizer.FinalResult() or "{}")
+        final_text = self.rules.clean(result.get("text", ""))
+        if final_text:
+            self._append_committed_segment(final_text)
+        self._raw_partial = ""
+        self._set_partial("")
+        self.version += 1
+
+    def _set_partial(self, partial: str) -> bool:
+        if partial == self.partial_text:
+            return False
         self.partial_text = partial
+        self.version += 1
+        return True
 
     def speech_active(self) -> bool:
-        if len(self.recent_audio) == 0:
+        if len(self.recent_rms) == 0:
             return False
-        return float(np.sqrt(np.mean(self.recent_audio ** 2))) >= self.silence_threshold
+        return self.recent_rms.value() >= self.silence_threshold
 
     def texts(self) -> tuple[str, str, str]:
-        stable_text = "\n".join(self.committed_segments[-4:])
+        if self._texts[0] == self.version:
+            return self._texts[1]
+        stable_text = "\n".join(self.committed_segments)
         unstable_text = normalize_text(self.partial_text)
         display_text = stable_text
         if unstable_text:
             display_text = f"{stable_text}\n{unstable_text}".strip() if stable_text else unstable_text
-        return display_text, stable_text, unstable_text
+        self._texts = (self.version, (display_text, stable_text, unstable_text))
+        return self._texts[1]
 
     def committed_word_count(self) -> int:
-        return sum(len(normalized_words(segment)) for segment in self.committed_segments)
+        return self._committed_word_count
 
     def _append_committed_segment(self, text: str) -> None:
-        segment = clean_transcript_text(text)
+        segment = self.rules.clean(text)
         if not segment:
             return
 
@@ -643,19 +2363,205 @@ class VoskStreamingTranscriber:
 
             if len(previous_words) <= 2 or len(segment_words) <= 2:
                 merged = merge_continuous_text(previous, segment)
-                cleaned = clean_transcript_text(merged)
+                cleaned = self.rules.clean(merged)
                 if cleaned:
                     self.committed_segments[-1] = cleaned
+                    self._committed_word_count += len(normalized_words(cleaned)) - len(previous_words)
                     return
 
         self.committed_segments.append(segment)
-        self.committed_segments = self.committed_segments[-8:]
+        self._committed_word_count += len(normalized_words(segment))
+        # Older segments leave the live window for the caller's scrollback.
+        while len(self.committed_segments) > VOSK_LIVE_SEGMENTS:
+            rolled = self.committed_segments.pop(0)
+            self._committed_word_count -= len(normalized_words(rolled))
+            self.rolled_segments.append(rolled)
+
+    def take_rolled_segments(self) -> list[str]:
+        rolled, self.rolled_segments = self.rolled_segments, []
+        return rolled
+
+
+class CommittedTranscript:
+    """
+    Committed caption words as a token array with their comparable keys and
+    sentence boundaries kept alongside. Appends only look at the new words
+    and the few before them (repeat runs, doubled phrases, hallucinated
+    phrases), so a commit costs O(new words) however long the session is.
+    The joined text is cached per version and rebuilt only after a commit.
+    """
+
+    MAX_PHRASE_WORDS = 4
+
+    def __init__(self, rules: CaptionFilter | None = None):
+        self.rules = rules or caption_filter()
+        self.words: list[str] = []
+        self.keys: list[str] = []
+        self.version = 0
+        self._sentences: list[tuple[int, int]] = []
+        self._open_start = 0
+        self._text_cache: tuple[int, str] = (0, "")
+        self._frozen_cache: tuple[int, int, str] = (0, 0, "")
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def text(self) -> str:
+        if self._text_cache[0] != self.version:
+            self._text_cache = (self.version, " ".join(self.words))
+        return self._text_cache[1]
+
+    def tail_text(self, count: int) -> str:
+        return " ".join(self.words[-count:]) if count > 0 else ""
+
+    def clear(self) -> None:
+        self.words.clear()
+        self.keys.clear()
+        self._sentences.clear()
+        self._open_start = 0
+        self.version += 1
+
+    def append(self, new_words: list[str], whole: bool = False) -> int:
+        """
+        Appends cleaned words and returns how many were kept. `whole` marks
+        a batch that is a complete utterance, which exact-match
+        hallucination rules may reject.
+        """
+        words = normalized_words(" ".join(new_words))
+        batch, batch_keys = self.rules.collapse_words(words, [comparable_word(word) for word in words], max_run=2)
+        if not batch:
+            return 0
+
+        start_count = len(self.words)
+        for word, key in zip(batch, batch_keys):
+            if key and len(self.keys) >= 2 and self.keys[-1] == key and self.keys[-2] == key:
+                continue
+            self._push(word, key)
+            self._collapse_doubled_phrase()
+
+        # A hallucinated phrase anywhere in (or running into) this batch rejects the batch.
+        window_start = max(0, start_count - self.rules.contains.longest)
+        if self.rules.contains_hallucination(self.keys[window_start:]) or (
+            whole and self.rules.hallucinated(self.keys[start_count:])
+        ):
+            self._truncate(start_count)
+
+        if len(self.words) != start_count:
+            self.version += 1
+        return max(0, len(self.words) - start_count)
+
+    def _push(self, word: str, key: str) -> None:
+        self.words.append(word)
+        self.keys.append(key)
+        index = len(self.words)
+        if word.rstrip("\"'”’»)]").endswith(SENTENCE_ENDINGS) or index - self._open_start >= MAX_SEGMENT_WORDS:
+            self._sentences.append((self._open_start, index))
+            self._open_start = index
+
+    def _collapse_doubled_phrase(self) -> None:
+        keys = self.keys
+        for size in range(min(self.MAX_PHRASE_WORDS, len(keys) // 2), 1, -1):
+            if keys[-size:] == keys[-2 * size:-size]:
+                self._truncate(len(keys) - size)
+                return
+
+    def _truncate(self, length: int) -> None:
+        if length >= len(self.words):
+            return
+        del self.words[length:]
+        del self.keys[length:]
+        while self._sentences and self._sentences[-1][1] > length:
+            self._sentences.pop()
+        self._open_start = self._sentences[-1][1] if self._sentences else 0
+        self.version += 1
+
+    def roll(self, max_words: int) -> list[str]:
+        """
+        Once the transcript passes `max_words`, drops the oldest finished
+        sentences until about half of it is left and returns them. Words near
+        the end (the part partials still overlap with) are never rolled.
+        """
+        if len(self.words) <= max_words:
+            return []
+        keep_from = len(self.words) - max_words // 2
+        count = 0
+        while count < len(self._sentences) and self._sentences[count][1] <= keep_from:
+            count += 1
+        if count == 0:
+            return []
+
+        cut = self._sentences[count - 1][1]
+        rolled = [" ".join(self.words[start:end]) for start, end in self._sentences[:count]]
+        del self.words[:cut]
+        del self.keys[:cut]
+        self._sentences = [(start - cut, end - cut) for start, end in self._sentences[count:]]
+        self._open_start -= cut
+        self.version += 1
+        return rolled
+
+    def split_display(self, partial_text: str, revisable_words: int = REVISABLE_COMMITTED_WORDS) -> tuple[str, str]:
+        """Same result as split_display_text(self.words, partial_text), reading only the tail."""
+        partial = normalize_text(partial_text)
+        if not self.words:
+            return "", partial
+        if not partial:
+            return self.text(), ""
+
+        frozen_count = max(0, len(self.words) - revisable_words)
+        cached_version, cached_count, frozen_text = self._frozen_cache
+        if cached_version != self.version or cached_count != frozen_count:
+            frozen_text = " ".join(self.words[:frozen_count])
+            self._frozen_cache = (self.version, frozen_count, frozen_text)
+
+        candidate_partial = self.rules.clean(partial)
+        if frozen_count:
+            # strip_committed_overlap only ever compares the last 8 committed words.
+            candidate_partial = strip_committed_overlap(
+                " ".join(self.words[max(0, frozen_count - 8):frozen_count]),
+                candidate_partial,
+            )
+        unstable_text = merge_continuous_text(" ".join(self.words[frozen_count:]), candidate_partial)
+        return frozen_text, unstable_text
+
+    def appended_text(self, next_text: str) -> str | None:
+        """
+        What merge_continuous_text(self.text(), next_text) adds after the
+        committed text, or None when the merge does not start with it.
+        """
+        nxt = normalize_text(next_text)
+        base = self.text()
+        if not base or not nxt:
+            return "" if base else None
+
+        next_lower = nxt.lower()
+        if len(nxt) <= len(base):
+            tail = base[-len(nxt):].lower()
+            if tail == next_lower:
+                return ""
+        elif base.lower() in next_lower:
+            return None
+
+        next_words = nxt.split()
+        max_overlap = min(len(self.words), len(next_words), 16)
+        for overlap in range(max_overlap, 0, -1):
+            if [word.lower() for word in self.words[-overlap:]] == [word.lower() for word in next_words[:overlap]]:
+                return " ".join(next_words[overlap:])
+        return nxt
+
+    def sentences(self, limit: int) -> tuple[list[str], str]:
+        """The last `limit` finished sentences and the unfinished remainder."""
+        finished = [" ".join(self.words[start:end]) for start, end in self._sentences[-limit:]]
+        return finished, " ".join(self.words[self._open_start:])
 
 
 class StreamingTranscriber:
     """
     Uses a fast partial pass for responsiveness and a slower stabilizer pass to
     commit older words from a larger rolling buffer.
+
+    The two passes run on separate DecodeWorker threads; the lock guards the
+    audio buffer and the committed/partial text, and is never held while the
+    model is decoding.
     """
 
     MAX_BUFFER_SAMPLES = int(MAX_BUFFER_SECS * SAMPLE_RATE)
@@ -675,49 +2581,84 @@ class StreamingTranscriber:
         self.min_buffer_seconds = min_buffer_seconds
         self.silence_threshold = silence_threshold
         self.fast_window_samples = int(fast_window_seconds * SAMPLE_RATE)
-        self.audio_buffer = np.zeros(0, dtype=np.float32)
-        self.committed_words: list[str] = []
+        self.audio_buffer = AudioRingBuffer(self.MAX_BUFFER_SAMPLES)
+        self.rules = caption_filter(self.language)
+        self.transcript = CommittedTranscript(self.rules)
+        self.rolled_sentences: list[list[str]] = []
         self.source_language = ""
         self.last_partial = ""
         self.pending_partial = ""
         self.pending_partial_count = 0
         self.runtime_device = "cpu"
+        self._lock = threading.RLock()
+        self._generation = 0
+        self.finalized_segments = 0
+        self.mel_frames: MelFrameCache | None = None
+
+    def enable_mel_cache(self) -> bool:
+        """Shares log-mel frames between passes when the model's feature extractor allows it."""
+        if not install_mel_cache(self.model):
+            return False
+        self.mel_frames = self.model.feature_extractor.new_cache(self.MAX_BUFFER_SAMPLES)
+        return True
+
+    def _window(self, last_samples: int | None = None) -> tuple[np.ndarray, int]:
+        # With the mel cache, windows start on the STFT hop grid so their frames line up.
+        align = self.model.feature_extractor.hop_length if self.mel_frames is not None else 1
+        return self.audio_buffer.window(last_samples, align)
+
+    def _features(self, audio_start_index: int):
+        extractor = getattr(self.model, "feature_extractor", None)
+        if self.mel_frames is None or not isinstance(extractor, IncrementalMelExtractor):
+            return contextlib.nullcontext()
+        return extractor.stream_window(self.mel_frames, audio_start_index)
 
     def feed(self, chunk: np.ndarray) -> None:
-        self.audio_buffer = np.concatenate([self.audio_buffer, chunk])
-        if len(self.audio_buffer) > self.MAX_BUFFER_SAMPLES:
-            self.audio_buffer = self.audio_buffer[-self.MAX_BUFFER_SAMPLES:]
+        with self._lock:
+            self.audio_buffer.extend(chunk)
+
+    def feed_pcm(self, pcm_bytes: bytes) -> None:
+        with self._lock:
+            self.audio_buffer.extend_pcm(pcm_bytes)
 
     def _audio_usable(self, audio: np.ndarray) -> bool:
         buf_dur = len(audio) / SAMPLE_RATE
         if buf_dur < self.min_buffer_seconds:
             return False
 
-        if float(np.sqrt(np.mean(audio ** 2))) < self.silence_threshold:
+        if audio_rms(audio) < self.silence_threshold:
             return False
         return True
 
+    def set_fast_window(self, seconds: float) -> None:
+        with self._lock:
+            self.fast_window_samples = int(seconds * SAMPLE_RATE)
+
     def fast_partial(self) -> str:
-        audio = self.audio_buffer[-self.fast_window_samples:]
+        with self._lock:
+            audio, audio_start_index = self._window(self.fast_window_samples)
+            generation = self._generation
+            initial_prompt = self._committed_tail()
         if not self._audio_usable(audio):
             return ""
 
         try:
-            segs, info = self.model.transcribe(
-                audio,
-                language=self.language,
-                beam_size=1,
-                best_of=1,
-                vad_filter=False,
-                condition_on_previous_text=False,
-                temperature=0.0,
-                repetition_penalty=1.18,
-                no_repeat_ngram_size=3,
-                compression_ratio_threshold=1.9,
-                no_speech_threshold=0.45,
-                word_timestamps=False,
-                initial_prompt=self._committed_tail(),
-            )
+            with self._features(audio_start_index):
+                segs, info = self.model.transcribe(
+                    audio,
+                    language=self.language,
+                    beam_size=1,
+                    best_of=1,
+                    vad_filter=False,
+                    condition_on_previous_text=False,
+                    temperature=0.0,
+                    repetition_penalty=1.18,
+                    no_repeat_ngram_size=3,
+                    compression_ratio_threshold=1.9,
+                    no_speech_threshold=0.45,
+                    word_timestamps=False,
+                    initial_prompt=initial_prompt,
+                )
             if info.language:
                 self.source_language = info.language
             partial = normalize_text(" ".join(
@@ -725,90 +2666,111 @@ class StreamingTranscriber:
                 for seg in segs
                 if normalize_text(seg.text)
             ))
-            partial = clean_transcript_text(partial)
-            return self._smooth_partial(partial)
+            partial = self.rules.clean(partial)
         except Exception as error:
             if self.runtime_device == "cuda" and is_cuda_runtime_error(error):
                 raise CaptionRuntimeFallback(str(error))
             return ""
 
-    def stabilize(self) -> str:
-        audio = self.audio_buffer
-        if not self._audio_usable(audio):
-            return self._committed_tail()
-
-        buf_dur = len(audio) / SAMPLE_RATE
-        threshold = buf_dur * self.commit_ratio
+        with self._lock:
+            if generation != self._generation:
+                return ""
+            return self._smooth_partial(partial)
 
-        try:
-            segs, info = self.model.transcribe(
-                audio,
-                language=self.language,
-                beam_size=1,
-                best_of=1,
-                vad_filter=False,
-                condition_on_previous_text=False,
-                temperature=0.0,
-                repetition_penalty=1.12,
-                no_repeat_ngram_size=3,
-                compression_ratio_threshold=2.0,
-                no_speech_threshold=0.45,
-                word_timestamps=True,
-                initial_prompt=self._committed_tail(),
-            )
-            words = [
-                (w.start, w.end, normalize_text(w.word))
-                for seg in segs
-                for w in (seg.words or [])
-                if normalize_text(w.word)
-            ]
-            if info.language:
-                self.source_language = info.language
-        except Exception as error:
-            if self.runtime_device == "cuda" and is_cuda_runtime_error(error):
-                raise CaptionRuntimeFallback(str(error))
-            return self._committed_tail()
+    def stabilize(self, final: bool = False) -> str:
+        """
+        Commits words that ended in the older part of the buffer. With
+        `final`, the buffer holds one finished voiced segment: every word is
+        committed and the segment's audio is dropped.
+        """
+        with self._lock:
+            audio, audio_start_index = self._window()
+            generation = self._generation
+            initial_prompt = self._committed_tail()
 
-        if not words:
-            return self._committed_tail()
+        buf_dur = len(audio) / SAMPLE_RATE
+        threshold = buf_dur if final else buf_dur * self.commit_ratio
+        words: list[tuple[float, float, str]] = []
+
+        if self._audio_usable(audio):
+            try:
+                with self._features(audio_start_index):
+                    segs, info = self.model.transcribe(
+                        audio,
+                        language=self.language,
+                        beam_size=1,
+                        best_of=1,
+                        vad_filter=False,
+                        condition_on_previous_text=False,
+                        temperature=0.0,
+                        repetition_penalty=1.12,
+                        no_repeat_ngram_size=3,
+                        compression_ratio_threshold=2.0,
+                        no_speech_threshold=0.45,
+                        word_timestamps=True,
+                        initial_prompt=initial_prompt,
+                    )
+                words = [
+                    (w.start, w.end, normalize_text(w.word))
+                    for seg in segs
+                    for w in (seg.words or [])
+                    if normalize_text(w.word)
+                ]
+                if info.language:
+                    self.source_language = info.language
+            except Exception as error:
+                if self.runtime_device == "cuda" and is_cuda_runtime_error(error):
+                    raise CaptionRuntimeFallback(str(error))
+                if not final:
+                    return initial_prompt
+
+        # A finished segment is dropped even when nothing usable was heard in it.
+        if not words and not final:
+            return initial_prompt
 
         to_commit = [(s, e, w) for s, e, w in words if e <= threshold]
 
-        if to_commit:
-            last_end = to_commit[-1][1]
-            self._append_committed_words([w for _, _, w in to_commit])
-            trim_secs = max(0.0, last_end - 0.45)
-            trim_samples = int(trim_secs * SAMPLE_RATE)
-            if trim_samples > 0:
-                self.audio_buffer = self.audio_buffer[trim_samples:]
-        return self._committed_tail()
+        with self._lock:
+            # A silence commit or reset while we were decoding already consumed
+            # this audio; committing it again would duplicate words.
+            if generation != self._generation:
+                return self._committed_tail()
+
+            if final:
+                self._append_committed_words([w for _, _, w in to_commit], whole=True)
+                self.audio_buffer.drop_until(audio_start_index + len(audio))
+                self.last_partial = ""
+                self.pending_partial = ""
+                self.pending_partial_count = 0
+                self._generation += 1
+                self.finalized_segments += 1
+            elif to_commit:
+                last_end = to_commit[-1][1]
+                self._append_committed_words([w for _, _, w in to_commit])
+                trim_secs = max(0.0, last_end - 0.45)
+                trim_samples = int(trim_secs * SAMPLE_RATE)
+                if trim_samples > 0:
+                    self.audio_buffer.drop_until(audio_start_index + trim_samples)
+            return self._committed_tail()
 
     def speech_active(self) -> bool:
-        audio = self.audio_buffer[-int(0.25 * SAMPLE_RATE):]
-        if len(audio) == 0:
-            return False
-        return float(np.sqrt(np.mean(audio ** 2))) >= self.silence_threshold
-
-    def _append_committed_words(self, new_words: list[str]) -> None:
-        for word in new_words:
-            normalized = normalize_text(word)
-            if not normalized:
-                continue
-
-            if self.committed_words:
-                if comparable_word(self.committed_words[-1]) == comparable_word(normalized):
-                    run = 1
-                    for previous in reversed(self.committed_words[:-1]):
-                        if comparable_word(previous) != comparable_word(normalized):
-                            break
-                        run += 1
-                    if run >= 2:
-                        continue
-
-            self.committed_words.append(normalized)
-
-        committed_text = clean_transcript_text(" ".join(self.committed_words))
-        self.committed_words = normalized_words(committed_text)
+        with self._lock:
+            audio = self.audio_buffer.view(int(0.25 * SAMPLE_RATE))
+            if len(audio) == 0:
+                return False
+            return audio_rms(audio) >= self.silence_threshold
+
+    def _append_committed_words(self, new_words: list[str], whole: bool = False) -> None:
+        self.transcript.append(new_words, whole)
+        rolled = self.transcript.roll(LIVE_WINDOW_WORDS)
+        if rolled:
+            self.rolled_sentences.append(rolled)
+
+    def take_rolled_sentences(self) -> list[list[str]]:
+        """Groups of finished sentences that left the live window since the last call."""
+        with self._lock:
+            rolled, self.rolled_sentences = self.rolled_sentences, []
+            return rolled
 
     def _smooth_partial(self, candidate: str) -> str:
         candidate = normalize_text(candidate)
@@ -873,36 +2835,80 @@ class StreamingTranscriber:
         return candidate
 
     def _committed_tail(self) -> str:
-        return " ".join(self.committed_words[-8:])
+        return self.transcript.tail_text(8)
+
+    def committed_tail(self) -> str:
+        with self._lock:
+            return self._committed_tail()
+
+    def committed_text(self) -> str:
+        with self._lock:
+            return self.transcript.text()
+
+    def texts(self, partial_text: str) -> tuple[str, str, str, int]:
+        """Returns (display text, committed text, unstable text, committed word count)."""
+        with self._lock:
+            _frozen_text, unstable_text = self.transcript.split_display(partial_text)
+            stable_text = self.transcript.text()
+            appended = self.transcript.appended_text(unstable_text)
+            if appended is None:
+                display_text = merge_continuous_text(stable_text, unstable_text)
+            else:
+                display_text = f"{stable_text} {appended}" if stable_text and appended else stable_text or appended
+            return display_text, stable_text, unstable_text, len(self.transcript)
+
+    def translation_parts(self, display_text: str, unstable_text: str) -> tuple[list[str], str]:
+        """Finished sentences worth translating and the still-changing tail after them."""
+        with self._lock:
+            finished, remainder = self.transcript.sentences(MAX_TRANSLATED_SEGMENTS)
+            appended = self.transcript.appended_text(unstable_text)
+            if appended is not None:
+                return finished, " ".join(part for part in (remainder, appended) if part)
+            # The partial swallowed the committed text (short sessions only); cut by characters.
+            all_finished, _remainder = self.transcript.sentences(len(self.transcript))
+            finished_text = " ".join(all_finished)
+            if display_text.startswith(finished_text):
+                return finished, display_text[len(finished_text):].strip()
+            return finished, merge_continuous_text(remainder, strip_committed_overlap(self.transcript.text(), unstable_text))
 
     def commit_partial_phrase(self, partial_text: str) -> bool:
-        candidate = clean_transcript_text(normalize_text(partial_text))
+        candidate = self.rules.clean(normalize_text(partial_text))
         if not candidate:
             return False
 
-        committed_context = " ".join(self.committed_words[-12:])
-        if committed_context:
-            candidate = strip_committed_overlap(committed_context, candidate)
-            candidate = clean_transcript_text(candidate)
+        with self._lock:
+            committed_context = self.transcript.tail_text(12)
+            if committed_context:
+                candidate = strip_committed_overlap(committed_context, candidate)
+                candidate = self.rules.clean(candidate)
 
-        candidate_words = normalized_words(candidate)
-        if len(candidate_words) < 2:
-            return False
+            candidate_words = normalized_words(candidate)
+            if len(candidate_words) < 2:
+                return False
 
-        self._append_committed_words(candidate_words)
-        self.audio_buffer = np.zeros(0, dtype=np.float32)
-        self.last_partial = ""
-        self.pending_partial = ""
-        self.pending_partial_count = 0
-        return True
+            self._append_committed_words(candidate_words)
+            self.audio_buffer.clear()
+            self.last_partial = ""
+            self.pending_partial = ""
+            self.pending_partial_count = 0
+            self._generation += 1
+            return True
 
     def reset(self) -> None:
-        self.audio_buffer = np.zeros(0, dtype=np.float32)
-        self.committed_words = []
-        self.source_language = ""
-
-
-def run_streaming_asr_backend(args: argparse.Namespace, state_path: Path, state: dict) -> int:
+        with self._lock:
+            self.audio_buffer.clear()
+            self.transcript.clear()
+            self.source_language = ""
+            self._generation += 1
+
+
+def run_streaming_asr_backend(
+    args: argparse.Namespace,
+    state_writer: StateWriter,
+    state: dict,
+    models: ResidentModels,
+    stop_event: threading.Event,
+) -> int:
     resolved_language, language_message = resolve_vosk_language(args.language)
 
     try:
@@ -914,19 +2920,19 @@ def run_streaming_asr_backend(args: argparse.Namespace, state_path: Path, state:
             "message": f"Could not prepare streaming ASR model: {error}",
             "backend_ready": False,
         })
-        write_state(state_path, state)
+        state_writer.write(state)
         return 2
 
     try:
-        pulse_device = resolve_pulse_device(args.source)
+        audio_source = open_audio_source(args)
     except Exception as error:
         print(str(error), file=sys.stderr)
         state.update({"status": "error", "message": str(error)})
-        write_state(state_path, state)
+        state_writer.write(state)
         return 3
 
     set_status(
-        state_path,
+        state_writer,
         state,
         "loading",
         language_message or "Loading streaming ASR…",
@@ -934,7 +2940,7 @@ def run_streaming_asr_backend(args: argparse.Namespace, state_path: Path, state:
 
     try:
         transcriber = VoskStreamingTranscriber(
-            model_path,
+            models.vosk(model_path),
             resolved_language,
             args.silence_threshold,
         )
@@ -946,16 +2952,17 @@ def run_streaming_asr_backend(args: argparse.Namespace, state_path: Path, state:
             "runtime_device": "",
             "backend_ready": False,
         })
-        write_state(state_path, state)
+        state_writer.write(state)
         return 2
 
-    capture_proc = start_audio_capture(pulse_device)
-    translator = AsyncTranslator()
+    translator = IncrementalTranslator(create_backend(args.translator))
+    history = CaptionHistory(args.history_limit, args.history_max_bytes, args.transcript_file)
     last_display_text = ""
     last_translated_text = ""
     last_translated_stable_text = ""
     last_translated_unstable_text = ""
     last_committed_count = 0
+    last_history_version = 0
 
     state.update({
         "status": "running",
@@ -964,56 +2971,50 @@ def run_streaming_asr_backend(args: argparse.Namespace, state_path: Path, state:
         "source_language": resolved_language,
         "backend_ready": True,
     })
-    write_state(state_path, state)
+    state_writer.write(state)
 
     try:
-        while RUNNING:
-            if capture_proc.poll() is not None:
+        while RUNNING and not stop_event.is_set():
+            state_writer.poll()
+            if not audio_source.alive():
                 print("Audio capture process exited unexpectedly.", file=sys.stderr)
                 state.update({"status": "error", "message": "Audio capture process exited unexpectedly."})
-                write_state(state_path, state)
+                state_writer.write(state)
                 return 4
 
-            chunk = capture_proc.stdout.read(4096)
+            chunk = audio_source.read(4096)
             if not chunk:
+                if audio_source.finished:
+                    break
                 time.sleep(0.01)
                 continue
 
-            transcriber.feed(chunk)
+            # Unchanged captions need no work at all unless translations may still be arriving.
+            if not transcriber.feed(chunk) and args.display_mode == "captions":
+                continue
+            rolled = transcriber.take_rolled_segments()
+            if rolled:
+                add_history_entries(
+                    history, [[segment] for segment in rolled], translator,
+                    args.target_language, transcriber.source_language,
+                )
             display_text, stable_text, unstable_text = transcriber.texts()
             speech_active = transcriber.speech_active()
             committed_count = transcriber.committed_word_count()
 
-            translated_text = last_translated_text if args.display_mode != "captions" else ""
-            translated_stable_text = last_translated_stable_text if args.display_mode != "captions" else ""
-            translated_unstable_text = last_translated_unstable_text if args.display_mode != "captions" else ""
+            translated_text = ""
+            translated_stable_text = ""
+            translated_unstable_text = ""
             if args.display_mode != "captions":
-                if stable_text:
-                    requested_stable_translation = translator.request(
-                        stable_text,
-                        args.target_language,
-                        transcriber.source_language,
-                    )
-                    if requested_stable_translation:
-                        translated_stable_text = requested_stable_translation
-                else:
-                    translated_stable_text = ""
-
-                if display_text:
-                    requested_translation = translator.request(
-                        display_text,
-                        args.target_language,
-                        transcriber.source_language,
-                    )
-                    if requested_translation:
-                        translated_text = requested_translation
-                else:
-                    translated_text = ""
-
-                if translated_text and normalize_text(translated_text) != normalize_text(translated_stable_text):
-                    translated_unstable_text = translated_text
-                else:
-                    translated_unstable_text = ""
+                # Vosk final results are already utterance-sized segments.
+                translated_stable_text, translated_unstable_text = translator.update(
+                    stable_text.split("\n") if stable_text else [],
+                    unstable_text,
+                    args.target_language,
+                    transcriber.source_language,
+                    joiner="\n",
+                )
+                translated_text = "\n".join(part for part in (translated_stable_text, translated_unstable_text) if part)
 
             if (
                 display_text == last_display_text
@@ -1021,6 +3022,7 @@ def run_streaming_asr_backend(args: argparse.Namespace, state_path: Path, state:
                 and translated_stable_text == last_translated_stable_text
                 and translated_unstable_text == last_translated_unstable_text
                 and committed_count == last_committed_count
+                and history.version == last_history_version
             ):
                 continue
 
@@ -1029,6 +3031,7 @@ def run_streaming_asr_backend(args: argparse.Namespace, state_path: Path, state:
             last_translated_stable_text = translated_stable_text
             last_translated_unstable_text = translated_unstable_text
             last_committed_count = committed_count
+            last_history_version = history.version
 
             state.update({
                 "status": "running",
@@ -1041,39 +3044,69 @@ def run_streaming_asr_backend(args: argparse.Namespace, state_path: Path, state:
                 "translated_unstable_text": translated_unstable_text,
                 "source_language": transcriber.source_language,
                 "target_language": args.target_language,
-                "history": [],
+                "history": history.items(),
                 "speech_active": speech_active,
                 "runtime_device": transcriber.runtime_device,
                 "backend_ready": True,
             })
-            write_state(state_path, state)
+            state_writer.publish(state)
     finally:
-        translator.stop()
-        capture_proc.terminate()
+        audio_source.close()
+        # The translator (and its cache) must still be open for the last history lookups.
         try:
-            capture_proc.wait(timeout=2)
-        except subprocess.TimeoutExpired:
-            capture_proc.kill()
+            if audio_source.finished:
+                transcriber.finish()
+                add_history_entries(
+                    history, [[segment] for segment in transcriber.take_rolled_segments()], translator,
+                    args.target_language, transcriber.source_language,
+                )
+            history.close(transcriber.texts()[1], last_translated_stable_text)
+        finally:
+            translator.stop()
+
+    if audio_source.finished:
+        display_text, stable_text, _unstable_text = transcriber.texts()
+        state.update({
+            "current_text": display_text,
+            "stable_text": stable_text,
+            "unstable_text": "",
+            "history": history.items(),
+        })
 
     state.update({"status": "stopped", "message": "Live captions stopped."})
-    write_state(state_path, state)
+    state_writer.write(state)
     return 0
 
 
-def main() -> int:
-    args = parse_args()
-    args = apply_preset(args)
-    state_path = Path(args.state_file)
-    state = build_base_state(args)
-    write_state(state_path, state)
-
-    if args.backend == "asr":
-        return run_streaming_asr_backend(args, state_path, state)
+def load_session_whisper_model(
+    args: argparse.Namespace,
+    state_writer: StateWriter,
+    state: dict,
+    models: ResidentModels,
+) -> tuple[str, object, str] | None:
+    """Returns (model path, model, runtime device), or None after reporting the error."""
+    if args.model == "auto":
+        try:
+            choice = ModelTuner(args, state_writer, state).choose()
+        except Exception as error:
+            print(f"Could not pick a speech model: {error}", file=sys.stderr)
+            state.update({
+                "status": "error",
+                "message": f"Could not pick a speech model: {error}",
+                "backend_ready": False,
+            })
+            state_writer.write(state)
+            return None
+        state["model"] = {key: choice[key] for key in ("model", "compute_type", "cpu_threads", "decode_seconds", "met_target")}
+        model_path = choice["model_path"]
+        runtime = {"compute_type": choice["compute_type"], "cpu_threads": choice["cpu_threads"]}
+    else:
+        model_path = args.model
+        runtime = {}
 
-    model_path = args.model
-    if args.model_cache_dir:
+    if args.model_cache_dir and args.model != "auto":
         try:
-            model_path = ensure_model(args.model, args.model_cache_dir, state_path, state)
+            model_path = ensure_model(args.model, args.model_cache_dir, state_writer, state)
         except Exception as error:
             print(f"Could not prepare speech model: {error}", file=sys.stderr)
             state.update({
@@ -1081,13 +3114,13 @@ def main() -> int:
                 "message": f"Could not prepare speech model: {error}",
                 "backend_ready": False,
             })
-            write_state(state_path, state)
-            return 2
+            state_writer.write(state)
+            return None
 
-    set_status(state_path, state, "loading", "Loading caption model…")
+    set_status(state_writer, state, "loading", "Loading caption model…")
 
     try:
-        model, runtime_device = load_model(model_path)
+        model, runtime_device = models.whisper(model_path, **runtime)
     except Exception as error:
         print(f"Could not load faster-whisper: {error}", file=sys.stderr)
         state.update({
@@ -1096,18 +3129,43 @@ def main() -> int:
             "runtime_device": "",
             "backend_ready": False,
         })
-        write_state(state_path, state)
+        state_writer.write(state)
+        return None
+    return model_path, model, runtime_device
+
+
+def run_whisper_backend(
+    args: argparse.Namespace,
+    state_writer: StateWriter,
+    state: dict,
+    models: ResidentModels,
+    stop_event: threading.Event,
+) -> int:
+    loaded = load_session_whisper_model(args, state_writer, state, models)
+    if loaded is None:
         return 2
+    model_path, model, runtime_device = loaded
 
     try:
-        pulse_device = resolve_pulse_device(args.source)
+        audio_source = open_audio_source(args)
     except Exception as error:
         print(str(error), file=sys.stderr)
         state.update({"status": "error", "message": str(error)})
-        write_state(state_path, state)
+        state_writer.write(state)
         return 3
 
-    capture_proc = start_audio_capture(pulse_device)
+    try:
+        vad_gate = build_vad_gate(args.vad, args.silence_threshold, args.vad_aggressiveness)
+    except Exception as error:
+        print(f"Could not load voice activity detector: {error}", file=sys.stderr)
+        state.update({
+            "status": "error",
+            "message": f"Could not load voice activity detector: {error}",
+            "backend_ready": False,
+        })
+        state_writer.write(state)
+        return 2
+
     transcriber = StreamingTranscriber(
         model,
         args.language,
@@ -1117,7 +3175,15 @@ def main() -> int:
         args.fast_window_seconds,
     )
     transcriber.runtime_device = runtime_device
-    translator = AsyncTranslator()
+    if args.mel_cache == "on":
+        transcriber.enable_mel_cache()
+    translator = IncrementalTranslator(create_backend(args.translator))
+    history = CaptionHistory(args.history_limit, args.history_max_bytes, args.transcript_file)
+    partial_worker = DecodeWorker("live-captions-partial", transcriber.fast_partial)
+    stabilizer_worker = DecodeWorker("live-captions-stabilizer", transcriber.stabilize)
+    adaptive = AdaptivePreset(args) if args.preset == "auto" else None
+    if adaptive is not None:
+        state["tuning"] = adaptive.report()
     last_fast_tick = time.monotonic()
     last_stable_tick = time.monotonic()
     last_display_text = ""
@@ -1125,9 +3191,27 @@ def main() -> int:
     last_translated_stable_text = ""
     last_translated_unstable_text = ""
     last_committed_count = 0
+    last_history_version = 0
     current_partial = ""
     committed_tail = ""
     phrase_closed_for_silence = False
+    finalized_segments = 0
+
+    def fall_back_to_cpu() -> None:
+        nonlocal model, runtime_device
+        # Both workers can hit the same CUDA failure; only reload once.
+        if transcriber.runtime_device != "cuda":
+            return
+        model, runtime_device = models.whisper(model_path, force_device="cpu")
+        transcriber.model = model
+        transcriber.runtime_device = runtime_device
+        state.update({
+            "status": "running",
+            "message": "CUDA failed during decoding, fell back to CPU.",
+            "runtime_device": runtime_device,
+            "backend_ready": True,
+        })
+        state_writer.write(state)
 
     state.update({
         "status": "running",
@@ -1135,106 +3219,111 @@ def main() -> int:
         "runtime_device": runtime_device,
         "backend_ready": True,
     })
-    write_state(state_path, state)
+    state_writer.write(state)
     silence_started_at = time.monotonic()
+    chunk_view = memoryview(bytearray(1024))
 
     try:
-        while RUNNING:
-            if capture_proc.poll() is not None:
+        while RUNNING and not stop_event.is_set():
+            state_writer.poll()
+            if not audio_source.alive():
                 print("Audio capture process exited unexpectedly.", file=sys.stderr)
                 state.update({"status": "error", "message": "Audio capture process exited unexpectedly."})
-                write_state(state_path, state)
+                state_writer.write(state)
                 return 4
 
-            chunk = capture_proc.stdout.read(1024)
-            if not chunk:
+            # Sources block until a chunk is ready; an empty read means capture ended.
+            chunk_size = audio_source.readinto(chunk_view)
+            if not chunk_size:
+                if audio_source.finished:
+                    break
                 time.sleep(0.01)
                 continue
+            chunk = chunk_view[:chunk_size]
 
-            transcriber.feed(pcm_to_float(chunk))
+            segment_ended = False
+            if vad_gate is None:
+                transcriber.feed_pcm(chunk)
+                decoding = True
+            else:
+                voiced_pcm, segment_ended = vad_gate.process(chunk)
+                if voiced_pcm:
+                    transcriber.feed_pcm(voiced_pcm)
+                decoding = vad_gate.active
 
             now = time.monotonic()
-            if now - last_fast_tick >= args.step_seconds:
-                try:
-                    current_partial = transcriber.fast_partial()
-                except CaptionRuntimeFallback:
-                    model, runtime_device = load_model(model_path, force_device="cpu")
-                    transcriber.model = model
-                    transcriber.runtime_device = runtime_device
-                    state.update({
-                        "status": "running",
-                        "message": "CUDA failed during decoding, fell back to CPU.",
-                        "runtime_device": runtime_device,
-                        "backend_ready": True,
-                    })
-                    write_state(state_path, state)
-                    current_partial = ""
+            if decoding and now - last_fast_tick >= args.step_seconds:
+                partial_worker.submit()
                 last_fast_tick = now
 
-            if now - last_stable_tick >= args.stabilize_seconds:
-                try:
-                    committed_tail = transcriber.stabilize()
-                except CaptionRuntimeFallback:
-                    model, runtime_device = load_model(model_path, force_device="cpu")
-                    transcriber.model = model
-                    transcriber.runtime_device = runtime_device
-                    state.update({
-                        "status": "running",
-                        "message": "CUDA failed during decoding, fell back to CPU.",
-                        "runtime_device": runtime_device,
-                        "backend_ready": True,
-                    })
-                    write_state(state_path, state)
-                    committed_tail = transcriber._committed_tail()
+            if decoding and now - last_stable_tick >= args.stabilize_seconds:
+                stabilizer_worker.submit()
                 last_stable_tick = now
 
-            speech_active = transcriber.speech_active()
-            if speech_active:
-                silence_started_at = now
-                phrase_closed_for_silence = False
-            elif now - silence_started_at > 0.75:
-                if not phrase_closed_for_silence:
-                    if transcriber.commit_partial_phrase(current_partial or transcriber.last_partial):
-                        committed_tail = transcriber._committed_tail()
-                    phrase_closed_for_silence = True
+            if segment_ended:
+                stabilizer_worker.submit(True)
+
+            try:
+                has_partial, partial = partial_worker.take_result()
+                if has_partial:
+                    current_partial = partial
+                    if adaptive is not None:
+                        adaptive.observe(partial_seconds=partial_worker.last_decode_seconds)
+            except CaptionRuntimeFallback:
+                fall_back_to_cpu()
                 current_partial = ""
 
-            committed_count = len(transcriber.committed_words)
+            try:
+                has_tail, tail = stabilizer_worker.take_result()
+                if has_tail:
+                    committed_tail = tail
+                    if adaptive is not None:
+                        adaptive.observe(stabilize_seconds=stabilizer_worker.last_decode_seconds)
+            except CaptionRuntimeFallback:
+                fall_back_to_cpu()
+                committed_tail = transcriber.committed_tail()
+
+            if adaptive is not None and adaptive.update(now):
+                transcriber.set_fast_window(args.fast_window_seconds)
+                state["tuning"] = adaptive.report()
+                state_writer.publish(state)
+
+            if vad_gate is not None:
+                # Segments are closed at VAD boundaries by the final stabilize pass.
+                speech_active = vad_gate.active
+                if transcriber.finalized_segments != finalized_segments:
+                    finalized_segments = transcriber.finalized_segments
+                    current_partial = ""
+            else:
+                speech_active = transcriber.speech_active()
+                if speech_active:
+                    silence_started_at = now
+                    phrase_closed_for_silence = False
+                elif now - silence_started_at > 0.75:
+                    if not phrase_closed_for_silence:
+                        if transcriber.commit_partial_phrase(current_partial or transcriber.last_partial):
+                            committed_tail = transcriber.committed_tail()
+                        phrase_closed_for_silence = True
+                    current_partial = ""
 
-            _stable_preview, unstable_text = split_display_text(transcriber.committed_words, current_partial)
-            stable_text = " ".join(transcriber.committed_words)
-            display_text = merge_continuous_text(stable_text, unstable_text)
+            add_history_entries(
+                history, transcriber.take_rolled_sentences(), translator,
+                args.target_language, transcriber.source_language,
+            )
+            display_text, stable_text, unstable_text, committed_count = transcriber.texts(current_partial)
 
-            translated_text = last_translated_text if args.display_mode != "captions" else ""
-            translated_stable_text = last_translated_stable_text if args.display_mode != "captions" else ""
-            translated_unstable_text = last_translated_unstable_text if args.display_mode != "captions" else ""
+            translated_text = ""
+            translated_stable_text = ""
+            translated_unstable_text = ""
             if args.display_mode != "captions":
-                if stable_text:
-                    requested_stable_translation = translator.request(
-                        stable_text,
-                        args.target_language,
-                        transcriber.source_language,
-                    )
-                    if requested_stable_translation:
-                        translated_stable_text = requested_stable_translation
-                else:
-                    translated_stable_text = ""
-
-                if display_text:
-                    requested_translation = translator.request(
-                        display_text,
-                        args.target_language,
-                        transcriber.source_language,
-                    )
-                    if requested_translation:
-                        translated_text = requested_translation
-                else:
-                    translated_text = ""
-
-                if translated_text and normalize_text(translated_text) != normalize_text(translated_stable_text):
-                    translated_unstable_text = translated_text
-                else:
-                    translated_unstable_text = ""
+                finished_sentences, tail = transcriber.translation_parts(display_text, unstable_text)
+                translated_stable_text, translated_unstable_text = translator.update(
+                    finished_sentences,
+                    tail,
+                    args.target_language,
+                    transcriber.source_language,
+                )
+                translated_text = " ".join(part for part in (translated_stable_text, translated_unstable_text) if part)
 
             if (
                 display_text == last_display_text
@@ -1242,6 +3331,7 @@ def main() -> int:
                 and translated_stable_text == last_translated_stable_text
                 and translated_unstable_text == last_translated_unstable_text
                 and committed_count == last_committed_count
+                and history.version == last_history_version
             ):
                 continue
 
@@ -1250,6 +3340,7 @@ def main() -> int:
             last_translated_stable_text = translated_stable_text
             last_translated_unstable_text = translated_unstable_text
             last_committed_count = committed_count
+            last_history_version = history.version
 
             state.update({
                 "status": "running",
@@ -1262,24 +3353,596 @@ def main() -> int:
                 "translated_unstable_text": translated_unstable_text,
                 "source_language": transcriber.source_language,
                 "target_language": args.target_language,
-                "history": [],
+                "history": history.items(),
                 "speech_active": speech_active,
                 "runtime_device": transcriber.runtime_device,
                 "backend_ready": True,
             })
-            write_state(state_path, state)
+            state_writer.publish(state)
     finally:
-        translator.stop()
-        capture_proc.terminate()
+        partial_worker.stop()
+        stabilizer_worker.stop()
+        audio_source.close()
+        # The translator (and its cache) must still be open for the last history lookups.
         try:
-            capture_proc.wait(timeout=2)
-        except subprocess.TimeoutExpired:
-            capture_proc.kill()
+            if audio_source.finished:
+                # Replayed files end mid-phrase; commit whatever is still buffered.
+                try:
+                    transcriber.stabilize(final=True)
+                except CaptionRuntimeFallback as error:
+                    print(f"Final caption pass failed: {error}", file=sys.stderr)
+            add_history_entries(
+                history, transcriber.take_rolled_sentences(), translator,
+                args.target_language, transcriber.source_language,
+            )
+            history.close(transcriber.committed_text(), last_translated_text)
+        finally:
+            translator.stop()
+
+    if audio_source.finished:
+        stable_text = transcriber.committed_text()
+        state.update({
+            "current_text": stable_text,
+            "stable_text": stable_text,
+            "unstable_text": "",
+            "history": history.items(),
+        })
 
     state.update({"status": "stopped", "message": "Live captions stopped."})
-    write_state(state_path, state)
+    state_writer.write(state)
     return 0
 
 
+class CaptionStream:
+    """
+    One labelled source of a multi-source session: its capture, reader
+    thread, transcriber and translator, with decodes going through slots on
+    the session's SharedDecoder. `tick()` mirrors one pass of the
+    single-source whisper loop without the audio read, which happens on the
+    reader thread.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        args: argparse.Namespace,
+        audio_source,
+        transcriber: StreamingTranscriber,
+        vad_gate: VoiceActivityGate | None,
+        translator: IncrementalTranslator,
+        decoder: SharedDecoder,
+    ):
+        self.source = source
+        self.label = SOURCE_LABELS.get(source, source)
+        self.args = args
+        self.audio_source = audio_source
+        self.transcriber = transcriber
+        self.vad_gate = vad_gate
+        self.translator = translator
+        # Commits matter more than previews, so stabilize passes go first.
+        self.partial_worker = decoder.slot(transcriber.fast_partial, priority=0)
+        self.stabilizer_worker = decoder.slot(transcriber.stabilize, priority=1)
+        self.decoding = False
+        self.ended = False
+        self.current_partial = ""
+        self.speech_active = False
+        self.texts = {"current_text": "", "stable_text": "", "unstable_text": "", "translated_text": ""}
+        self._last_fast_tick = time.monotonic()
+        self._last_stable_tick = time.monotonic()
+        self._silence_started_at = time.monotonic()
+        self._phrase_closed_for_silence = False
+        self._finalized_segments = 0
+        self._stop_event = threading.Event()
+        self._reader = threading.Thread(target=self._read, name=f"live-captions-{source}", daemon=True)
+
+    def start(self) -> None:
+        self._reader.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.audio_source.close()
+        self._reader.join(timeout=1.0)
+
+    def alive(self) -> bool:
+        return self.ended or self.audio_source.alive()
+
+    def _read(self) -> None:
+        chunk_view = memoryview(bytearray(1024))
+        while not self._stop_event.is_set():
+            chunk_size = self.audio_source.readinto(chunk_view)
+            if not chunk_size:
+                if self.audio_source.finished or not self.audio_source.alive():
+                    break
+                time.sleep(0.01)
+                continue
+            chunk = chunk_view[:chunk_size]
+            if self.vad_gate is None:
+                self.transcriber.feed_pcm(chunk)
+                self.decoding = True
+            else:
+                voiced_pcm, segment_ended = self.vad_gate.process(chunk)
+                if voiced_pcm:
+                    self.transcriber.feed_pcm(voiced_pcm)
+                self.decoding = self.vad_gate.active
+                if segment_ended:
+                    self.stabilizer_worker.submit(True)
+        self.ended = self.audio_source.finished
+
+    def tick(self, now: float, history: CaptionHistory, fall_back_to_cpu) -> bool:
+        """Schedules decodes, takes finished ones and refreshes the texts; True when they changed."""
+        args = self.args
+        transcriber = self.transcriber
+        if self.decoding and now - self._last_fast_tick >= args.step_seconds:
+            self.partial_worker.submit()
+            self._last_fast_tick = now
+        if self.decoding and now - self._last_stable_tick >= args.stabilize_seconds:
+            self.stabilizer_worker.submit()
+            self._last_stable_tick = now
+
+        try:
+            has_partial, partial = self.partial_worker.take_result()
+            if has_partial:
+                self.current_partial = partial
+        except CaptionRuntimeFallback:
+            fall_back_to_cpu()
+            self.current_partial = ""
+        try:
+            self.stabilizer_worker.take_result()
+        except CaptionRuntimeFallback:
+            fall_back_to_cpu()
+
+        if self.vad_gate is not None:
+            self.speech_active = self.vad_gate.active
+            if transcriber.finalized_segments != self._finalized_segments:
+                self._finalized_segments = transcriber.finalized_segments
+                self.current_partial = ""
+        else:
+            self.speech_active = transcriber.speech_active()
+            if self.speech_active:
+                self._silence_started_at = now
+                self._phrase_closed_for_silence = False
+            elif now - self._silence_started_at > 0.75:
+                if not self._phrase_closed_for_silence:
+                    transcriber.commit_partial_phrase(self.current_partial or transcriber.last_partial)
+                    self._phrase_closed_for_silence = True
+                self.current_partial = ""
+
+        self.add_rolled_history(history)
+        display_text, stable_text, unstable_text, _count = transcriber.texts(self.current_partial)
+        translated_text = ""
+        if args.display_mode != "captions":
+            finished_sentences, tail = transcriber.translation_parts(display_text, unstable_text)
+            translated_stable_text, translated_unstable_text = self.translator.update(
+                finished_sentences,
+                tail,
+                args.target_language,
+                transcriber.source_language,
+            )
+            translated_text = " ".join(part for part in (translated_stable_text, translated_unstable_text) if part)
+
+        texts = {
+            "current_text": display_text,
+            "stable_text": stable_text,
+            "unstable_text": unstable_text,
+            "translated_text": translated_text,
+        }
+        if texts == self.texts:
+            return False
+        self.texts = texts
+        return True
+
+    def add_rolled_history(self, history: CaptionHistory) -> None:
+        for group in self.transcriber.take_rolled_sentences():
+            translations = (
+                self.translator.translated(sentence, self.args.target_language, self.transcriber.source_language)
+                for sentence in group
+            )
+            translated = " ".join(translation for translation in translations if translation)
+            history.add(f"{self.label}: {' '.join(group)}", f"{self.label}: {translated}" if translated else "")
+
+    def snapshot(self) -> dict:
+        return {
+            "source": self.source,
+            "label": self.label,
+            **self.texts,
+            "source_language": self.transcriber.source_language,
+            "speech_active": self.speech_active,
+        }
+
+
+def labelled_lines(streams: list[CaptionStream], key: str) -> str:
+    return "\n".join(f"{stream.label}: {stream.texts[key]}" for stream in streams if stream.texts[key])
+
+
+def run_multi_source_backend(
+    args: argparse.Namespace,
+    state_writer: StateWriter,
+    state: dict,
+    models: ResidentModels,
+    stop_event: threading.Event,
+) -> int:
+    """
+    Captions the microphone and system audio at once with one model. Each
+    source gets its own transcriber; all decodes go through one
+    SharedDecoder. The state carries per-source `streams`, and the flat text
+    fields hold the same text as labelled lines for older readers.
+    """
+    sources = list(SOURCE_LABELS)
+    input_files = [path.strip() for path in args.input_file.split(",")] if args.input_file else [""] * len(sources)
+    if len(input_files) != len(sources):
+        state.update({"status": "error", "message": f"--source both replays one input file per source ({', '.join(sources)})."})
+        state_writer.write(state)
+        return 3
+
+    loaded = load_session_whisper_model(args, state_writer, state, models)
+    if loaded is None:
+        return 2
+    model_path, model, runtime_device = loaded
+
+    audio_sources = []
+    try:
+        for source, input_file in zip(sources, input_files):
+            audio_sources.append(open_audio_source(args, source, input_file))
+        vad_gates = [build_vad_gate(args.vad, args.silence_threshold, args.vad_aggressiveness) for _ in sources]
+    except Exception as error:
+        for audio_source in audio_sources:
+            audio_source.close()
+        print(str(error), file=sys.stderr)
+        state.update({"status": "error", "message": str(error)})
+        state_writer.write(state)
+        return 3
+
+    decoder = SharedDecoder("live-captions-decoder")
+    # One backend (and so one worker process) behind per-stream translators.
+    backend = create_backend(args.translator)
+    history = CaptionHistory(args.history_limit, args.history_max_bytes, args.transcript_file)
+    streams = []
+    for source, audio_source, vad_gate in zip(sources, audio_sources, vad_gates):
+        transcriber = StreamingTranscriber(
+            model,
+            args.language,
+            args.commit_ratio,
+            args.min_buffer_seconds,
+            args.silence_threshold,
+            args.fast_window_seconds,
+        )
+        transcriber.runtime_device = runtime_device
+        if args.mel_cache == "on":
+            transcriber.enable_mel_cache()
+        streams.append(CaptionStream(
+            source, args, audio_source, transcriber, vad_gate, IncrementalTranslator(backend), decoder,
+        ))
+
+    def fall_back_to_cpu() -> None:
+        nonlocal model, runtime_device
+        if runtime_device != "cuda":
+            return
+        model, runtime_device = models.whisper(model_path, force_device="cpu")
+        for stream in streams:
+            stream.transcriber.model = model
+            stream.transcriber.runtime_device = runtime_device
+        state.update({"message": "CUDA failed during decoding, fell back to CPU.", "runtime_device": runtime_device})
+        state_writer.write(state)
+
+    state.update({
+        "status": "running",
+        "message": "Listening to audio…",
+        "runtime_device": runtime_device,
+        "backend_ready": True,
+        "streams": [stream.snapshot() for stream in streams],
+    })
+    state_writer.write(state)
+    for stream in streams:
+        stream.start()
+
+    last_history_version = 0
+    try:
+        while RUNNING and not stop_event.is_set():
+            state_writer.poll()
+            if not all(stream.alive() for stream in streams):
+                print("Audio capture process exited unexpectedly.", file=sys.stderr)
+                state.update({"status": "error", "message": "Audio capture process exited unexpectedly."})
+                state_writer.write(state)
+                return 4
+            if all(stream.ended for stream in streams):
+                break
+
+            now = time.monotonic()
+            changed = False
+            for stream in streams:
+                changed = stream.tick(now, history, fall_back_to_cpu) or changed
+            if not changed and history.version == last_history_version:
+                time.sleep(0.01)
+                continue
+            last_history_version = history.version
+
+            current_text = labelled_lines(streams, "current_text")
+            translated_text = labelled_lines(streams, "translated_text")
+            state.update({
+                "status": "running",
+                "message": "Listening to audio…",
+                "current_text": current_text,
+                "stable_text": current_text,
+                "unstable_text": "",
+                "translated_text": translated_text,
+                "translated_stable_text": translated_text,
+                "translated_unstable_text": "",
+                "source_language": streams[0].transcriber.source_language,
+                "target_language": args.target_language,
+                "history": history.items(),
+                "speech_active": any(stream.speech_active for stream in streams),
+                "runtime_device": runtime_device,
+                "backend_ready": True,
+                "streams": [stream.snapshot() for stream in streams],
+            })
+            state_writer.publish(state)
+    finally:
+        for stream in streams:
+            stream.stop()
+        decoder.stop()
+        for stream in streams:
+            if stream.ended:
+                try:
+                    stream.transcriber.stabilize(final=True)
+                except CaptionRuntimeFallback as error:
+                    print(f"Final caption pass failed ({stream.label}): {error}", file=sys.stderr)
+            stream.add_rolled_history(history)
+            stream.translator.stop(close_backend=False)
+        backend.close()
+        history.close(
+            "\n".join(f"{stream.label}: {text}" for stream in streams if (text := stream.transcriber.committed_text())),
+        )
+
+    if all(stream.ended for stream in streams):
+        for stream in streams:
+            committed_text = stream.transcriber.committed_text()
+            stream.texts.update({"current_text": committed_text, "stable_text": committed_text, "unstable_text": ""})
+        current_text = labelled_lines(streams, "current_text")
+        state.update({
+            "current_text": current_text,
+            "stable_text": current_text,
+            "unstable_text": "",
+            "history": history.items(),
+            "streams": [stream.snapshot() for stream in streams],
+        })
+
+    state.update({"status": "stopped", "message": "Live captions stopped."})
+    state_writer.write(state)
+    return 0
+
+
+def run_session(args: argparse.Namespace, models: ResidentModels, stop_event: threading.Event) -> int:
+    state_writer = StateWriter(
+        Path(args.state_file),
+        Path(args.state_stream) if args.state_stream else None,
+        args.state_max_rate,
+        args.snapshot_interval,
+    )
+    state = build_base_state(args)
+    state_writer.write(state)
+
+    try:
+        if args.backend == "asr":
+            if args.source == "both":
+                state.update({"status": "error", "message": "Captioning both sources needs the Whisper backend."})
+                state_writer.write(state)
+                return 2
+            return run_streaming_asr_backend(args, state_writer, state, models, stop_event)
+        if args.source == "both":
+            if args.preset == "auto":
+                # AdaptivePreset tunes one decode loop; both streams share one decoder and one set of args.
+                state.update({"status": "error", "message": "--preset auto is not supported when captioning both sources."})
+                state_writer.write(state)
+                return 2
+            return run_multi_source_backend(args, state_writer, state, models, stop_event)
+        return run_whisper_backend(args, state_writer, state, models, stop_event)
+    finally:
+        state_writer.close()
+
+
+class CaptionDaemon:
+    """
+    Serves start/stop/reconfigure/status/shutdown requests on a Unix socket,
+    one JSON object per line each way, and runs each caption session on a
+    thread that shares the resident models.
+    """
+
+    def __init__(self, socket_path: str, pid_path: str, idle_unload_seconds: float):
+        self.socket_path = socket_path
+        self.pid_path = Path(pid_path) if pid_path else None
+        self.idle_unload_seconds = idle_unload_seconds
+        self.models = ResidentModels()
+        self._session: threading.Thread | None = None
+        self._session_stop = threading.Event()
+        self._session_argv: list[str] = []
+        self._session_result: int | None = None
+        self._idle_since = time.monotonic()
+        self._shutdown = False
+
+    def serve(self) -> int:
+        Path(self.socket_path).parent.mkdir(parents=True, exist_ok=True)
+        if daemon_is_listening(self.socket_path):
+            print(f"A caption daemon is already listening on {self.socket_path}.", file=sys.stderr)
+            return 1
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.socket_path)
+        server.listen(4)
+        server.settimeout(0.5)
+        print(f"Caption daemon listening on {self.socket_path}.", file=sys.stderr)
+
+        try:
+            while RUNNING and not self._shutdown:
+                try:
+                    connection, _address = server.accept()
+                except socket.timeout:
+                    connection = None
+                if connection is not None:
+                    with connection:
+                        self._handle(connection)
+                self._reap_session()
+                self._unload_if_idle()
+        finally:
+            self._stop_session()
+            server.close()
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+        return 0
+
+    def _handle(self, connection: socket.socket) -> None:
+        connection.settimeout(5.0)
+        try:
+            request = json.loads(connection.makefile("r", encoding="utf-8").readline() or "{}")
+            response = self._dispatch(str(request.get("command") or ""), [str(arg) for arg in request.get("argv") or []])
+        except (OSError, ValueError) as error:
+            response = {"ok": False, "message": str(error)}
+        try:
+            connection.sendall(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+        except OSError:
+            pass
+
+    def _dispatch(self, command: str, argv: list[str]) -> dict:
+        if command == "start":
+            return self._start_session(argv)
+        if command == "reconfigure":
+            # Later options win in argparse, so the new arguments override the running session's.
+            return self._start_session(self._session_argv + argv)
+        if command == "stop":
+            self._stop_session()
+            if self._session is not None:
+                return {"ok": False, "message": "Session is still stopping.", **self._status()}
+            return {"ok": True, "message": "Session stopped.", **self._status()}
+        if command == "status":
+            return {"ok": True, "message": "", **self._status()}
+        if command == "shutdown":
+            self._shutdown = True
+            return {"ok": True, "message": "Shutting down."}
+        return {"ok": False, "message": f"Unknown command '{command}'."}
+
+    def _status(self) -> dict:
+        return {
+            "session": self._session is not None and self._session.is_alive(),
+            "argv": self._session_argv,
+            "models": self.models.loaded(),
+            "last_exit_code": self._session_result,
+        }
+
+    def _start_session(self, argv: list[str]) -> dict:
+        try:
+            session_args = apply_preset(parse_args(argv))
+        except SystemExit:
+            return {"ok": False, "message": "Invalid session arguments."}
+
+        self._stop_session()
+        if self._session is not None:
+            # The old thread ignored the stop request; never run two sessions on the shared models.
+            return {"ok": False, "message": "Previous session is still stopping; try again shortly.", **self._status()}
+        self._session_stop = threading.Event()
+        self._session_argv = argv
+        self._session_result = None
+        stop_event = self._session_stop
+
+        def run() -> None:
+            try:
+                self._session_result = run_session(session_args, self.models, stop_event)
+            except Exception as error:
+                print(f"Caption session failed: {error}", file=sys.stderr)
+                self._session_result = 1
+
+        self._session = threading.Thread(target=run, name="live-captions-session", daemon=True)
+        self._session.start()
+        if self.pid_path is not None:
+            self.pid_path.parent.mkdir(parents=True, exist_ok=True)
+            self.pid_path.write_text(f"{os.getpid()}\n", encoding="utf-8")
+        return {"ok": True, "message": "Session started.", **self._status()}
+
+    def _stop_session(self) -> None:
+        if self._session is None:
+            return
+        self._session_stop.set()
+        self._session.join(timeout=10.0)
+        self._reap_session()
+
+    def _reap_session(self) -> None:
+        if self._session is None or self._session.is_alive():
+            return
+        self._session = None
+        self._idle_since = time.monotonic()
+        if self.pid_path is not None:
+            self.pid_path.unlink(missing_ok=True)
+
+    def _unload_if_idle(self) -> None:
+        if self._session is not None or not self.models.loaded():
+            return
+        if time.monotonic() - self._idle_since >= self.idle_unload_seconds:
+            print("Caption daemon idle, unloading models.", file=sys.stderr)
+            self.models.unload()
+
+
+def daemon_is_listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def send_daemon_command(socket_path: str, command: str, argv: list[str], timeout: float = 15.0) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(socket_path)
+        connection.sendall(json.dumps({"command": command, "argv": argv}).encode("utf-8") + b"\n")
+        return json.loads(connection.makefile("r", encoding="utf-8").readline() or "{}")
+
+
+def spawn_daemon(args: argparse.Namespace) -> None:
+    command = [
+        sys.executable, os.path.abspath(__file__),
+        "--daemon",
+        "--daemon-socket", args.daemon_socket,
+        "--idle-unload-seconds", str(args.idle_unload_seconds),
+    ]
+    if args.pid_file:
+        command += ["--pid-file", args.pid_file]
+    # The daemon inherits stdout/stderr, so it logs wherever the launching command does.
+    subprocess.Popen(command, stdin=subprocess.DEVNULL, start_new_session=True)
+
+    deadline = time.monotonic() + 10.0
+    while time.monotonic() < deadline:
+        if daemon_is_listening(args.daemon_socket):
+            return
+        time.sleep(0.05)
+    raise RuntimeError(f"Caption daemon did not come up on {args.daemon_socket}.")
+
+
+def run_daemon_command(args: argparse.Namespace, argv: list[str]) -> int:
+    try:
+        if args.daemon_command == "start" and not daemon_is_listening(args.daemon_socket):
+            spawn_daemon(args)
+        response = send_daemon_command(args.daemon_socket, args.daemon_command, argv)
+    except (OSError, RuntimeError, ValueError) as error:
+        print(f"Caption daemon {args.daemon_command} failed: {error}", file=sys.stderr)
+        return 1
+    print(json.dumps(response, ensure_ascii=False))
+    return 0 if response.get("ok") else 1
+
+
+def main() -> int:
+    argv = sys.argv[1:]
+    args = parse_args(argv)
+    if args.daemon_command:
+        return run_daemon_command(args, argv)
+    if args.daemon:
+        return CaptionDaemon(args.daemon_socket, args.pid_file, args.idle_unload_seconds).serve()
+    return run_session(apply_preset(args), ResidentModels(), threading.Event())
+
+
 if __name__ == "__main__":
     sys.exit(main())
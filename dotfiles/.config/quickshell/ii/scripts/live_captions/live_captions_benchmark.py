@@ -0,0 +1,879 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import live_captions as lc  # noqa: E402
+
+
+def synthetic_pcm_chunks(count: int, chunk_bytes: int = 1024) -> list[bytes]:
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal(count * chunk_bytes // 2) * 3000).astype(np.int16)
+    raw = samples.tobytes()
+    return [raw[i:i + chunk_bytes] for i in range(0, len(raw), chunk_bytes)]
+
+
+class ConcatenateAudioStore:
+    """The previous per-chunk np.concatenate store, kept for comparison."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.audio = np.zeros(0, dtype=np.float32)
+
+    def extend_pcm(self, pcm_bytes: bytes) -> None:
+        self.audio = np.concatenate([self.audio, lc.pcm_to_float(pcm_bytes)])
+        if len(self.audio) > self.capacity:
+            self.audio = self.audio[-self.capacity:]
+
+    def view(self, last_samples: int | None = None) -> np.ndarray:
+        return self.audio if last_samples is None else self.audio[-last_samples:]
+
+
+def measure_store(store, chunks: list[bytes], fast_window_samples: int) -> tuple[float, float]:
+    # Warm up so the buffer is full and we measure the steady state.
+    for chunk in chunks:
+        store.extend_pcm(chunk)
+
+    started = time.perf_counter()
+    for chunk in chunks:
+        store.extend_pcm(chunk)
+        lc.audio_rms(store.view(fast_window_samples))
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    before, _peak = tracemalloc.get_traced_memory()
+    allocated = 0
+    for chunk in chunks:
+        store.extend_pcm(chunk)
+        lc.audio_rms(store.view(fast_window_samples))
+        current, peak = tracemalloc.get_traced_memory()
+        allocated += max(0, peak - before)
+        tracemalloc.reset_peak()
+        before = current
+    tracemalloc.stop()
+    return elapsed / len(chunks) * 1e6, allocated / len(chunks)
+
+
+def bench_ring_buffer(args: argparse.Namespace) -> int:
+    capacity = lc.StreamingTranscriber.MAX_BUFFER_SAMPLES
+    chunk_samples = 512
+    count = max(args.chunks, capacity // chunk_samples * 2)
+    chunks = synthetic_pcm_chunks(count)
+    fast_window_samples = int(lc.PRESET_DEFAULTS["realtime"]["fast_window_seconds"] * lc.SAMPLE_RATE)
+
+    print(f"{count} chunks of {chunk_samples} samples, {lc.MAX_BUFFER_SECS:.0f} s rolling buffer")
+    for name, store in (
+        ("concatenate", ConcatenateAudioStore(capacity)),
+        ("ring buffer", lc.AudioRingBuffer(capacity)),
+    ):
+        micros, allocated = measure_store(store, chunks, fast_window_samples)
+        print(f"  {name:<12} {micros:8.2f} us/chunk  {allocated / 1024:8.2f} KiB allocated/chunk")
+    return 0
+
+
+class SleepingWhisperModel:
+    """
+    Stand-in for WhisperModel whose decode cost grows with the audio length.
+    time.sleep releases the GIL the way CTranslate2 does, so threads overlap
+    just like they would with the real model.
+    """
+
+    def __init__(self, seconds_per_audio_second: float, word_timestamp_factor: float):
+        self.seconds_per_audio_second = seconds_per_audio_second
+        self.word_timestamp_factor = word_timestamp_factor
+
+    def transcribe(self, audio, word_timestamps=False, **_kwargs):
+        duration = len(audio) / lc.SAMPLE_RATE
+        cost = duration * self.seconds_per_audio_second
+        if word_timestamps:
+            cost *= self.word_timestamp_factor
+        time.sleep(cost)
+        words = [
+            SimpleNamespace(start=i * 0.4, end=i * 0.4 + 0.3, word=f" word{i}")
+            for i in range(int(duration / 0.4))
+        ]
+        segment = SimpleNamespace(text="".join(w.word for w in words), words=words)
+        return iter([segment]), SimpleNamespace(language="en")
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def run_decode_loop(transcriber, preset: dict, seconds: float, threaded: bool) -> list[float]:
+    """Feeds paced audio and returns how late each partial result arrived."""
+    chunk_samples = 512
+    rng = np.random.default_rng(0)
+    step, stabilize = preset["step_seconds"], preset["stabilize_seconds"]
+    started = time.monotonic()
+    fed_samples = 0
+    last_fast_tick = last_stable_tick = started
+    latencies: list[float] = []
+
+    partial_worker = stabilizer_worker = None
+    if threaded:
+        partial_worker = lc.DecodeWorker("bench-partial", transcriber.fast_partial)
+        stabilizer_worker = lc.DecodeWorker("bench-stabilizer", transcriber.stabilize)
+
+    try:
+        while time.monotonic() - started < seconds:
+            # Everything the capture pipe would have produced by now.
+            due_samples = int((time.monotonic() - started) * lc.SAMPLE_RATE)
+            while fed_samples + chunk_samples <= due_samples:
+                transcriber.feed((rng.standard_normal(chunk_samples) * 0.1).astype(np.float32))
+                fed_samples += chunk_samples
+
+            now = time.monotonic()
+            if threaded:
+                if now - last_fast_tick >= step:
+                    partial_worker.submit()
+                    last_fast_tick = now
+                if now - last_stable_tick >= stabilize:
+                    stabilizer_worker.submit()
+                    last_stable_tick = now
+                has_partial, _partial = partial_worker.take_result()
+                if has_partial:
+                    latencies.append(partial_worker.last_latency)
+                stabilizer_worker.take_result()
+                time.sleep(chunk_samples / lc.SAMPLE_RATE / 4)
+                continue
+
+            if now - last_fast_tick >= step:
+                due_at = last_fast_tick + step
+                transcriber.fast_partial()
+                latencies.append(time.monotonic() - due_at)
+                last_fast_tick = now
+            if now - last_stable_tick >= stabilize:
+                transcriber.stabilize()
+                last_stable_tick = now
+            time.sleep(chunk_samples / lc.SAMPLE_RATE / 4)
+    finally:
+        if threaded:
+            partial_worker.stop()
+            stabilizer_worker.stop()
+    return latencies
+
+
+def bench_decode_workers(args: argparse.Namespace) -> int:
+    preset = lc.PRESET_DEFAULTS[args.preset]
+    print(
+        f"{args.seconds:.0f} s of paced audio, preset {args.preset}, "
+        f"{args.decode_cost:.3f} s decode per audio second (x{args.word_timestamp_factor:g} with word timestamps)"
+    )
+    for name, threaded in (("sequential", False), ("threaded", True)):
+        model = SleepingWhisperModel(args.decode_cost, args.word_timestamp_factor)
+        transcriber = lc.StreamingTranscriber(
+            model,
+            "en",
+            preset["commit_ratio"],
+            preset["min_buffer_seconds"],
+            0.0,
+            preset["fast_window_seconds"],
+        )
+        latencies = run_decode_loop(transcriber, preset, args.seconds, threaded)
+        print(
+            f"  {name:<10} {len(latencies) / args.seconds:6.1f} partials/s  "
+            f"latency p50 {statistics.median(latencies) * 1000 if latencies else 0:7.1f} ms  "
+            f"p95 {percentile(latencies, 0.95) * 1000:7.1f} ms  "
+            f"max {max(latencies, default=0) * 1000:7.1f} ms"
+        )
+    return 0
+
+
+def bench_vad(args: argparse.Namespace) -> int:
+    preset = lc.PRESET_DEFAULTS[args.preset]
+    chunk_bytes = 1024
+    print(f"VAD {args.vad}, preset {args.preset}")
+    for path in args.wav:
+        pcm = lc.read_pcm_file(path)
+        duration = len(pcm) / 2 / lc.SAMPLE_RATE
+        gate = lc.build_vad_gate(args.vad, preset["silence_threshold"], args.aggressiveness)
+        voiced_bytes = 0
+        segments = 0
+        gated_ticks = 0
+        last_tick = 0.0
+        cpu_started = time.process_time()
+        for offset in range(0, len(pcm), chunk_bytes):
+            voiced, ended = gate.process(pcm[offset:offset + chunk_bytes])
+            voiced_bytes += len(voiced)
+            segments += int(ended)
+            position = (offset + chunk_bytes) / 2 / lc.SAMPLE_RATE
+            if position - last_tick >= preset["step_seconds"]:
+                gated_ticks += int(gate.active)
+                last_tick = position
+        cpu_seconds = time.process_time() - cpu_started
+        ungated_ticks = int(duration / preset["step_seconds"])
+        print(
+            f"  {Path(path).name}: {duration:.1f} s audio, {voiced_bytes / 2 / lc.SAMPLE_RATE:.1f} s voiced, "
+            f"{segments} segments, decode passes {gated_ticks}/{ungated_ticks}, "
+            f"VAD cost {cpu_seconds / max(duration, 1e-9) * 1000:.2f} ms CPU per audio second"
+        )
+    return 0
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    ref = [lc.comparable_word(word) for word in lc.normalized_words(reference)]
+    hyp = [lc.comparable_word(word) for word in lc.normalized_words(hypothesis)]
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def speech_onset_seconds(pcm: bytes, silence_threshold: float) -> float:
+    audio = lc.pcm_to_float(pcm)
+    frame = 480
+    for offset in range(0, len(audio) - frame + 1, frame):
+        if lc.audio_rms(audio[offset:offset + frame]) >= silence_threshold:
+            return offset / lc.SAMPLE_RATE
+    return 0.0
+
+
+class StateRecorder:
+    """Replaces live_captions.write_state and keeps every state the backend emits."""
+
+    def __init__(self):
+        self.events: list[tuple[float, dict]] = []
+
+    def __call__(self, _path: Path, payload: dict) -> None:
+        self.events.append((time.monotonic(), dict(payload)))
+
+
+def run_replay(args: argparse.Namespace, wav: str, preset: str, mel_cache: str = "on") -> tuple[list[tuple[float, dict]], float]:
+    recorder = StateRecorder()
+    argv = [
+        "live_captions.py",
+        "--state-file", str(Path(tempfile.gettempdir()) / "live-captions-benchmark.json"),
+        "--backend", args.backend,
+        "--preset", preset,
+        "--display-mode", "captions",
+        "--language", args.language,
+        "--model", args.model,
+        "--model-cache-dir", args.model_cache_dir,
+        "--vad", args.vad,
+        "--input-file", wav,
+        "--input-speed", str(args.speed),
+        "--state-max-rate", "0",
+        "--mel-cache", mel_cache,
+    ]
+    original_write_state, original_argv = lc.write_state, sys.argv
+    lc.write_state, sys.argv = recorder, argv
+    lc.RUNNING = True
+    cpu_started = time.process_time()
+    try:
+        exit_code = lc.main()
+    finally:
+        lc.write_state, sys.argv = original_write_state, original_argv
+    cpu_seconds = time.process_time() - cpu_started
+    if exit_code != 0:
+        message = recorder.events[-1][1].get("message", "") if recorder.events else ""
+        raise RuntimeError(f"live_captions exited with {exit_code}: {message}")
+    return recorder.events, cpu_seconds
+
+
+def replay_metrics(events: list[tuple[float, dict]], onset: float, speed: float) -> dict:
+    running = [t for t, payload in events if payload.get("status") == "running"]
+    started_at = running[0] if running else events[0][0]
+
+    def audio_time(t: float) -> float:
+        return (t - started_at) * speed
+
+    first_word = None
+    shown_at: list[float] = []
+    committed_at: list[float] = []
+    revisions = 0
+    previous_unstable: list[str] = []
+
+    for t, payload in events:
+        if payload.get("status") != "running":
+            continue
+        shown = lc.normalized_words(payload.get("current_text", ""))
+        stable = lc.normalized_words(payload.get("stable_text", ""))
+        unstable = [lc.comparable_word(word) for word in lc.normalized_words(payload.get("unstable_text", ""))]
+        if shown and first_word is None:
+            first_word = audio_time(t)
+        while len(shown_at) < len(shown):
+            shown_at.append(audio_time(t))
+        while len(committed_at) < min(len(stable), len(shown_at)):
+            committed_at.append(audio_time(t))
+        if previous_unstable and unstable[:len(previous_unstable)] != previous_unstable:
+            revisions += 1
+        previous_unstable = unstable
+
+    commit_latencies = [committed - shown_at[i] for i, committed in enumerate(committed_at)]
+    if speed <= 0:
+        # Unpaced replays have no meaningful timeline.
+        first_word, commit_latencies = None, []
+    return {
+        "first_word_latency": None if first_word is None else max(0.0, first_word - onset),
+        "commit_latency_p50": statistics.median(commit_latencies) if commit_latencies else None,
+        "commit_latency_p95": percentile(commit_latencies, 0.95) if commit_latencies else None,
+        "revisions": revisions,
+        "final_text": events[-1][1].get("stable_text", "") if events else "",
+    }
+
+
+def format_seconds(value: float | None) -> str:
+    return "   n/a" if value is None else f"{value * 1000:6.0f}"
+
+
+def bench_replay(args: argparse.Namespace) -> int:
+    presets = args.presets or list(lc.PRESET_DEFAULTS)
+    for wav in args.wav:
+        pcm = lc.read_pcm_file(wav)
+        duration = len(pcm) / 2 / lc.SAMPLE_RATE
+        reference_path = Path(args.reference) if args.reference else Path(wav).with_suffix(".txt")
+        reference = reference_path.read_text(encoding="utf-8") if reference_path.is_file() else None
+        print(f"{Path(wav).name}: {duration:.1f} s, backend {args.backend}, speed {args.speed:g}x")
+        print("  preset      mel  first-word ms  commit p50 ms  commit p95 ms  revisions/s  CPU s/audio s     WER")
+        mel_settings = ["off", "on"] if args.mel_cache == "both" else [args.mel_cache]
+        for preset in presets:
+            for mel_cache in mel_settings:
+                events, cpu_seconds = run_replay(args, wav, preset, mel_cache)
+                onset = speech_onset_seconds(pcm, lc.PRESET_DEFAULTS[preset]["silence_threshold"])
+                metrics = replay_metrics(events, onset, args.speed)
+                wer = "   n/a" if reference is None else f"{word_error_rate(reference, metrics['final_text']):6.3f}"
+                print(
+                    f"  {preset:<10}  {mel_cache:<3}  {format_seconds(metrics['first_word_latency']):>13}  "
+                    f"{format_seconds(metrics['commit_latency_p50']):>13}  "
+                    f"{format_seconds(metrics['commit_latency_p95']):>13}  "
+                    f"{metrics['revisions'] / duration:11.2f}  {cpu_seconds / duration:14.3f}  {wer}"
+                )
+    return 0
+
+
+class ReferenceFeatureExtractor:
+    """Whisper's log-mel front end in numpy, for machines without faster-whisper installed."""
+
+    def __init__(self, n_mels: int = 80):
+        self.n_fft = 400
+        self.hop_length = 160
+        self.sampling_rate = lc.SAMPLE_RATE
+        self.n_samples = 30 * lc.SAMPLE_RATE
+        self.nb_max_frames = self.n_samples // self.hop_length
+        # Triangular filters on a linear grid; the exact bank does not change the cost or the equivalence check.
+        bins = self.n_fft // 2 + 1
+        centres = np.linspace(0, bins - 1, n_mels + 2)
+        grid = np.arange(bins)
+        self.mel_filters = np.maximum(0.0, 1.0 - np.abs(grid[None, :] - centres[1:-1, None]) / (centres[1] - centres[0]))
+
+    def __call__(self, waveform: np.ndarray, padding: int = 160, chunk_length: int | None = None):
+        waveform = np.pad(np.asarray(waveform, dtype=np.float32), (0, padding))
+        padded = np.pad(waveform, self.n_fft // 2, mode="reflect")
+        frames = np.lib.stride_tricks.sliding_window_view(padded, self.n_fft)[::self.hop_length]
+        spectrum = np.fft.rfft(frames * np.hanning(self.n_fft + 1)[:-1], axis=1)[:-1]
+        power = np.abs(spectrum) ** 2
+        log_spec = np.log10(np.clip(self.mel_filters @ power.T, 1e-10, None))
+        log_spec = np.maximum(log_spec, log_spec.max() - 8.0)
+        return (log_spec + 4.0) / 4.0
+
+
+def mel_feature_extractor():
+    try:
+        from faster_whisper.feature_extractor import FeatureExtractor
+    except ImportError:
+        return ReferenceFeatureExtractor(), "numpy reference"
+    return FeatureExtractor(), "faster-whisper"
+
+
+def bench_mel(args: argparse.Namespace) -> int:
+    """Feeds audio through the fast/stabilize window schedule and times the feature front end."""
+    preset = lc.PRESET_DEFAULTS[args.preset]
+    extractor, extractor_name = mel_feature_extractor()
+    if not lc.IncrementalMelExtractor.supports(extractor):
+        print(f"{extractor_name} feature extractor has no hop-padded call; the mel cache does not apply")
+        return 1
+    incremental = lc.IncrementalMelExtractor(extractor)
+    hop = incremental.hop_length
+
+    if args.wav:
+        audio = lc.pcm_to_float(lc.read_pcm_file(args.wav))
+    else:
+        rng = np.random.default_rng(0)
+        audio = (rng.standard_normal(int(args.seconds * lc.SAMPLE_RATE)) * 0.05).astype(np.float32)
+    buffer = lc.AudioRingBuffer(lc.StreamingTranscriber.MAX_BUFFER_SAMPLES)
+    cache = incremental.new_cache(lc.StreamingTranscriber.MAX_BUFFER_SAMPLES)
+    step = int(preset["step_seconds"] * lc.SAMPLE_RATE)
+    fast_window = int(preset["fast_window_seconds"] * lc.SAMPLE_RATE)
+    stabilize_every = max(1, round(preset["stabilize_seconds"] / preset["step_seconds"]))
+    # Stabilize trims the buffer to a few seconds behind the newest audio, as committed words leave it.
+    keep = int(args.buffer_seconds * lc.SAMPLE_RATE)
+
+    full_seconds = cached_seconds = 0.0
+    max_difference = 0.0
+    passes = 0
+    for tick, offset in enumerate(range(step, len(audio) + 1, step), start=1):
+        buffer.extend(audio[offset - step:offset])
+        windows = [fast_window]
+        if tick % stabilize_every == 0:
+            windows.append(None)
+            buffer.drop_until(buffer.start_index + max(0, len(buffer) - keep))
+        for last_samples in windows:
+            window, start_index = buffer.window(last_samples, align=hop)
+            if len(window) < 2 * incremental.n_fft:
+                continue
+            started = time.process_time()
+            expected = extractor(window)
+            full_seconds += time.process_time() - started
+            started = time.process_time()
+            with incremental.stream_window(cache, start_index):
+                features = incremental(window)
+            cached_seconds += time.process_time() - started
+            max_difference = max(max_difference, float(np.max(np.abs(np.asarray(expected) - features))))
+            passes += 1
+
+    duration = len(audio) / lc.SAMPLE_RATE
+    lookups = cache.hits + cache.misses
+    print(f"{extractor_name} features, preset {args.preset}, {duration:.1f} s of audio, {passes} passes")
+    print(f"  full extractor    {full_seconds / duration * 1000:8.2f} CPU ms per audio s")
+    print(f"  cached frames     {cached_seconds / duration * 1000:8.2f} CPU ms per audio s")
+    print(f"  frame hit rate    {cache.hits / lookups if lookups else 0.0:8.3f}")
+    print(f"  max |difference|  {max_difference:8.2e}")
+    return 0
+
+
+def synthetic_transcript_words(count: int, seed: int = 0) -> list[str]:
+    rng = np.random.default_rng(seed)
+    # Wide enough that the legacy whole-text unique-word ratio check never fires.
+    vocabulary = [f"word{i}" for i in range(50000)]
+    words = []
+    for i, index in enumerate(rng.integers(0, len(vocabulary), count)):
+        word = vocabulary[index]
+        words.append(f"{word}." if i % 12 == 11 else word)
+    return words
+
+
+class LegacyCommittedWords:
+    """The previous list-of-strings committed text, re-cleaned on every append."""
+
+    def __init__(self, words: list[str]):
+        self.committed_words = list(words)
+
+    def append(self, new_words: list[str]) -> None:
+        for word in new_words:
+            normalized = lc.normalize_text(word)
+            if not normalized:
+                continue
+            if self.committed_words:
+                if lc.comparable_word(self.committed_words[-1]) == lc.comparable_word(normalized):
+                    run = 1
+                    for previous in reversed(self.committed_words[:-1]):
+                        if lc.comparable_word(previous) != lc.comparable_word(normalized):
+                            break
+                        run += 1
+                    if run >= 2:
+                        continue
+            self.committed_words.append(normalized)
+        committed_text = lc.clean_transcript_text(" ".join(self.committed_words))
+        self.committed_words = lc.normalized_words(committed_text)
+
+    def tick(self, partial: str) -> tuple:
+        committed_words = list(self.committed_words)
+        _stable_preview, unstable_text = lc.split_display_text(committed_words, partial)
+        stable_text = " ".join(committed_words)
+        display_text = lc.merge_continuous_text(stable_text, unstable_text)
+        finished, remainder = lc.split_sentences(stable_text)
+        return display_text, finished[-lc.MAX_TRANSLATED_SEGMENTS:], remainder
+
+    def payload_bytes(self) -> int:
+        return len(json.dumps({"stable_text": " ".join(self.committed_words), "history": []}))
+
+
+class TokenCommittedWords:
+    def __init__(self):
+        self.transcriber = lc.StreamingTranscriber(None, "en")
+        self.history = lc.CaptionHistory(8, 8192)
+
+    def append(self, new_words: list[str]) -> None:
+        with self.transcriber._lock:
+            self.transcriber._append_committed_words(new_words)
+        for group in self.transcriber.take_rolled_sentences():
+            self.history.add(" ".join(group))
+
+    def payload_bytes(self) -> int:
+        return len(json.dumps({"stable_text": self.transcriber.committed_text(), "history": self.history.items()}))
+
+    def tick(self, partial: str) -> tuple:
+        display_text, _stable_text, unstable_text, _count = self.transcriber.texts(partial)
+        return display_text, self.transcriber.translation_parts(display_text, unstable_text)
+
+
+def time_rounds(store, words: list[str], rounds: int, ticks_per_commit: int) -> tuple[float, float]:
+    """Alternates a two-word commit with display ticks; returns (us per commit, us per tick)."""
+    commit_seconds = 0.0
+    tick_seconds = 0.0
+    for i in range(rounds):
+        batch = words[2 * i:2 * i + 2]
+        started = time.perf_counter()
+        store.append(batch)
+        commit_seconds += time.perf_counter() - started
+        partial = " ".join(words[2 * i + 2:2 * i + 8])
+        started = time.perf_counter()
+        for _ in range(ticks_per_commit):
+            store.tick(partial)
+        tick_seconds += time.perf_counter() - started
+    return commit_seconds / rounds * 1e6, tick_seconds / (rounds * ticks_per_commit) * 1e6
+
+
+def bench_stabilizer(args: argparse.Namespace) -> int:
+    total_words = int(args.minutes * args.words_per_minute)
+    checkpoints = sorted({0, *range(args.step_minutes, int(args.minutes) + 1, args.step_minutes)})
+    words = synthetic_transcript_words(total_words + args.rounds * 2 + 8)
+    token_store = TokenCommittedWords()
+    grown = 0
+
+    print(f"{args.minutes:g} min at {args.words_per_minute} words/min, {args.rounds} commits x {args.ticks} ticks per checkpoint")
+    print("  minute   words   legacy commit us  legacy tick us  legacy bytes   token commit us  token tick us  token bytes")
+    for minute in checkpoints:
+        target = min(total_words, int(minute * args.words_per_minute))
+        # The token store grows through real appends; the legacy store is seeded with the same words.
+        while grown < target:
+            token_store.append(words[grown:grown + 2])
+            grown += 2
+        probe = words[total_words:]
+        legacy_store = LegacyCommittedWords(words[:target])
+        legacy_commit, legacy_tick = time_rounds(legacy_store, probe, args.rounds, args.ticks)
+        token_commit, token_tick = time_rounds(token_store, probe, args.rounds, args.ticks)
+        print(
+            f"  {minute:6d}  {target:6d}  {legacy_commit:16.1f}  {legacy_tick:14.1f}  {legacy_store.payload_bytes():12d}  "
+            f"{token_commit:16.1f}  {token_tick:13.1f}  {token_store.payload_bytes():11d}"
+        )
+    return 0
+
+
+def legacy_clean_transcript_text(text: str, phrases: list[str]) -> str:
+    """The previous word and phrase loops plus a substring test per hallucination phrase."""
+    words = lc.normalized_words(text)
+    collapsed: list[str] = []
+    previous_key = ""
+    run_length = 0
+    for word in words:
+        key = lc.comparable_word(word)
+        if key and key == previous_key:
+            run_length += 1
+        else:
+            previous_key = key
+            run_length = 1
+        if run_length <= 2:
+            collapsed.append(word)
+    keys = [lc.comparable_word(word) for word in collapsed if lc.comparable_word(word)]
+    if len(keys) >= 6 and len(set(keys)) / len(keys) <= 0.34:
+        deduped: list[str] = []
+        seen: set[str] = set()
+        for word in collapsed:
+            key = lc.comparable_word(word)
+            if not key or key in seen:
+                continue
+            deduped.append(word)
+            seen.add(key)
+        collapsed = deduped[:4]
+
+    words = collapsed
+    if len(words) >= 4:
+        collapsed = []
+        i = 0
+        while i < len(words):
+            for size in range(min(4, (len(words) - i) // 2), 1, -1):
+                phrase = [lc.comparable_word(word) for word in words[i:i + size]]
+                if phrase == [lc.comparable_word(word) for word in words[i + size:i + size * 2]]:
+                    collapsed.extend(words[i:i + size])
+                    i += size * 2
+                    break
+            else:
+                collapsed.append(words[i])
+                i += 1
+
+    cleaned = " ".join(collapsed)
+    normalized_lower = lc.comparable_word(cleaned)
+    if any(phrase in normalized_lower for phrase in phrases):
+        return ""
+    return cleaned
+
+
+def repetitive_texts(count: int, words: int, seed: int = 0) -> list[str]:
+    """Caption-like texts from a small vocabulary with stutters and doubled phrases mixed in."""
+    rng = np.random.default_rng(seed)
+    vocabulary = ["the", "we", "should", "ship", "it", "today,", "really", "okay.", "so", "build", "Failed", "again"]
+    vocabulary += [f"word{i}" for i in range(48)]
+    texts = []
+    for _ in range(count):
+        out: list[str] = []
+        while len(out) < words:
+            choice = rng.random()
+            if choice < 0.15 and out:
+                out.extend(out[-int(rng.integers(1, 5)):])
+            elif choice < 0.25 and out:
+                out.extend([out[-1]] * int(rng.integers(1, 4)))
+            else:
+                out.append(vocabulary[int(rng.integers(len(vocabulary)))])
+        texts.append(" ".join(out[:words]))
+    return texts
+
+
+def bench_filter(args: argparse.Namespace) -> int:
+    base_phrases = ["copyright wdr 2021", "copyright wdr mediagroup digital gmbh"]
+    texts = repetitive_texts(args.texts, args.words)
+
+    engine = lc.CaptionFilter(base_phrases, [])
+    mismatches = sum(1 for text in texts if engine.clean(text) != legacy_clean_transcript_text(text, base_phrases))
+    print(f"{len(texts)} texts of {args.words} words: {mismatches} differ from the previous filter")
+
+    # Rules in scripts without spaces, or ending in non-ASCII punctuation, from hallucinations.json.
+    cjk_cases = [
+        ("ご視聴ありがとうございました。", ""),
+        ("「ご視聴ありがとうございました」", ""),
+        ("今日はご視聴ありがとうございました。明日も来てね", "今日はご視聴ありがとうございました。明日も来てね"),
+        ("字幕by索兰娅", ""),
+        ("这是一个测试。字幕by索兰娅。", ""),
+        ("请不吝点赞订阅转发打赏支持明镜与点点栏目", ""),
+        ("今天天气很好。", "今天天气很好。"),
+    ]
+    rules = lc.caption_filter("auto")
+    wrong = [text for text, expected in cjk_cases if rules.clean(text) != expected]
+    print(f"{len(cjk_cases)} CJK hallucination cases: {len(wrong)} wrong" + (f" ({', '.join(wrong)})" if wrong else ""))
+
+    print("  rules    legacy us/text   engine us/text")
+    for rule_count in args.rules:
+        phrases = base_phrases + [f"subtitles by studio{i} for channel{i}" for i in range(max(0, rule_count - 2))]
+        engine = lc.CaptionFilter(phrases, [])
+        timings = []
+        for clean in (lambda text: legacy_clean_transcript_text(text, phrases), engine.clean):
+            started = time.perf_counter()
+            for text in texts:
+                clean(text)
+            timings.append((time.perf_counter() - started) / len(texts) * 1e6)
+        print(f"  {len(phrases):5d}  {timings[0]:15.1f}  {timings[1]:15.1f}")
+    return 0
+
+
+class ScriptedRecognizer:
+    """
+    Stand-in for KaldiRecognizer that speaks Vosk's JSON: the partial grows
+    by one word every few chunks and becomes a final result after a few
+    words, so the caption loop sees the same repeat pattern as live audio
+    without paying for Kaldi.
+    """
+
+    def __init__(self, chunks_per_word: int, words_per_utterance: int):
+        self.chunks_per_word = chunks_per_word
+        self.words_per_utterance = words_per_utterance
+        self.words = synthetic_transcript_words(4096)
+        self.chunk = 0
+        self.spoken = 0
+        self.utterance: list[str] = []
+
+    def AcceptWaveform(self, _pcm: bytes) -> bool:
+        self.chunk += 1
+        if self.chunk % self.chunks_per_word:
+            return False
+        self.utterance.append(self.words[self.spoken % len(self.words)].rstrip("."))
+        self.spoken += 1
+        return len(self.utterance) >= self.words_per_utterance
+
+    def Result(self) -> str:
+        text, self.utterance = " ".join(self.utterance), []
+        return json.dumps({"text": text}, indent=2)
+
+    def PartialResult(self) -> str:
+        return json.dumps({"partial": " ".join(self.utterance)}, indent=2)
+
+    def FinalResult(self) -> str:
+        return self.Result()
+
+
+class LegacyVoskTranscriber(lc.VoskStreamingTranscriber):
+    """The previous per-chunk Vosk path: parse, clean, join, count and RMS on every chunk."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.recent_audio = lc.AudioRingBuffer(self.RECENT_AUDIO_SAMPLES)
+
+    def feed(self, pcm_bytes: bytes) -> bool:
+        self.recent_audio.extend_pcm(pcm_bytes)
+        if self.recognizer.AcceptWaveform(pcm_bytes):
+            result = json.loads(self.recognizer.Result() or "{}")
+            final_text = lc.clean_transcript_text(result.get("text", ""))
+            if final_text:
+                self._append_committed_segment(final_text)
+            self.partial_text = ""
+            return True
+        result = json.loads(self.recognizer.PartialResult() or "{}")
+        partial = lc.clean_transcript_text(result.get("partial", ""))
+        if partial and self.committed_segments:
+            partial = lc.strip_committed_overlap(self.committed_segments[-1], partial)
+            partial = lc.clean_transcript_text(partial)
+        self.partial_text = partial
+        return True
+
+    def speech_active(self) -> bool:
+        if len(self.recent_audio) == 0:
+            return False
+        return lc.audio_rms(self.recent_audio.view()) >= self.silence_threshold
+
+    def texts(self) -> tuple[str, str, str]:
+        stable_text = "\n".join(self.committed_segments)
+        unstable_text = lc.normalize_text(self.partial_text)
+        display_text = stable_text
+        if unstable_text:
+            display_text = f"{stable_text}\n{unstable_text}".strip() if stable_text else unstable_text
+        return display_text, stable_text, unstable_text
+
+    def committed_word_count(self) -> int:
+        return sum(len(lc.normalized_words(segment)) for segment in self.committed_segments)
+
+
+def drive_vosk_loop(transcriber, chunks: list[bytes]) -> tuple[float, int]:
+    """The per-chunk work of run_streaming_asr_backend in captions mode; returns (seconds, publishes)."""
+    last = ("", 0)
+    publishes = 0
+    started = time.perf_counter()
+    for chunk in chunks:
+        if not transcriber.feed(chunk):
+            continue
+        transcriber.take_rolled_segments()
+        display_text, stable_text, unstable_text = transcriber.texts()
+        transcriber.speech_active()
+        current = (display_text, transcriber.committed_word_count())
+        if current == last:
+            continue
+        last = current
+        publishes += 1
+    return time.perf_counter() - started, publishes
+
+
+def bench_vosk(args: argparse.Namespace) -> int:
+    if args.wav:
+        pcm = lc.read_pcm_file(args.wav)
+    else:
+        pcm = b"".join(synthetic_pcm_chunks(int(args.seconds * lc.SAMPLE_RATE * 2 / 1024) + 1))
+    chunks = [pcm[i:i + 4096] for i in range(0, len(pcm), 4096)]
+    duration = len(pcm) / 2 / lc.SAMPLE_RATE
+
+    if args.vosk_model:
+        from vosk import KaldiRecognizer, Model
+
+        model = Model(args.vosk_model)
+
+        def recognizer():
+            kaldi = KaldiRecognizer(model, lc.SAMPLE_RATE)
+            kaldi.SetWords(True)
+            return kaldi
+
+        recognizer_name = "vosk"
+    else:
+        def recognizer():
+            return ScriptedRecognizer(args.chunks_per_word, args.words_per_utterance)
+
+        recognizer_name = f"scripted recognizer, a word every {args.chunks_per_word} chunks"
+
+    print(f"{len(chunks)} chunks of 4096 bytes ({duration:.1f} s), {recognizer_name}")
+    print("  path          chunks/s   us/chunk  publishes")
+    for name, factory in (("per chunk", LegacyVoskTranscriber), ("on change", lc.VoskStreamingTranscriber)):
+        best = None
+        for _ in range(args.rounds):
+            transcriber = factory(None, "en", recognizer=recognizer())
+            seconds, publishes = drive_vosk_loop(transcriber, chunks)
+            best = seconds if best is None else min(best, seconds)
+        print(f"  {name:<12}  {len(chunks) / best:9.0f}  {best / len(chunks) * 1e6:8.2f}  {publishes:9d}")
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarks for the live captions backend.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ring = subparsers.add_parser("ring-buffer", help="Per-chunk cost of the rolling audio store")
+    ring.add_argument("--chunks", type=int, default=2000)
+    ring.set_defaults(handler=bench_ring_buffer)
+
+    workers = subparsers.add_parser("decode-workers", help="Partial caption latency with inline vs threaded decoding")
+    workers.add_argument("--preset", choices=sorted(lc.PRESET_DEFAULTS), default="realtime")
+    workers.add_argument("--seconds", type=float, default=8.0)
+    workers.add_argument("--decode-cost", type=float, default=0.04, help="Decode seconds per audio second")
+    workers.add_argument("--word-timestamp-factor", type=float, default=2.5)
+    workers.set_defaults(handler=bench_decode_workers)
+
+    vad = subparsers.add_parser("vad", help="Replay WAV files through the VAD gate")
+    vad.add_argument("wav", nargs="+")
+    vad.add_argument("--vad", choices=["energy", "webrtc", "silero"], default="energy")
+    vad.add_argument("--aggressiveness", type=int, choices=[0, 1, 2, 3], default=2)
+    vad.add_argument("--preset", choices=sorted(lc.PRESET_DEFAULTS), default="realtime")
+    vad.set_defaults(handler=bench_vad)
+
+    replay = subparsers.add_parser("replay", help="Replay WAV files through the backend for every preset")
+    replay.add_argument("wav", nargs="+")
+    replay.add_argument("--reference", default="", help="Reference transcript (default: <wav>.txt next to the file)")
+    replay.add_argument("--presets", nargs="*", choices=sorted(lc.PRESET_DEFAULTS))
+    replay.add_argument("--backend", choices=["whisper", "asr"], default="whisper")
+    replay.add_argument("--model", default="tiny")
+    replay.add_argument("--model-cache-dir", default="")
+    replay.add_argument("--language", default="auto")
+    replay.add_argument("--vad", choices=["off", "energy", "webrtc", "silero"], default="off")
+    replay.add_argument("--speed", type=float, default=1.0, help="Replay speed; latencies are reported in audio time")
+    replay.add_argument("--mel-cache", choices=["on", "off", "both"], default="on")
+    replay.set_defaults(handler=bench_replay)
+
+    stabilizer = subparsers.add_parser("stabilizer", help="Per-commit and per-tick text cost over a long synthetic session")
+    stabilizer.add_argument("--minutes", type=float, default=60.0)
+    stabilizer.add_argument("--words-per-minute", type=int, default=150)
+    stabilizer.add_argument("--step-minutes", type=int, default=10)
+    stabilizer.add_argument("--rounds", type=int, default=40, help="Commits timed per checkpoint")
+    stabilizer.add_argument("--ticks", type=int, default=10, help="Display ticks per commit")
+    stabilizer.set_defaults(handler=bench_stabilizer)
+
+    mel = subparsers.add_parser("mel", help="Log-mel front end cost with and without the shared frame cache")
+    mel.add_argument("wav", nargs="?", default="", help="Audio to feed (default: synthetic noise)")
+    mel.add_argument("--seconds", type=float, default=60.0, help="Length of the synthetic audio")
+    mel.add_argument("--preset", choices=sorted(lc.PRESET_DEFAULTS), default="realtime")
+    mel.add_argument("--buffer-seconds", type=float, default=6.0, help="Audio kept behind the newest sample after each stabilize pass")
+    mel.set_defaults(handler=bench_mel)
+
+    vosk = subparsers.add_parser("vosk", help="Per-chunk cost of the streaming ASR caption loop")
+    vosk.add_argument("wav", nargs="?", default="", help="Audio to feed (default: synthetic noise)")
+    vosk.add_argument("--seconds", type=float, default=300.0, help="Length of the synthetic audio")
+    vosk.add_argument("--vosk-model", default="", help="Decode with this Vosk model instead of the scripted recognizer")
+    vosk.add_argument("--chunks-per-word", type=int, default=3)
+    vosk.add_argument("--words-per-utterance", type=int, default=12)
+    vosk.add_argument("--rounds", type=int, default=3)
+    vosk.set_defaults(handler=bench_vosk)
+
+    rules = subparsers.add_parser("filter", help="Repetition and hallucination filter cost against the number of rules")
+    rules.add_argument("--texts", type=int, default=2000)
+    rules.add_argument("--words", type=int, default=40)
+    rules.add_argument("--rules", type=int, nargs="*", default=[2, 100, 1000, 5000])
+    rules.set_defaults(handler=bench_filter)
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import argparse
-import csv
+import hashlib
 import io
 import json
+import queue
 import re
 import signal
 import subprocess
@@ -12,8 +13,32 @@ import sys
 import tempfile
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # the PNG pipeline below works without it
+    np = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "translation"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from ocr_engines import ENGINE_NAMES, OcrEngine, create_engine, normalize_lines  # noqa: E402
+from translation_cache import TranslationCache  # noqa: E402
+from translator_backends import BACKEND_NAMES, TranslatorBackend, create_backend  # noqa: E402
+
+# Tesseract language codes mapped to the ISO codes translators expect.
+OCR_SOURCE_LANGUAGES = {
+    "eng": "en", "deu": "de", "fra": "fr", "spa": "es", "ita": "it", "por": "pt", "nld": "nl",
+    "rus": "ru", "pol": "pl", "ces": "cs", "swe": "sv", "dan": "da", "fin": "fi", "ron": "ro",
+    "tur": "tr", "ara": "ar", "hin": "hi", "jpn": "ja", "kor": "ko", "chi_sim": "zh", "chi_tra": "zh",
+}
+
+# --line-cache auto reads a region line by line from this many text lines up;
+# shorter text, such as a subtitle, is translated as one block to keep its context.
+LINE_MODE_MIN_LINES = 4
+
 RUNNING = True
 
 
@@ -29,16 +54,34 @@ for _sig in (signal.SIGINT, signal.SIGTERM):
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument("--state-file", required=True)
-    parser.add_argument("--region", required=True)
+    parser.add_argument("--region", action="append", required=True,
+                        help="'X,Y WxH' from slurp, optionally named as 'name=X,Y WxH'; repeat to watch several")
     parser.add_argument("--target-language", default="en")
     parser.add_argument("--ocr-language", default="eng")
     parser.add_argument("--interval-seconds", type=float, default=0.6)
+    parser.add_argument("--max-interval-seconds", type=float, default=1.5,
+                        help="Polling interval is stretched up to this while the region stays unchanged")
+    parser.add_argument("--change-threshold", type=float, default=0.002,
+                        help="Fraction of thumbnail pixels that must change before a capture is OCR'd again")
     parser.add_argument("--confidence-threshold", type=float, default=60.0,
                         help="Minimum mean word confidence (0-100) to accept an OCR result")
+    parser.add_argument("--translator", choices=BACKEND_NAMES, default="trans",
+                        help="Translation backend: trans (translate-shell), argos (offline, worker process) or loopback")
+    parser.add_argument("--ocr-engine", choices=ENGINE_NAMES, default="auto",
+                        help="OCR engine: libtesseract (resident, via ctypes), cli (tesseract per frame), or auto")
+    parser.add_argument("--pipeline", choices=["auto", "memory", "png"], default="auto",
+                        help="memory keeps frames as raw pixels from grim to the OCR engine (needs numpy); "
+                             "png goes through a PNG file and PIL")
+    parser.add_argument("--line-cache", choices=["auto", "on", "off"], default="auto",
+                        help="OCR and translate line by line, reusing results for lines seen before "
+                             "(OCR reuse needs the memory pipeline); auto does so only for regions "
+                             f"showing {LINE_MODE_MIN_LINES} or more lines")
+    parser.add_argument("--ocr-workers", type=int, default=0,
+                        help="OCR threads, each with its own engine (default: one per region, at most 2)")
     return parser.parse_args()
 
 
-def normalize_geometry(region: str) -> str:
+def parse_geometry(region: str) -> tuple[int, int, int, int]:
     cleaned = " ".join(region.strip().split())
     m = re.match(r"^([\d.]+),([\d.]+)\s+([\d.]+)x([\d.]+)$", cleaned)
     if not m:
@@ -50,12 +93,27 @@ def normalize_geometry(region: str) -> str:
     y = int(round(float(m.group(2))))
     w = max(1, int(round(float(m.group(3)))))
     h = max(1, int(round(float(m.group(4)))))
-    return f"{x},{y} {w}x{h}"
+    return x, y, w, h
 
 
-def normalize_lines(text: str) -> str:
-    lines = [" ".join(line.split()) for line in (text or "").splitlines()]
-    return "\n".join(line for line in lines if line).strip()
+def normalize_geometry(region: str) -> str:
+    return "{},{} {}x{}".format(*parse_geometry(region))
+
+
+def parse_region_specs(specs: list[str]) -> list[tuple[str, str]]:
+    """(name, normalized geometry) for each --region; unnamed ones become region1, region2, ..."""
+    regions: list[tuple[str, str]] = []
+    for index, spec in enumerate(specs, start=1):
+        name, separator, geometry = spec.partition("=")
+        if not separator:
+            name, geometry = f"region{index}", spec
+        name = name.strip()
+        if not re.fullmatch(r"[\w-]+", name):
+            raise ValueError(f"Invalid region name '{name}' — use letters, digits, '_' or '-'.")
+        if any(name == existing for existing, _ in regions):
+            raise ValueError(f"Region name '{name}' is used twice.")
+        regions.append((name, normalize_geometry(geometry)))
+    return regions
 
 
 def write_state(path: Path, payload: dict) -> None:
@@ -65,36 +123,65 @@ def write_state(path: Path, payload: dict) -> None:
     temp_path.replace(path)
 
 
-def translate_text(text: str, target_language: str) -> str:
-    if not text:
-        return ""
-    try:
-        result = subprocess.run(
-            ["trans", "-brief", f":{target_language}", text],
-            capture_output=True,
-            text=True,
-            timeout=15,
-            check=True,
-        )
-    except Exception:
-        return ""
-    return normalize_lines(result.stdout or result.stderr)
+def ocr_source_language(ocr_language: str) -> str:
+    """Source language for the translator, from the first of tesseract's '+'-joined languages."""
+    return OCR_SOURCE_LANGUAGES.get(ocr_language.split("+")[0], "")
 
 
-class AsyncTranslator:
-    """Translates in a background thread so it never blocks the OCR loop."""
+class TranslationQueue:
+    """
+    One background thread running translation jobs in order, shared by the
+    translators of every region so they use one backend, one request at a
+    time. Each translator has at most one job queued, so regions take turns.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        threading.Thread(target=self._serve, daemon=True).start()
 
-    def __init__(self, language: str) -> None:
+    def submit(self, job, *args) -> None:
+        self._jobs.put((job, args))
+
+    def _serve(self) -> None:
+        while True:
+            job, args = self._jobs.get()
+            try:
+                job(*args)
+            except Exception as error:
+                print(f"Translation failed: {error}", file=sys.stderr)
+
+
+class AsyncTranslator:
+    """Translates on the TranslationQueue so it never blocks the OCR loop."""
+
+    def __init__(
+        self,
+        language: str,
+        cache: TranslationCache,
+        backend: TranslatorBackend,
+        source_language: str = "",
+        jobs: TranslationQueue | None = None,
+    ) -> None:
         self._language = language
+        self._source_language = source_language
+        self._cache = cache
+        self._backend = backend
+        self._jobs = jobs or TranslationQueue()
         self._lock = threading.Lock()
         self._result = ""
         self._active_text: str | None = None
         self._pending_text: str | None = None
-        self._thread: threading.Thread | None = None
+        self._busy = False
 
     def submit(self, text: str) -> None:
         """Queue text for translation. Returns immediately."""
+        cached = self._cache.get(text, self._language, self._source_language)
         with self._lock:
+            if cached is not None:
+                self._result = cached
+                self._pending_text = None
+                self._active_text = None  # let an in-flight job finish without overwriting
+                return
             if text == self._active_text:
                 return  # already translating this
             self._pending_text = text  # supersede any waiting job
@@ -111,39 +198,341 @@ class AsyncTranslator:
 
     def _maybe_start(self) -> None:
         with self._lock:
-            if self._thread and self._thread.is_alive():
+            if self._busy:
                 return  # will pick up pending when current job finishes
             text = self._pending_text
             if not text:
                 return
             self._pending_text = None
             self._active_text = text
-        t = threading.Thread(target=self._run, args=(text,), daemon=True)
-        self._thread = t
-        t.start()
+            self._busy = True
+        self._jobs.submit(self._run, text)
 
     def _run(self, text: str) -> None:
-        translated = translate_text(text, self._language)
-        with self._lock:
-            if self._active_text == text:
-                self._result = translated
-                self._active_text = None
+        try:
+            translated = normalize_lines(self._backend.translate(text, self._language, self._source_language))
+            self._cache.put(text, self._language, translated, self._source_language)
+            with self._lock:
+                if self._active_text == text:
+                    self._result = translated
+                    self._active_text = None
+        finally:
+            with self._lock:
+                self._busy = False
         self._maybe_start()  # pick up any pending job
 
 
-def capture_region(region: str, image_path: Path) -> None:
+class LineTranslator:
+    """
+    AsyncTranslator for multi-line text, one line at a time: lines already
+    shown or cached keep their translation, only new lines go to the
+    backend (as one batch), and the block is rebuilt in the current order.
+    Lines still being translated are left out until they arrive.
+    """
+
+    def __init__(
+        self,
+        language: str,
+        cache: TranslationCache,
+        backend: TranslatorBackend,
+        source_language: str = "",
+        jobs: TranslationQueue | None = None,
+    ) -> None:
+        self._language = language
+        self._source_language = source_language
+        self._cache = cache
+        self._backend = backend
+        self._jobs = jobs or TranslationQueue()
+        self._lock = threading.Lock()
+        self._lines: list[str] = []
+        self._translated: dict[str, str] = {}
+        self._active: set[str] = set()
+        self._pending: list[str] = []
+
+    def submit(self, text: str) -> None:
+        lines = [line for line in text.splitlines() if line]
+        with self._lock:
+            translated = {}
+            pending = []
+            for line in dict.fromkeys(lines):
+                known = self._translated.get(line) or self._cache.get(line, self._language, self._source_language)
+                if known is not None:
+                    translated[line] = known
+                elif line not in self._active:
+                    pending.append(line)
+            self._lines = lines
+            self._translated = translated
+            self._pending = pending  # lines that scrolled away before their turn are dropped
+        self._maybe_start()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._lines = []
+            self._translated = {}
+            self._pending = []
+
+    def result(self) -> str:
+        with self._lock:
+            return "\n".join(self._translated[line] for line in self._lines if line in self._translated)
+
+    def _maybe_start(self) -> None:
+        with self._lock:
+            if self._active:
+                return
+            batch = self._pending
+            if not batch:
+                return
+            self._pending = []
+            self._active = set(batch)
+        self._jobs.submit(self._run, batch)
+
+    def _run(self, batch: list[str]) -> None:
+        try:
+            results = self._backend.translate_batch(batch, self._language, self._source_language)
+            translated = {}
+            for line, result in zip(batch, results):
+                result = " ".join(normalize_lines(result).splitlines())
+                if result:
+                    self._cache.put(line, self._language, result, self._source_language)
+                    translated[line] = result
+            with self._lock:
+                visible = set(self._lines)
+                self._translated.update((line, result) for line, result in translated.items() if line in visible)
+        finally:
+            with self._lock:
+                self._active = set()
+        self._maybe_start()
+
+
+def run_grim(region: str, output: str, image_type: str = "png") -> bytes:
     normalized = normalize_geometry(region)
     result = subprocess.run(
-        ["grim", "-g", normalized, str(image_path)],
+        ["grim", "-t", image_type, "-g", normalized, output],
         capture_output=True,
-        text=True,
         timeout=8,
     )
     if result.returncode != 0:
-        detail = (result.stderr or result.stdout or "").strip()
+        detail = (result.stderr or (b"" if output == "-" else result.stdout) or b"").decode(errors="replace").strip()
         msg = (f"grim '{normalized}': {detail}" if detail
                else f"grim: screenshot failed for region '{normalized}'")
         raise RuntimeError(msg)
+    return result.stdout
+
+
+def capture_region(region: str, image_path: Path) -> None:
+    run_grim(region, str(image_path))
+
+
+def capture_region_gray(region: str) -> "np.ndarray":
+    """Captures the region as binary PPM on grim's stdout and returns it as 8-bit grayscale, with no file or codec."""
+    return ppm_to_gray(run_grim(region, "-", "ppm"))
+
+
+def ppm_to_gray(data: bytes) -> "np.ndarray":
+    # grim writes "P6\n<width> <height>\n255\n" followed by packed RGB.
+    header = re.match(rb"P6\s+(\d+)\s+(\d+)\s+255\s", data)
+    if header is None:
+        raise RuntimeError("grim: unexpected PPM output")
+    width, height = int(header.group(1)), int(header.group(2))
+    if len(data) - header.end() < width * height * 3:
+        raise RuntimeError("grim: truncated PPM output")
+    rgb = np.frombuffer(data, dtype=np.uint8, count=width * height * 3, offset=header.end()).reshape(height, width, 3)
+    # ITU-R 601-2 luma with the same fixed-point weights PIL's convert("L") uses.
+    weights = np.array([19595, 38470, 7471], dtype=np.uint32)
+    return ((rgb @ weights + 32768) >> 16).astype(np.uint8)
+
+
+class FrameGate:
+    """
+    Decides whether a capture differs enough from the last OCR'd one to be
+    worth preprocessing and OCR. Compares a small grayscale thumbnail when
+    PIL is available, and the PNG bytes otherwise (grim encodes identical
+    pixels identically). The reference only moves on an accepted frame, so
+    slow fades still add up to a change.
+    """
+
+    NOISE_LEVEL = 24
+    THUMBNAIL_WIDTH = 320
+
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+        self._reference = None
+
+    def reset(self) -> None:
+        self._reference = None
+
+    def changed(self, image_path: Path) -> bool:
+        return self._accept(self._fingerprint(image_path))
+
+    def changed_gray(self, gray: "np.ndarray") -> bool:
+        height, width = gray.shape
+        factor = max(1, min(-(-width // self.THUMBNAIL_WIDTH), height))
+        rows, columns = height // factor, width // factor
+        blocks = gray[:rows * factor, :columns * factor].reshape(rows, factor, columns, factor)
+        return self._accept(blocks.mean(axis=(1, 3), dtype=np.float32))
+
+    def _accept(self, fingerprint) -> bool:
+        reference = self._reference
+        if reference is None or type(fingerprint) is not type(reference) or self._differs(reference, fingerprint):
+            self._reference = fingerprint
+            return True
+        return False
+
+    def _fingerprint(self, image_path: Path):
+        try:
+            from PIL import Image
+        except ImportError:
+            return hashlib.blake2b(image_path.read_bytes(), digest_size=16).digest()
+        with Image.open(image_path) as img:
+            img = img.convert("L")
+            factor = max(1, -(-img.width // self.THUMBNAIL_WIDTH))
+            return img.reduce(factor) if factor > 1 else img.copy()
+
+    def _differs(self, reference, fingerprint) -> bool:
+        if isinstance(fingerprint, bytes):
+            return fingerprint != reference
+        if np is not None and isinstance(fingerprint, np.ndarray):
+            if fingerprint.shape != reference.shape:
+                return True
+            changed = np.count_nonzero(np.abs(fingerprint - reference) > self.NOISE_LEVEL)
+            return changed > self.threshold * fingerprint.size
+        if fingerprint.size != reference.size:
+            return True
+        from PIL import ImageChops
+
+        # Count pixels that moved by more than capture/compression noise.
+        changed = ImageChops.difference(reference, fingerprint).point(lambda v: 255 if v > self.NOISE_LEVEL else 0)
+        pixels = fingerprint.width * fingerprint.height
+        return changed.histogram()[255] > self.threshold * pixels
+
+
+def autocontrast_table(gray: "np.ndarray", cutoff: float = 2.0) -> "np.ndarray":
+    """Lookup table stretching the levels between the `cutoff` percent tails to 0..255, like ImageOps.autocontrast."""
+    cumulative = np.cumsum(np.bincount(gray.ravel(), minlength=256))
+    total = int(cumulative[-1])
+    cut = int(total * cutoff // 100)
+    low = int(np.searchsorted(cumulative, cut, side="right"))
+    high = int(np.searchsorted(cumulative, total - cut, side="left"))
+    if high <= low:
+        return np.arange(256, dtype=np.uint8)
+    levels = (np.arange(256, dtype=np.float32) - low) * (255.0 / (high - low))
+    return np.clip(levels, 0, 255).astype(np.uint8)
+
+
+def upscale3(pixels: "np.ndarray", axis: int) -> "np.ndarray":
+    """Bilinear 3x along one axis: output pixel 3i+k samples input i + (k - 1) / 3, edges clamped."""
+    def take(start, stop):
+        return pixels[start:stop] if axis == 0 else pixels[:, start:stop]
+
+    size = pixels.shape[axis]
+    before = np.concatenate([take(0, 1), take(0, size - 1)], axis=axis)
+    after = np.concatenate([take(1, size), take(size - 1, size)], axis=axis)
+    shape = list(pixels.shape)
+    shape[axis] *= 3
+    out = np.empty(shape, dtype=np.float32)
+    for phase, neighbour in ((0, before), (2, after)):
+        neighbour -= pixels
+        neighbour *= 1.0 / 3.0
+        neighbour += pixels
+        if axis == 0:
+            out[phase::3] = neighbour
+        else:
+            out[:, phase::3] = neighbour
+    if axis == 0:
+        out[1::3] = pixels
+    else:
+        out[:, 1::3] = pixels
+    return out
+
+
+def preprocess_gray(gray: "np.ndarray") -> "np.ndarray":
+    """
+    preprocess_image on raw grayscale, in the same order: 3x bilinear
+    upscale, ImageFilter.SMOOTH, then autocontrast over the smoothed
+    histogram. Returned as contiguous 8-bit pixels for the engine.
+    """
+    upscaled = upscale3(upscale3(gray.astype(np.float32), 0), 1)
+    out = np.clip(upscaled + 0.5, 0, 255).astype(np.uint8)
+    # SMOOTH is a 3x3 kernel with 5 in the centre and 1 around it; borders keep their pixels.
+    box = upscaled[:, :-2] + upscaled[:, 1:-1]
+    box += upscaled[:, 2:]
+    box = box[:-2] + box[1:-1] + box[2:]
+    centre = upscaled[1:-1, 1:-1]
+    centre *= 4.0
+    box += centre
+    box *= 1.0 / 13.0
+    box += 0.5
+    np.clip(box, 0, 255, out=box)
+    out[1:-1, 1:-1] = box
+    return autocontrast_table(out)[out]
+
+
+def segment_lines(gray: "np.ndarray", ink_level: int = 48, merge_gap: int = 2, padding: int = 3) -> list[tuple[int, int]]:
+    """
+    Row ranges (top, bottom) of the text lines in a grayscale capture. A row
+    holds text when it has several strong horizontal edges; columns that
+    are edges in nearly every row (window borders, scrollbars) are ignored,
+    rows closer than `merge_gap` are joined (i dots, accents) and each line
+    gets `padding` rows of background either side.
+    """
+    height = gray.shape[0]
+    edges = np.abs(np.diff(gray.astype(np.int16), axis=1)) > ink_level
+    edges[:, edges.mean(axis=0) > 0.9] = False
+    ink = np.count_nonzero(edges, axis=1) > 2
+    flips = np.flatnonzero(np.diff(np.concatenate(([False], ink, [False])).astype(np.int8)))
+    lines: list[tuple[int, int]] = []
+    for top, bottom in zip(flips[::2], flips[1::2]):
+        if lines and top - lines[-1][1] <= merge_gap:
+            lines[-1] = (lines[-1][0], int(bottom))
+        else:
+            lines.append((int(top), int(bottom)))
+    return [(max(0, top - padding), min(height, bottom + padding)) for top, bottom in lines if bottom - top >= 3]
+
+
+class LineOcrCache:
+    """
+    OCRs a capture line by line, keyed by a hash of each line's pixels. A
+    line that scrolled, or stayed put while another changed, has the same
+    pixels and is served from the cache, so a new message at the bottom of
+    a chat costs one line of OCR instead of the whole region.
+    """
+
+    MAX_ENTRIES = 512
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lines: OrderedDict[bytes, tuple[str, float]] = OrderedDict()
+
+    def read(
+        self,
+        gray: "np.ndarray",
+        engine: OcrEngine,
+        language: str,
+        bands: list[tuple[int, int]] | None = None,
+    ) -> tuple[str, float]:
+        texts: list[str] = []
+        weighted = 0.0
+        for top, bottom in segment_lines(gray) if bands is None else bands:
+            band = np.ascontiguousarray(gray[top:bottom])
+            key = hashlib.blake2b(band.tobytes(), digest_size=16, person=b"%d" % band.shape[1]).digest()
+            result = self._lines.get(key)
+            if result is None:
+                self.misses += 1
+                pixels = preprocess_gray(band)
+                result = engine.recognize_gray(pixels.tobytes(), pixels.shape[1], pixels.shape[0], language)
+                self._lines[key] = result
+                while len(self._lines) > self.MAX_ENTRIES:
+                    self._lines.popitem(last=False)
+            else:
+                self.hits += 1
+                self._lines.move_to_end(key)
+            text, confidence = result
+            if text:
+                texts.append(" ".join(text.splitlines()))
+                weighted += confidence * len(text)
+        text = "\n".join(texts)
+        return text, weighted / len(text) if text else 0.0
 
 
 def preprocess_image(image_path: Path) -> bytes:
@@ -165,121 +554,300 @@ def preprocess_image(image_path: Path) -> bytes:
         return image_path.read_bytes()
 
 
-def ocr_image(image_bytes: bytes, language: str) -> tuple[str, float]:
+def read_region(region: str, engine: OcrEngine, language: str, gate: FrameGate, image_path: Path) -> tuple[str, float] | None:
+    """Captures the region to a PNG and reads it, or returns None when the gate finds it unchanged."""
+    capture_region(region, image_path)
+    if not gate.changed(image_path):
+        return None
+    return engine.recognize(preprocess_image(image_path), language)
+
+
+class OcrPool:
     """
-    Run OCR on preprocessed image bytes via tesseract stdin.
-    Returns (text, mean_confidence) where confidence is 0–100.
+    Runs OCR jobs on one thread per engine. Engines are not thread-safe, so
+    each job borrows an idle one for its duration; libtesseract and numpy
+    release the GIL, so regions are read in parallel.
     """
-    result = subprocess.run(
-        ["tesseract", "stdin", "stdout", "-l", language,
-         "--psm", "6", "--oem", "3", "tsv"],
-        input=image_bytes,
-        capture_output=True,
-        timeout=12,
-    )
-    if result.returncode != 0:
-        detail = (result.stderr or b"").decode(errors="replace").strip()
-        raise RuntimeError(f"tesseract failed: {detail}" if detail else "tesseract: OCR failed")
-
-    lines_dict: dict[tuple, list[tuple[int, str]]] = {}
-    confidences: list[float] = []
-    stdout_text = result.stdout.decode(errors="replace")
-    reader = csv.DictReader(io.StringIO(stdout_text), delimiter="\t")
-    for row in reader:
-        try:
-            conf = float(row.get("conf", -1))
-        except (ValueError, TypeError):
-            continue
-        text = (row.get("text") or "").strip()
-        if conf < 0 or not text:
-            continue
-        key = (int(row["block_num"]), int(row["par_num"]), int(row["line_num"]))
-        lines_dict.setdefault(key, []).append((int(row["word_num"]), text))
-        confidences.append(conf)
 
-    if not lines_dict:
-        return "", 0.0
+    def __init__(self, engines: list[OcrEngine]) -> None:
+        self.engines = engines
+        self._idle: queue.SimpleQueue = queue.SimpleQueue()
+        for engine in engines:
+            self._idle.put(engine)
+        self._executor = ThreadPoolExecutor(max_workers=len(engines), thread_name_prefix="ocr")
 
-    text_lines = []
-    for key in sorted(lines_dict):
-        words = [w for _, w in sorted(lines_dict[key])]
-        text_lines.append(" ".join(words))
+    def submit(self, job, *args) -> Future:
+        return self._executor.submit(self._run, job, args)
 
-    mean_conf = sum(confidences) / len(confidences)
-    return normalize_lines("\n".join(text_lines)), mean_conf
+    def _run(self, job, args):
+        engine = self._idle.get()
+        try:
+            return job(engine, *args)
+        finally:
+            self._idle.put(engine)
 
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for engine in self.engines:
+            engine.close()
 
-def main() -> int:
-    args = parse_args()
-    state_path = Path(args.state_file)
-    state: dict = {
-        "status": "starting",
-        "message": "Starting live screen translation…",
-        "ocr_text": "",
-        "translated_text": "",
+
+class WatchedRegion:
+    """
+    One named region: its change gate, translators, line cache and entry in
+    the state file. Text with few lines goes through the whole-block
+    translator; in line mode (--line-cache on, or auto once the region
+    shows LINE_MODE_MIN_LINES lines) OCR and translation go line by line.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        geometry: str,
+        translator: AsyncTranslator,
+        line_translator: LineTranslator | None,
+        args: argparse.Namespace,
+        lines: LineOcrCache | None,
+    ) -> None:
+        self.name = name
+        self.geometry = geometry
+        self.box = parse_geometry(geometry)
+        self.translator = translator
+        self.line_translator = line_translator
+        self.line_cache = args.line_cache
+        self.line_mode = False
+        self.lines = lines
+        self.gate = FrameGate(args.change_threshold)
+        self.image_path: Path | None = None
+        self.last_ocr_text = ""
+        self.state = {"status": "running", "message": "", "region": geometry, "ocr_text": "", "translated_text": ""}
+
+    def crop(self, gray: "np.ndarray", capture_box: tuple[int, int, int, int]) -> "np.ndarray":
+        """This region's pixels in a grab of `capture_box`, which grim may have scaled for HiDPI outputs."""
+        x, y, w, h = capture_box
+        scale_y, scale_x = gray.shape[0] / h, gray.shape[1] / w
+        rx, ry, rw, rh = self.box
+        top, left = round((ry - y) * scale_y), round((rx - x) * scale_x)
+        return gray[top:top + max(1, round(rh * scale_y)), left:left + max(1, round(rw * scale_x))]
+
+    def wants_lines(self, line_count: int) -> bool:
+        return self.line_translator is not None and (self.line_cache == "on" or line_count >= LINE_MODE_MIN_LINES)
+
+    def read_gray(self, engine: OcrEngine, gray: "np.ndarray", language: str) -> tuple[str, float]:
+        if self.lines is not None:
+            bands = segment_lines(gray)
+            if self.wants_lines(len(bands)):
+                return self.lines.read(gray, engine, language, bands)
+        pixels = preprocess_gray(gray)
+        return engine.recognize_gray(pixels.tobytes(), pixels.shape[1], pixels.shape[0], language)
+
+    def read_png(self, engine: OcrEngine, language: str) -> tuple[str, float] | None:
+        return read_region(self.geometry, engine, language, self.gate, self.image_path)
+
+    def active_translator(self) -> AsyncTranslator | LineTranslator:
+        return self.line_translator if self.line_mode else self.translator
+
+    def translate(self, text: str) -> None:
+        line_mode = self.wants_lines(len(text.splitlines()))
+        if line_mode != self.line_mode:
+            self.active_translator().reset()
+            self.line_mode = line_mode
+        self.active_translator().submit(text)
+
+
+def bounding_box(boxes: list[tuple[int, int, int, int]]) -> tuple[int, int, int, int]:
+    left = min(x for x, _, _, _ in boxes)
+    top = min(y for _, y, _, _ in boxes)
+    right = max(x + w for x, _, w, _ in boxes)
+    bottom = max(y + h for _, y, _, h in boxes)
+    return left, top, right - left, bottom - top
+
+
+def publish_state(state_path: Path, state: dict, regions: list[WatchedRegion], args: argparse.Namespace) -> None:
+    """
+    Writes every region under "regions"; the top-level text fields mirror
+    the first region, so a single-region UI reads the file as before.
+    """
+    failing = [region for region in regions if region.state["status"] == "error"]
+    if failing:
+        message = failing[0].state["message"]
+        state.update({"status": "error", "message": message if len(regions) == 1 else f"{failing[0].name}: {message}"})
+    else:
+        state.update({"status": "running", "message": "Reading selected screen area…"})
+    first = regions[0].state
+    state.update({
+        "ocr_text": first["ocr_text"],
+        "translated_text": first["translated_text"],
         "target_language": args.target_language,
         "ocr_language": args.ocr_language,
-        "region": args.region,
-    }
+        "region": first["region"],
+        "regions": {region.name: dict(region.state) for region in regions},
+    })
     write_state(state_path, state)
 
-    last_ocr_text = ""
-    translator = AsyncTranslator(args.target_language)
+
+def run_loop(
+    args: argparse.Namespace,
+    state_path: Path,
+    state: dict,
+    regions: list[WatchedRegion],
+    pool: OcrPool,
+) -> int:
+    base_interval = max(0.35, args.interval_seconds)
+    interval = base_interval
+    in_memory = args.pipeline == "memory" or (args.pipeline == "auto" and np is not None)
+    # One grab covers every region; each is cropped from it in memory.
+    capture_box = bounding_box([region.box for region in regions])
+    capture_geometry = "{},{} {}x{}".format(*capture_box)
+    published = ""
 
     with tempfile.TemporaryDirectory(prefix="live-screen-translation-") as temp_dir:
-        image_path = Path(temp_dir) / "capture.png"
+        if not in_memory:
+            for region in regions:
+                region.image_path = Path(temp_dir) / f"{region.name}.png"
 
-        state.update({"status": "running", "message": "Reading selected screen area…"})
-        write_state(state_path, state)
+        publish_state(state_path, state, regions, args)
 
         while RUNNING:
             try:
-                capture_region(args.region, image_path)
-                image_bytes = preprocess_image(image_path)
-                ocr_text, confidence = ocr_image(image_bytes, args.ocr_language)
+                if in_memory:
+                    gray = capture_region_gray(capture_geometry)
+                    jobs = {}
+                    for region in regions:
+                        crop = region.crop(gray, capture_box)
+                        if region.gate.changed_gray(crop):
+                            jobs[region] = pool.submit(region.read_gray, crop, args.ocr_language)
+                else:
+                    jobs = {region: pool.submit(region.read_png, args.ocr_language) for region in regions}
             except (FileNotFoundError, ValueError) as error:
                 state.update({"status": "error", "message": str(error)})
                 write_state(state_path, state)
                 return 2
             except Exception as error:
-                state.update({
-                    "status": "error",
-                    "message": str(error),
-                    "ocr_text": last_ocr_text,
-                    "translated_text": translator.result(),
-                })
-                write_state(state_path, state)
+                for region in regions:
+                    region.gate.reset()
+                    region.state.update({"status": "error", "message": str(error)})
+                publish_state(state_path, state, regions, args)
                 time.sleep(max(0.5, args.interval_seconds))
                 continue
 
-            # Skip low-confidence frames — keep last good result visible
-            if confidence < args.confidence_threshold:
-                time.sleep(max(0.35, args.interval_seconds))
-                continue
-
-            if ocr_text != last_ocr_text:
-                last_ocr_text = ocr_text
-                if ocr_text:
-                    translator.submit(ocr_text)
-                else:
-                    translator.reset()
-
-            state.update({
-                "status": "running",
-                "message": "Reading selected screen area…",
-                "ocr_text": ocr_text,
-                "translated_text": translator.result(),
-                "target_language": args.target_language,
-                "ocr_language": args.ocr_language,
-                "region": args.region,
-            })
-            write_state(state_path, state)
-            time.sleep(max(0.35, args.interval_seconds))
+            changed = False
+            for region, job in jobs.items():
+                try:
+                    result = job.result()
+                except (FileNotFoundError, ValueError) as error:
+                    state.update({"status": "error", "message": str(error)})
+                    write_state(state_path, state)
+                    return 2
+                except Exception as error:
+                    region.gate.reset()
+                    region.state.update({"status": "error", "message": str(error)})
+                    continue
+                if result is None:
+                    continue  # unchanged since the last OCR
+                changed = True
+                ocr_text, confidence = result
+                region.state.update({"status": "running", "message": ""})
+                # Skip low-confidence frames — keep last good result visible
+                if confidence < args.confidence_threshold:
+                    continue
+                if ocr_text != region.last_ocr_text:
+                    region.last_ocr_text = ocr_text
+                    if ocr_text:
+                        region.translate(ocr_text)
+                    else:
+                        region.active_translator().reset()
+                region.state["ocr_text"] = ocr_text
+
+            for region in regions:
+                region.state["translated_text"] = region.active_translator().result()
+            snapshot = json.dumps([region.state for region in regions], ensure_ascii=False)
+            if snapshot != published:
+                published = snapshot
+                publish_state(state_path, state, regions, args)
+
+            # Static regions: no OCR, and poll less often until one changes.
+            interval = base_interval if changed else min(max(base_interval, args.max_interval_seconds), interval * 1.5)
+            time.sleep(interval)
 
     state.update({"status": "stopped", "message": "Live screen translation stopped."})
     write_state(state_path, state)
     return 0
 
 
+def main() -> int:
+    args = parse_args()
+    state_path = Path(args.state_file)
+    state: dict = {
+        "status": "starting",
+        "message": "Starting live screen translation…",
+        "ocr_text": "",
+        "translated_text": "",
+        "target_language": args.target_language,
+        "ocr_language": args.ocr_language,
+        "region": args.region[0],
+    }
+    write_state(state_path, state)
+
+    try:
+        specs = parse_region_specs(args.region)
+    except ValueError as error:
+        state.update({"status": "error", "message": str(error)})
+        write_state(state_path, state)
+        return 2
+
+    if args.pipeline == "memory" and np is None:
+        state.update({"status": "error", "message": "--pipeline memory needs numpy; install it or use --pipeline png."})
+        write_state(state_path, state)
+        return 2
+
+    engines: list[OcrEngine] = []
+    try:
+        for _ in range(args.ocr_workers or min(len(specs), 2)):
+            engines.append(create_engine(args.ocr_engine, args.ocr_language))
+    except (OSError, RuntimeError) as error:
+        for engine in engines:
+            engine.close()
+        state.update({"status": "error", "message": f"Could not start OCR engine: {error}"})
+        write_state(state_path, state)
+        return 2
+    state["ocr_engine"] = engines[0].name
+    pool = OcrPool(engines)
+
+    cache = TranslationCache()
+    backend = create_backend(args.translator, timeout=15.0)
+    jobs = TranslationQueue()
+    source_language = ocr_source_language(args.ocr_language)
+    line_mode = args.line_cache != "off"
+    regions = [
+        WatchedRegion(
+            name,
+            geometry,
+            AsyncTranslator(args.target_language, cache, backend, source_language, jobs),
+            LineTranslator(args.target_language, cache, backend, source_language, jobs) if line_mode else None,
+            args,
+            LineOcrCache() if line_mode and np is not None else None,
+        )
+        for name, geometry in specs
+    ]
+
+    try:
+        return run_loop(args, state_path, state, regions, pool)
+    finally:
+        pool.close()
+        backend.close()
+        line_caches = [region.lines for region in regions if region.lines is not None]
+        hits = sum(lines.hits for lines in line_caches)
+        misses = sum(lines.misses for lines in line_caches)
+        if hits + misses:
+            print(f"Line OCR cache: {hits} hits, {misses} misses", file=sys.stderr)
+        stats = cache.stats()
+        print(
+            f"Translation cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} entries",
+            file=sys.stderr,
+        )
+        cache.close()
+
+
 if __name__ == "__main__":
     sys.exit(main())
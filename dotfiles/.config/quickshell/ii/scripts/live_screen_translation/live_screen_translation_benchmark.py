@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for live screen translation.
+
+  ocr       frames/second and per-frame latency of each OCR engine on
+            captured screenshots, back to back and paced like the live loop
+  pipeline  wall and CPU time per frame from capture to OCR result, PNG files
+            and PIL against raw pixels kept in memory
+  lines     a chat log scrolling one message per update, read as a whole
+            region against line by line with the line cache
+
+    python live_screen_translation_benchmark.py ocr capture1.png capture2.png
+    python live_screen_translation_benchmark.py ocr shot.png --frames 20 --interval 0.6
+    python live_screen_translation_benchmark.py pipeline --region "100,900 1200x150"
+    python live_screen_translation_benchmark.py pipeline --engine none
+    python live_screen_translation_benchmark.py lines --updates 40
+"""
+from __future__ import annotations
+
+import argparse
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import live_screen_translation as lst  # noqa: E402
+import ocr_engines  # noqa: E402
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def cpu_seconds() -> float:
+    """CPU time of this process and its finished children, so forked tesseract runs count too."""
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def run_frames(engine: ocr_engines.OcrEngine, frames: list[bytes], language: str, interval: float) -> dict:
+    latencies: list[float] = []
+    cpu_started = cpu_seconds()
+    started = time.perf_counter()
+    for image_bytes in frames:
+        frame_started = time.perf_counter()
+        engine.recognize(image_bytes, language)
+        latencies.append(time.perf_counter() - frame_started)
+        if interval > 0:
+            time.sleep(interval)
+    wall = time.perf_counter() - started
+    return {
+        "fps": len(frames) / wall if wall > 0 else 0.0,
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "cpu": (cpu_seconds() - cpu_started) / len(frames),
+    }
+
+
+def bench_ocr(args: argparse.Namespace) -> int:
+    # The live loop feeds preprocessed PNGs (raw captures when PIL is missing).
+    images = [lst.preprocess_image(Path(path)) for path in args.images]
+    frames = [images[i % len(images)] for i in range(args.frames)]
+    engines = args.engines or ["cli", "libtesseract"]
+
+    print(f"{len(images)} image(s), {args.frames} frames per run, language {args.language}")
+    print(f"  {'engine':<13} {'pacing':<10} {'first ms':>9} {'frames/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'CPU ms/frame':>13}")
+    for name in engines:
+        started = time.perf_counter()
+        try:
+            engine = ocr_engines.create_engine(name, args.language)
+            engine.recognize(images[0], args.language)
+        except (OSError, RuntimeError) as error:
+            print(f"  {name:<13} unavailable: {error}")
+            continue
+        first = time.perf_counter() - started
+        try:
+            for pacing, interval in (("none", 0.0), (f"{args.interval:g} s", args.interval)):
+                result = run_frames(engine, frames, args.language, interval)
+                print(
+                    f"  {engine.name:<13} {pacing:<10} {first * 1000:9.0f} {result['fps']:9.2f} "
+                    f"{result['p50'] * 1000:8.1f} {result['p95'] * 1000:8.1f} {result['cpu'] * 1000:13.1f}"
+                )
+        finally:
+            engine.close()
+    return 0
+
+
+def synthetic_capture(width: int, height: int) -> bytes:
+    """A subtitle-like frame as grim's PPM: light text strokes on a dark, slightly noisy background."""
+    rng = np.random.default_rng(0)
+    rgb = (rng.integers(10, 40, (height, width, 1)) * np.ones(3, dtype=np.int64)).astype(np.uint8)
+    for row in range(height // 3, height * 2 // 3, 6):
+        for column in range(width // 10, width * 9 // 10, 14):
+            rgb[row:row + 3, column:column + int(rng.integers(4, 12))] = 235
+    return b"P6\n%d %d\n255\n" % (width, height) + rgb.tobytes()
+
+
+def ppm_to_png(ppm: bytes) -> bytes | None:
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    import io
+
+    image = Image.open(io.BytesIO(ppm))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def time_pipeline(frame, frames: int) -> dict:
+    walls: list[float] = []
+    cpu_started = cpu_seconds()
+    for _ in range(frames):
+        started = time.perf_counter()
+        frame()
+        walls.append(time.perf_counter() - started)
+    return {
+        "p50": percentile(walls, 0.50),
+        "p95": percentile(walls, 0.95),
+        "cpu": (cpu_seconds() - cpu_started) / frames,
+    }
+
+
+def bench_pipeline(args: argparse.Namespace) -> int:
+    engine = None
+    if args.engine != "none":
+        try:
+            engine = ocr_engines.create_engine(args.engine, args.language)
+            engine.recognize_gray(bytes(64 * 16), 64, 16, args.language)
+        except (OSError, RuntimeError) as error:
+            print(f"OCR engine unavailable ({error}); timing capture and preprocessing only")
+            if engine is not None:
+                engine.close()
+            engine = None
+    language = args.language
+
+    def recognize(image_bytes: bytes) -> None:
+        if engine is not None:
+            engine.recognize(image_bytes, language)
+
+    def recognize_gray(pixels) -> None:
+        if engine is not None:
+            engine.recognize_gray(pixels.tobytes(), pixels.shape[1], pixels.shape[0], language)
+
+    width, height = (int(value) for value in args.size.split("x"))
+    ppm = Path(args.image).read_bytes() if args.image else synthetic_capture(width, height)
+    png = ppm_to_png(ppm)
+
+    with tempfile.TemporaryDirectory(prefix="live-screen-translation-benchmark-") as temp_dir:
+        image_path = Path(temp_dir) / "capture.png"
+        if args.region:
+            source = f"grim {args.region}"
+
+            def png_frame() -> None:
+                lst.capture_region(args.region, image_path)
+                recognize(lst.preprocess_image(image_path))
+
+            def memory_frame() -> None:
+                recognize_gray(lst.preprocess_gray(lst.capture_region_gray(args.region)))
+        else:
+            # Replays stand in for grim: the PNG path still goes through a file, the memory path through PPM bytes.
+            replayed = lst.ppm_to_gray(ppm)
+            source = f"replayed {replayed.shape[1]}x{replayed.shape[0]} capture"
+
+            def png_frame() -> None:
+                image_path.write_bytes(png)
+                recognize(lst.preprocess_image(image_path))
+
+            def memory_frame() -> None:
+                recognize_gray(lst.preprocess_gray(lst.ppm_to_gray(ppm)))
+
+        print(f"{source}, {args.frames} frames, OCR {engine.name if engine else 'off'}")
+        print(f"  {'pipeline':<8} {'wall p50 ms':>12} {'wall p95 ms':>12} {'CPU ms/frame':>13}")
+        for name, frame in (("png", png_frame), ("memory", memory_frame)):
+            if name == "png" and png is None and not args.region:
+                print(f"  {name:<8} unavailable: PIL is not installed")
+                continue
+            try:
+                frame()
+            except (OSError, RuntimeError) as error:
+                print(f"  {name:<8} unavailable: {error}")
+                continue
+            result = time_pipeline(frame, args.frames)
+            print(f"  {name:<8} {result['p50'] * 1000:12.1f} {result['p95'] * 1000:12.1f} {result['cpu'] * 1000:13.1f}")
+    if engine is not None:
+        engine.close()
+    return 0
+
+
+class CountingEngine(ocr_engines.OcrEngine):
+    """Wraps an engine (or none) and counts what is sent to it."""
+
+    def __init__(self, engine: ocr_engines.OcrEngine | None):
+        self.engine = engine
+        self.name = engine.name if engine else "off"
+        self.calls = 0
+        self.rows = 0
+
+    def recognize(self, image_bytes: bytes, language: str) -> tuple[str, float]:
+        self.calls += 1
+        if self.engine is not None:
+            return self.engine.recognize(image_bytes, language)
+        return f"image {hash(image_bytes) & 0xffff:04x}", 90.0
+
+    def recognize_gray(self, pixels: bytes, width: int, height: int, language: str) -> tuple[str, float]:
+        self.calls += 1
+        self.rows += height
+        if self.engine is not None:
+            return self.engine.recognize_gray(pixels, width, height, language)
+        return f"line {hash(pixels) & 0xffff:04x}", 90.0
+
+
+def synthetic_chat(width: int, lines: int, pitch: int = 24) -> np.ndarray:
+    """Grayscale chat log: one word-like line of strokes per `pitch` rows on a flat background, and a scrollbar."""
+    rng = np.random.default_rng(1)
+    canvas = np.full((lines * pitch, width), 32, dtype=np.uint8)
+    canvas[:, width - 12:width - 8] = 190
+    for line in range(lines):
+        top = line * pitch + 5
+        column = 16
+        end = int(rng.integers(width // 4, width - 40))
+        while column < end:
+            word = int(rng.integers(20, 70))
+            for stroke in range(column, min(column + word, end), 6):
+                canvas[top + int(rng.integers(0, 4)):top + 14, stroke:stroke + int(rng.integers(2, 4))] = 225
+            column += word + 10
+    return canvas
+
+
+def bench_lines(args: argparse.Namespace) -> int:
+    engine = None
+    if args.engine != "none":
+        try:
+            engine = ocr_engines.create_engine(args.engine, args.language)
+            engine.recognize_gray(bytes(64 * 16), 64, 16, args.language)
+        except (OSError, RuntimeError) as error:
+            print(f"OCR engine unavailable ({error}); timing segmentation and preprocessing only")
+            if engine is not None:
+                engine.close()
+            engine = None
+
+    width, height = (int(value) for value in args.size.split("x"))
+    pitch = 24
+    chat = synthetic_chat(width, height // pitch + args.updates + 1, pitch)
+    frames = [np.ascontiguousarray(chat[update * pitch:update * pitch + height]) for update in range(args.updates + 1)]
+
+    print(f"{width}x{height} chat region, {len(lst.segment_lines(frames[0]))} lines, "
+          f"scrolling one line per update, {args.updates} updates, OCR {engine.name if engine else 'off'}")
+    print(f"  {'mode':<7} {'OCR calls':>10} {'OCR rows':>9} {'wall ms':>9} {'CPU ms':>8} {'lines translated':>17}  (per update)")
+    for mode in ("region", "lines"):
+        counting = CountingEngine(engine)
+        cache = lst.LineOcrCache() if mode == "lines" else None
+        known: set[str] = set()
+
+        def read(gray: np.ndarray) -> str:
+            if cache is not None:
+                return cache.read(gray, counting, args.language)[0]
+            pixels = lst.preprocess_gray(gray)
+            return counting.recognize_gray(pixels.tobytes(), pixels.shape[1], pixels.shape[0], args.language)[0]
+
+        previous = read(frames[0])
+        known.update(previous.splitlines())
+        counting.calls = counting.rows = 0
+        translated = 0
+        walls: list[float] = []
+        cpu_started = cpu_seconds()
+        for gray in frames[1:]:
+            started = time.perf_counter()
+            text = read(gray)
+            walls.append(time.perf_counter() - started)
+            # AsyncTranslator sends every changed block whole; LineTranslator only its unseen lines.
+            if mode == "region":
+                if text != previous:
+                    # Without an engine the whole region comes back as one placeholder line.
+                    translated += len(text.splitlines()) if engine else len(lst.segment_lines(gray))
+            else:
+                new = set(text.splitlines()) - known
+                translated += len(new)
+                known |= new
+            previous = text
+        cpu = (cpu_seconds() - cpu_started) / args.updates
+        updates = args.updates
+        print(f"  {mode:<7} {counting.calls / updates:10.1f} {counting.rows / updates:9.0f} "
+              f"{percentile(walls, 0.5) * 1000:9.1f} {cpu * 1000:8.1f} {translated / updates:17.1f}")
+    if engine is not None:
+        engine.close()
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ocr = subparsers.add_parser("ocr", help="Frames/second and latency per OCR engine")
+    ocr.add_argument("images", nargs="+", help="Screenshots of the kind of region being translated")
+    ocr.add_argument("--engines", nargs="*", choices=[name for name in ocr_engines.ENGINE_NAMES if name != "auto"])
+    ocr.add_argument("--language", default="eng")
+    ocr.add_argument("--frames", type=int, default=20)
+    ocr.add_argument("--interval", type=float, default=0.6, help="Sleep after each frame, like --interval-seconds")
+    ocr.set_defaults(handler=bench_ocr)
+
+    pipeline = subparsers.add_parser("pipeline", help="Per-frame time of the PNG and in-memory capture pipelines")
+    pipeline.add_argument("--region", default="", help="Capture this region with grim instead of replaying a frame")
+    pipeline.add_argument("--image", default="", help="PPM frame to replay (default: a synthetic subtitle frame)")
+    pipeline.add_argument("--size", default="1200x150", help="Size of the synthetic frame")
+    pipeline.add_argument("--engine", choices=["none", *ocr_engines.ENGINE_NAMES], default="auto")
+    pipeline.add_argument("--language", default="eng")
+    pipeline.add_argument("--frames", type=int, default=30)
+    pipeline.set_defaults(handler=bench_pipeline)
+
+    lines = subparsers.add_parser("lines", help="Whole-region against line-cached OCR on a scrolling chat")
+    lines.add_argument("--size", default="900x600", help="Size of the chat region")
+    lines.add_argument("--updates", type=int, default=30)
+    lines.add_argument("--engine", choices=["none", *ocr_engines.ENGINE_NAMES], default="auto")
+    lines.add_argument("--language", default="eng")
+    lines.set_defaults(handler=bench_lines)
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
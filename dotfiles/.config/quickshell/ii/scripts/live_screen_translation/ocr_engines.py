@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+OCR engines for live screen translation.
+
+Every engine exposes `recognize(image_bytes, language)` and returns
+(text, mean word confidence 0-100), raising RuntimeError when recognition
+itself fails.
+
+  libtesseract  the tesseract C API through ctypes; the API handle and the
+                loaded traineddata stay resident across frames
+  cli           one `tesseract stdin stdout ... tsv` process per frame
+
+`create_engine("auto")` prefers libtesseract and falls back to the CLI when
+the library cannot be loaded or initialised.
+"""
+from __future__ import annotations
+
+import abc
+import csv
+import ctypes
+import ctypes.util
+import io
+import subprocess
+import sys
+
+ENGINE_NAMES = ("auto", "libtesseract", "cli")
+PSM_SINGLE_BLOCK = 6
+
+
+def normalize_lines(text: str) -> str:
+    lines = [" ".join(line.split()) for line in (text or "").splitlines()]
+    return "\n".join(line for line in lines if line).strip()
+
+
+class OcrEngine(abc.ABC):
+    name = "base"
+
+    @abc.abstractmethod
+    def recognize(self, image_bytes: bytes, language: str) -> tuple[str, float]:
+        """Reads an encoded image (PNG, PGM, …) and returns (text, mean word confidence)."""
+
+    def recognize_gray(self, pixels: bytes, width: int, height: int, language: str) -> tuple[str, float]:
+        """Reads 8-bit grayscale pixels, row after row; by default wrapped in an uncompressed PGM."""
+        return self.recognize(b"P5\n%d %d\n255\n" % (width, height) + pixels, language)
+
+    def close(self) -> None:
+        pass
+
+
+class TesseractCliEngine(OcrEngine):
+    name = "cli"
+
+    def __init__(self, executable: str = "tesseract", timeout: float = 12.0):
+        self.executable = executable
+        self.timeout = timeout
+
+    def recognize(self, image_bytes: bytes, language: str) -> tuple[str, float]:
+        result = subprocess.run(
+            [self.executable, "stdin", "stdout", "-l", language,
+             "--psm", str(PSM_SINGLE_BLOCK), "--oem", "3", "tsv"],
+            input=image_bytes,
+            capture_output=True,
+            timeout=self.timeout,
+        )
+        if result.returncode != 0:
+            detail = (result.stderr or b"").decode(errors="replace").strip()
+            raise RuntimeError(f"tesseract failed: {detail}" if detail else "tesseract: OCR failed")
+        return parse_tsv(result.stdout.decode(errors="replace"))
+
+
+def parse_tsv(stdout_text: str) -> tuple[str, float]:
+    lines_dict: dict[tuple, list[tuple[int, str]]] = {}
+    confidences: list[float] = []
+    reader = csv.DictReader(io.StringIO(stdout_text), delimiter="\t")
+    for row in reader:
+        try:
+            conf = float(row.get("conf", -1))
+        except (ValueError, TypeError):
+            continue
+        text = (row.get("text") or "").strip()
+        if conf < 0 or not text:
+            continue
+        key = (int(row["block_num"]), int(row["par_num"]), int(row["line_num"]))
+        lines_dict.setdefault(key, []).append((int(row["word_num"]), text))
+        confidences.append(conf)
+
+    if not lines_dict:
+        return "", 0.0
+
+    text_lines = []
+    for key in sorted(lines_dict):
+        words = [w for _, w in sorted(lines_dict[key])]
+        text_lines.append(" ".join(words))
+
+    mean_conf = sum(confidences) / len(confidences)
+    return normalize_lines("\n".join(text_lines)), mean_conf
+
+
+class LibTesseractEngine(OcrEngine):
+    """
+    Keeps one TessBaseAPI handle per process. Init loads the traineddata
+    once (again only when the language changes); each frame is handed over
+    as raw grayscale (or decoded by Leptonica from PNG bytes), recognised
+    and cleared. ctypes drops the GIL for the calls, so the translator
+    thread keeps running meanwhile.
+    """
+
+    name = "libtesseract"
+
+    def __init__(self):
+        self._tess = ctypes.CDLL(ctypes.util.find_library("tesseract") or "libtesseract.so.5")
+        lept_name = ctypes.util.find_library("leptonica") or ctypes.util.find_library("lept") or "libleptonica.so.6"
+        self._lept = ctypes.CDLL(lept_name)
+
+        tess, lept = self._tess, self._lept
+        tess.TessBaseAPICreate.restype = ctypes.c_void_p
+        tess.TessBaseAPIInit3.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
+        tess.TessBaseAPISetPageSegMode.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        tess.TessBaseAPISetImage.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        ]
+        tess.TessBaseAPISetImage2.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        tess.TessBaseAPIRecognize.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        tess.TessBaseAPIGetUTF8Text.argtypes = [ctypes.c_void_p]
+        tess.TessBaseAPIGetUTF8Text.restype = ctypes.c_void_p
+        tess.TessBaseAPIMeanTextConf.argtypes = [ctypes.c_void_p]
+        tess.TessDeleteText.argtypes = [ctypes.c_void_p]
+        tess.TessBaseAPIClear.argtypes = [ctypes.c_void_p]
+        tess.TessBaseAPIEnd.argtypes = [ctypes.c_void_p]
+        tess.TessBaseAPIDelete.argtypes = [ctypes.c_void_p]
+        lept.pixReadMem.argtypes = [ctypes.c_char_p, ctypes.c_size_t]
+        lept.pixReadMem.restype = ctypes.c_void_p
+        lept.pixDestroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+
+        self._handle = tess.TessBaseAPICreate()
+        if not self._handle:
+            raise RuntimeError("TessBaseAPICreate failed")
+        self._language = ""
+
+    def load(self, language: str) -> None:
+        if language == self._language:
+            return
+        if self._tess.TessBaseAPIInit3(self._handle, None, language.encode("utf-8")) != 0:
+            self._language = ""
+            raise RuntimeError(f"tesseract could not load language '{language}'")
+        self._tess.TessBaseAPISetPageSegMode(self._handle, PSM_SINGLE_BLOCK)
+        self._language = language
+
+    def recognize(self, image_bytes: bytes, language: str) -> tuple[str, float]:
+        self.load(language)
+        pix = ctypes.c_void_p(self._lept.pixReadMem(image_bytes, len(image_bytes)))
+        if not pix.value:
+            raise RuntimeError("tesseract: could not decode the captured image")
+        try:
+            self._tess.TessBaseAPISetImage2(self._handle, pix)
+            return self._read_result()
+        finally:
+            self._lept.pixDestroy(ctypes.byref(pix))
+
+    def recognize_gray(self, pixels: bytes, width: int, height: int, language: str) -> tuple[str, float]:
+        # SetImage copies the buffer, so there is no decode and nothing to free.
+        self.load(language)
+        self._tess.TessBaseAPISetImage(self._handle, pixels, width, height, 1, width)
+        return self._read_result()
+
+    def _read_result(self) -> tuple[str, float]:
+        tess = self._tess
+        try:
+            if tess.TessBaseAPIRecognize(self._handle, None) != 0:
+                raise RuntimeError("tesseract: OCR failed")
+            text_pointer = tess.TessBaseAPIGetUTF8Text(self._handle)
+            if not text_pointer:
+                return "", 0.0
+            try:
+                text = ctypes.string_at(text_pointer).decode("utf-8", "replace")
+            finally:
+                tess.TessDeleteText(text_pointer)
+            text = normalize_lines(text)
+            return text, float(tess.TessBaseAPIMeanTextConf(self._handle)) if text else 0.0
+        finally:
+            tess.TessBaseAPIClear(self._handle)
+
+    def close(self) -> None:
+        if self._handle:
+            self._tess.TessBaseAPIEnd(self._handle)
+            self._tess.TessBaseAPIDelete(self._handle)
+            self._handle = None
+
+
+def create_engine(name: str, language: str = "") -> OcrEngine:
+    """With a language, the resident engine is initialised up front so a missing traineddata falls back too."""
+    if name not in ENGINE_NAMES:
+        raise ValueError(f"Unknown OCR engine '{name}'. Expected one of: {', '.join(ENGINE_NAMES)}")
+    if name in ("auto", "libtesseract"):
+        engine = None
+        try:
+            engine = LibTesseractEngine()
+            if language:
+                engine.load(language)
+            return engine
+        except (OSError, AttributeError, RuntimeError) as error:
+            if engine is not None:
+                engine.close()
+            if name == "libtesseract":
+                raise
+            print(f"Resident tesseract unavailable ({error}), using the tesseract CLI.", file=sys.stderr)
+    return TesseractCliEngine()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Throughput and latency of the translator backends.
+
+Each scenario translates the same caption-sized segments and reports
+segments/second and p50/p95 latency per segment. The fork-per-call path is
+measured against a stand-in `trans` shell script so the number isolates the
+process overhead from network time; pass --trans to include the real CLI.
+
+    python translation_benchmark.py
+    python translation_benchmark.py --requests 400 --batch-size 8 --trans
+    python translation_benchmark.py --argos en:de
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import stat
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import translator_backends as tb  # noqa: E402
+
+SAMPLE_SEGMENTS = [
+    "The meeting starts in five minutes.",
+    "Could you share your screen, please?",
+    "I think the second option is better.",
+    "Let's move on to the next item on the agenda.",
+    "The build failed again on the release branch.",
+    "We should ship this before the end of the week.",
+    "Can everyone hear me clearly?",
+    "Thanks for joining today.",
+]
+
+STUB_TRANS = """#!/bin/sh
+# Stand-in for translate-shell: echoes the text back after the language argument.
+printf '%s\\n' "$3"
+"""
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_scenario(backend: tb.TranslatorBackend, requests: int, batch_size: int, target: str, source: str) -> dict | None:
+    # One warm-up call so worker start-up and model loading are not counted.
+    if not backend.translate_batch(SAMPLE_SEGMENTS[:1], target, source)[0]:
+        backend.close()
+        return None
+
+    latencies: list[float] = []
+    failed = 0
+    started = time.perf_counter()
+    sent = 0
+    while sent < requests:
+        count = min(batch_size, requests - sent)
+        texts = [f"{SAMPLE_SEGMENTS[(sent + i) % len(SAMPLE_SEGMENTS)]} ({sent + i})" for i in range(count)]
+        call_started = time.perf_counter()
+        results = backend.translate_batch(texts, target, source)
+        elapsed = time.perf_counter() - call_started
+        latencies.extend([elapsed] * count)
+        failed += sum(1 for result in results if not result)
+        sent += count
+    wall = time.perf_counter() - started
+    backend.close()
+    return {
+        "rate": requests / wall if wall > 0 else 0.0,
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "failed": failed,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="Segments per scenario")
+    parser.add_argument("--batch-size", type=int, default=8, help="Segments per call in batched scenarios")
+    parser.add_argument("--target", default="de")
+    parser.add_argument("--trans", action="store_true", help="Also measure the real translate-shell CLI (network)")
+    parser.add_argument("--argos", metavar="FROM:TO", default="",
+                        help="Also measure the Argos worker for an installed language pair")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="translation-benchmark-") as temp_dir:
+        stub_path = Path(temp_dir) / "trans"
+        stub_path.write_text(STUB_TRANS, encoding="utf-8")
+        stub_path.chmod(stub_path.stat().st_mode | stat.S_IXUSR)
+
+        batch = args.batch_size
+        # (name, backend factory, segments, batch size, source language, target language)
+        scenarios = [
+            ("fork per call (stub trans)", lambda: tb.TransCliBackend(str(stub_path)), args.requests, 1, "", args.target),
+            ("fork per batch (stub trans)", lambda: tb.TransCliBackend(str(stub_path)), args.requests, batch, "", args.target),
+            ("worker process (loopback)", lambda: tb.WorkerProcessBackend("loopback"), args.requests, 1, "", args.target),
+            ("worker process, batched", lambda: tb.WorkerProcessBackend("loopback"), args.requests, batch, "", args.target),
+            ("inline (loopback)", tb.LoopbackBackend, args.requests, 1, "", args.target),
+        ]
+        if args.trans:
+            # Real network round trips; keep the count polite.
+            count = min(args.requests, 40)
+            scenarios.append(("translate-shell, per call", tb.TransCliBackend, count, 1, "", args.target))
+            scenarios.append(("translate-shell, batched", tb.TransCliBackend, count, batch, "", args.target))
+        if args.argos:
+            source, _, target = args.argos.partition(":")
+            argos = functools.partial(tb.WorkerProcessBackend, "argos", timeout=60.0)
+            scenarios.append(("argos worker, per call", argos, args.requests, 1, source, target))
+            scenarios.append(("argos worker, batched", argos, args.requests, batch, source, target))
+
+        print(f"{'scenario':32} {'seg/s':>9} {'p50':>9} {'p95':>9} {'failed':>7}")
+        for name, factory, count, batch_size, source, target in scenarios:
+            result = run_scenario(factory(), count, batch_size, target, source)
+            if result is None:
+                print(f"{name:32} unavailable")
+                continue
+            print(
+                f"{name:32} {result['rate']:9.1f} {result['p50'] * 1000:7.2f}ms "
+                f"{result['p95'] * 1000:7.2f}ms {result['failed']:7d}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Translation cache shared by live captions and live screen translation.
+
+Translations live in one SQLite database under XDG_CACHE_HOME so repeated
+phrases (UI strings, lyrics, recurring subtitles) come back instantly across
+sessions and across both tools. Entries are evicted least-recently-used once
+the table grows past `max_entries`, and a small in-memory front keeps hot
+lookups off the database entirely.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_MAX_ENTRIES = 20000
+MEMORY_ENTRIES = 512
+EVICT_EVERY_PUTS = 64
+
+
+def default_cache_path() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "quickshell" / "translation-cache.sqlite3"
+
+
+def cache_key_text(text: str) -> str:
+    lines = [" ".join(line.split()) for line in (text or "").splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+class TranslationCache:
+    def __init__(self, path: Path | None = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path or default_cache_path()
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+        self._puts_since_evict = 0
+        self._db = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(self.path), timeout=2.0, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+        except (OSError, sqlite3.Error) as error:
+            print(f"Translation cache unavailable, using memory only: {error}", file=sys.stderr)
+            db = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            " source_text TEXT NOT NULL,"
+            " source_language TEXT NOT NULL,"
+            " target_language TEXT NOT NULL,"
+            " translated_text TEXT NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " PRIMARY KEY (source_text, source_language, target_language))"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used)")
+        return db
+
+    def get(self, text: str, target_language: str, source_language: str = "") -> str | None:
+        key = (cache_key_text(text), source_language, target_language)
+        if not key[0]:
+            return None
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return cached
+
+            try:
+                row = self._db.execute(
+                    "SELECT translated_text FROM translations"
+                    " WHERE source_text = ? AND source_language = ? AND target_language = ?",
+                    key,
+                ).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        "UPDATE translations SET last_used = ?"
+                        " WHERE source_text = ? AND source_language = ? AND target_language = ?",
+                        (time.time(), *key),
+                    )
+            except sqlite3.Error:
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._remember(key, row[0])
+            return row[0]
+
+    def put(self, text: str, target_language: str, translated_text: str, source_language: str = "") -> None:
+        key = (cache_key_text(text), source_language, target_language)
+        if not key[0] or not translated_text:
+            return
+
+        with self._lock:
+            self._remember(key, translated_text)
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO translations"
+                    " (source_text, source_language, target_language, translated_text, last_used)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (*key, translated_text, time.time()),
+                )
+                self._puts_since_evict += 1
+                if self._puts_since_evict >= EVICT_EVERY_PUTS:
+                    self._puts_since_evict = 0
+                    self._evict()
+            except sqlite3.Error:
+                pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            try:
+                entries = self._db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            except sqlite3.Error:
+                entries = len(self._memory)
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": entries,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._evict()
+                self._db.close()
+            except sqlite3.Error:
+                pass
+
+    def _remember(self, key: tuple[str, str, str], translated_text: str) -> None:
+        self._memory[key] = translated_text
+        self._memory.move_to_end(key)
+        while len(self._memory) > MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    def _evict(self) -> None:
+        excess = self._db.execute("SELECT COUNT(*) FROM translations").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM translations WHERE rowid IN"
+                " (SELECT rowid FROM translations ORDER BY last_used ASC LIMIT ?)",
+                (excess,),
+            )
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Translator backends shared by live captions and live screen translation.
+
+Every backend exposes `translate_batch(texts, target_language, source_language)`
+and returns one string per input, with "" for anything that could not be
+translated, so callers never have to handle backend-specific errors.
+
+  trans     the translate-shell CLI, one fork per call (batched calls join
+            single-line texts into one request)
+  argos     offline Argos Translate / CTranslate2 models, hosted in a
+            long-lived worker process
+  loopback  returns the input tagged with the target language; for replays
+            and benchmarks without network or models
+
+Running this file with `--serve <backend>` starts the worker side of
+`WorkerProcessBackend`: one JSON request per stdin line, one JSON response per
+stdout line.
+"""
+from __future__ import annotations
+
+import abc
+import argparse
+import json
+import os
+import select
+import subprocess
+import sys
+import threading
+import time
+
+BACKEND_NAMES = ("trans", "argos", "loopback")
+WORKER_BACKENDS = {"argos"}
+WORKER_START_TIMEOUT_SECS = 60.0
+WORKER_RETRY_SECS = 30.0
+
+
+class TranslatorBackend(abc.ABC):
+    name = "base"
+
+    @abc.abstractmethod
+    def translate_batch(self, texts: list[str], target_language: str, source_language: str = "") -> list[str]:
+        """One translation per text, "" where it failed."""
+
+    def translate(self, text: str, target_language: str, source_language: str = "") -> str:
+        return self.translate_batch([text], target_language, source_language)[0]
+
+    def close(self) -> None:
+        pass
+
+
+class LoopbackBackend(TranslatorBackend):
+    name = "loopback"
+
+    def __init__(self, delay_seconds: float = 0.0):
+        self.delay_seconds = delay_seconds
+
+    def translate_batch(self, texts: list[str], target_language: str, source_language: str = "") -> list[str]:
+        if self.delay_seconds > 0:
+            time.sleep(self.delay_seconds)
+        return [f"[{target_language}] {text}" if text else "" for text in texts]
+
+
+class TransCliBackend(TranslatorBackend):
+    name = "trans"
+
+    def __init__(self, executable: str = "trans", timeout: float = 10.0):
+        self.executable = executable
+        self.timeout = timeout
+
+    def _run(self, text: str, target_language: str, source_language: str) -> str:
+        try:
+            result = subprocess.run(
+                [self.executable, "-brief", f"{source_language}:{target_language}", text],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                check=True,
+            )
+        except Exception:
+            return ""
+        return (result.stdout or result.stderr).strip()
+
+    def translate_batch(self, texts: list[str], target_language: str, source_language: str = "") -> list[str]:
+        if not texts:
+            return []
+        # Single-line texts can share one request: translate-shell keeps line breaks.
+        if len(texts) > 1 and all(text and "\n" not in text for text in texts):
+            lines = self._run("\n".join(texts), target_language, source_language).splitlines()
+            if len(lines) == len(texts):
+                return [line.strip() for line in lines]
+        return [self._run(text, target_language, source_language) if text else "" for text in texts]
+
+
+class ArgosBackend(TranslatorBackend):
+    name = "argos"
+
+    def __init__(self):
+        try:
+            import argostranslate.translate
+        except ImportError as error:
+            raise RuntimeError(
+                "Argos Translate is not installed. Install argostranslate and a language package "
+                "(argospm install translate-<from>_<to>) to use the offline translator."
+            ) from error
+        self._translate_module = argostranslate.translate
+        self._translations: dict[tuple[str, str], object] = {}
+
+    def _translation(self, source_language: str, target_language: str):
+        key = (source_language, target_language)
+        if key not in self._translations:
+            languages = {language.code: language for language in self._translate_module.get_installed_languages()}
+            source = languages.get(source_language)
+            target = languages.get(target_language)
+            self._translations[key] = source.get_translation(target) if source and target else None
+        return self._translations[key]
+
+    def translate_batch(self, texts: list[str], target_language: str, source_language: str = "") -> list[str]:
+        code = source_language.split("-")[0].lower()
+        translation = self._translation(code, target_language) if code else None
+        if translation is None:
+            return ["" for _ in texts]
+        results = []
+        for text in texts:
+            try:
+                results.append(translation.translate(text).strip() if text else "")
+            except Exception:
+                results.append("")
+        return results
+
+
+class WorkerProcessBackend(TranslatorBackend):
+    """
+    Hosts another backend in a long-lived child process so models load once
+    and translation never competes with the caller for the GIL. Requests are
+    serialized; batching is what amortizes the round trip.
+    """
+
+    def __init__(self, backend_name: str, timeout: float = 10.0):
+        self.name = backend_name
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen | None = None
+        self._buffer = b""
+        self._next_id = 0
+        self._reported_error = ""
+        self._retry_at = 0.0
+
+    def _start(self) -> None:
+        if time.monotonic() < self._retry_at:
+            raise RuntimeError(self._reported_error or "translator worker unavailable")
+        self._retry_at = time.monotonic() + WORKER_RETRY_SECS
+        self._process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--serve", self.name],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=None,
+        )
+        self._buffer = b""
+        ready = self._read_message(WORKER_START_TIMEOUT_SECS)
+        if ready is None or not ready.get("ready"):
+            error = (ready or {}).get("error") or "translator worker did not start"
+            self._stop_process()
+            raise RuntimeError(error)
+        self._retry_at = 0.0
+
+    def _stop_process(self) -> None:
+        if self._process is None:
+            return
+        try:
+            self._process.stdin.close()
+            self._process.wait(timeout=1.0)
+        except Exception:
+            self._process.kill()
+        self._process = None
+
+    def _read_message(self, timeout: float) -> dict | None:
+        deadline = time.monotonic() + timeout
+        stdout = self._process.stdout
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            readable, _, _ = select.select([stdout], [], [], remaining)
+            if not readable:
+                return None
+            chunk = os.read(stdout.fileno(), 65536)
+            if not chunk:
+                return None
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def _report(self, error: str) -> None:
+        if error != self._reported_error:
+            print(f"Translator worker ({self.name}): {error}", file=sys.stderr)
+            self._reported_error = error
+
+    def translate_batch(self, texts: list[str], target_language: str, source_language: str = "") -> list[str]:
+        if not texts:
+            return []
+        with self._lock:
+            try:
+                if self._process is None or self._process.poll() is not None:
+                    self._start()
+                self._next_id += 1
+                request = {"id": self._next_id, "texts": texts, "target": target_language, "source": source_language}
+                self._process.stdin.write(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+                self._process.stdin.flush()
+                response = self._read_message(self.timeout)
+            except (OSError, RuntimeError, ValueError) as error:
+                self._report(str(error))
+                self._stop_process()
+                return ["" for _ in texts]
+
+            if response is None or response.get("id") != self._next_id:
+                # A timed-out worker may still answer later; restart rather than desync.
+                self._report("request timed out")
+                self._stop_process()
+                return ["" for _ in texts]
+            if response.get("error"):
+                self._report(response["error"])
+            translations = response.get("translations") or []
+            if len(translations) != len(texts):
+                return ["" for _ in texts]
+            return [str(translation or "") for translation in translations]
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop_process()
+
+
+def create_inline_backend(name: str, timeout: float = 10.0) -> TranslatorBackend:
+    if name == "trans":
+        return TransCliBackend(timeout=timeout)
+    if name == "argos":
+        return ArgosBackend()
+    if name == "loopback":
+        return LoopbackBackend()
+    raise ValueError(f"Unknown translator backend '{name}'. Expected one of: {', '.join(BACKEND_NAMES)}")
+
+
+def create_backend(name: str, in_worker: bool | None = None, timeout: float = 10.0) -> TranslatorBackend:
+    """Model-backed translators run in a worker process unless asked otherwise."""
+    if name not in BACKEND_NAMES:
+        raise ValueError(f"Unknown translator backend '{name}'. Expected one of: {', '.join(BACKEND_NAMES)}")
+    if in_worker is None:
+        in_worker = name in WORKER_BACKENDS
+    if in_worker:
+        return WorkerProcessBackend(name, timeout=timeout)
+    return create_inline_backend(name, timeout=timeout)
+
+
+def serve(name: str) -> int:
+    # Keep stdout for the protocol; anything the backend prints goes to stderr.
+    stdout = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        backend = create_inline_backend(name)
+    except Exception as error:
+        stdout.write(json.dumps({"ready": False, "error": str(error)}) + "\n")
+        stdout.flush()
+        return 1
+
+    stdout.write(json.dumps({"ready": True}) + "\n")
+    stdout.flush()
+    for line in sys.stdin:
+        try:
+            request = json.loads(line)
+        except ValueError:
+            continue
+        try:
+            translations = backend.translate_batch(
+                [str(text) for text in request.get("texts") or []],
+                str(request.get("target") or ""),
+                str(request.get("source") or ""),
+            )
+            response = {"id": request.get("id"), "translations": translations}
+        except Exception as error:
+            response = {"id": request.get("id"), "error": str(error)}
+        stdout.write(json.dumps(response, ensure_ascii=False) + "\n")
+        stdout.flush()
+    backend.close()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--serve", choices=BACKEND_NAMES, required=True,
+                        help="Run as a translator worker speaking JSON lines on stdin/stdout")
+    args = parser.parse_args()
+    return serve(args.serve)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
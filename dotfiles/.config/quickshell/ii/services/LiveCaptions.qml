@@ -28,14 +28,16 @@ Singleton {
     readonly property var modelOptions: [
         { id: "tiny", label: Translation.tr("Tiny"), description: Translation.tr("Realtime") },
         { id: "base", label: Translation.tr("Base"), description: Translation.tr("Sharper") },
-        { id: "small", label: Translation.tr("Small"), description: Translation.tr("Slowest") }
+        { id: "small", label: Translation.tr("Small"), description: Translation.tr("Slowest") },
+        { id: "auto", label: Translation.tr("Auto"), description: Translation.tr("Fastest fit for this machine") }
     ]
 
     readonly property var tuningPresetOptions: [
         { id: "realtime", label: Translation.tr("Realtime"), description: Translation.tr("Fastest") },
         { id: "snappy", label: Translation.tr("Snappy"), description: Translation.tr("Closest to realtime") },
         { id: "balanced", label: Translation.tr("Balanced"), description: Translation.tr("Smoother text") },
-        { id: "accurate", label: Translation.tr("Accurate"), description: Translation.tr("More confirmation") }
+        { id: "accurate", label: Translation.tr("Accurate"), description: Translation.tr("More confirmation") },
+        { id: "auto", label: Translation.tr("Auto"), description: Translation.tr("Adapts to decode speed") }
     ]
 
     property bool backendAvailable: false
@@ -46,9 +48,12 @@ Singleton {
     property bool workerActive: false
     property string backendStatusText: Translation.tr("Backend not checked yet.")
     property string lastBackendLog: ""
+    property int lastStreamSeq: 0
 
     readonly property bool active: workerActive || launchPending
     readonly property bool translating: displayMode !== "captions"
+    // Captioning both sources needs the Whisper backend and a fixed preset.
+    readonly property bool bothSourcesAvailable: backendKind !== "asr" && tuningPreset !== "auto"
     property var state: ({
         "status": active ? "running" : "stopped",
         "message": "",
@@ -75,6 +80,8 @@ Singleton {
     readonly property string sourceLanguage: String(state?.source_language ?? "")
     readonly property string runtimeDevice: String(state?.runtime_device ?? "")
     readonly property var history: state?.history ?? []
+    readonly property var tuning: state?.tuning ?? ({})
+    readonly property var streams: state?.streams ?? []
     readonly property bool hasText: currentText.trim().length > 0 || translatedText.trim().length > 0
     readonly property bool showTranslatedLine: translating && translatedText.trim().length > 0
     readonly property string transcriptText: root.buildContinuousTranscript(root.history, root.currentText, "text")
@@ -201,6 +208,8 @@ Singleton {
         targetLanguage = Persistent.states.liveCaptions.targetLanguage || "en"
         modelName = Persistent.states.liveCaptions.model || "tiny"
         tuningPreset = Persistent.states.liveCaptions.tuningPreset || "realtime"
+        if (sourceMode === "both" && !bothSourcesAvailable)
+            sourceMode = "system"
     }
 
     function persistSettings() {
@@ -217,7 +226,7 @@ Singleton {
     }
 
     function setSourceMode(mode) {
-        if (mode === sourceMode)
+        if (mode === sourceMode || (mode === "both" && !bothSourcesAvailable))
             return
         sourceMode = mode
         persistSettings()
@@ -228,6 +237,8 @@ Singleton {
         if (backend === backendKind)
             return
         backendKind = backend
+        if (sourceMode === "both" && !bothSourcesAvailable)
+            sourceMode = "system"
         persistSettings()
         refreshBackendAvailability()
         restartIfActive()
@@ -269,6 +280,8 @@ Singleton {
         if (preset === tuningPreset)
             return
         tuningPreset = preset
+        if (sourceMode === "both" && !bothSourcesAvailable)
+            sourceMode = "system"
         persistSettings()
         restartIfActive()
     }
@@ -310,13 +323,34 @@ Singleton {
         root.state = nextPayload
     }
 
+    function handleStateEvent(line) {
+        let event
+        try {
+            event = JSON.parse(line)
+        } catch (e) {
+            return
+        }
+
+        const seq = Number(event?.seq ?? 0)
+        const contiguous = event?.reset || seq === root.lastStreamSeq + 1
+        const base = event?.reset ? {} : Object.assign({}, root.state)
+        root.lastStreamSeq = seq
+        root.handleStatePayload(Object.assign(base, event?.changes ?? {}))
+
+        // A missed line means the merged state may be incomplete; resync from the snapshot.
+        if (!contiguous)
+            stateFileView.reload()
+    }
+
     function buildBackendLaunchCommand() {
         const backendPythonPath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsPythonPath)
         const backendScriptPath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsBackendScriptPath)
         const backendStatePath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsStatePath)
+        const backendStreamPath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsStreamPath)
         const backendModelCachePath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsModelCachePath)
         const backendVenvPath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsVenvPath)
         const backendPidPath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsPidPath)
+        const backendSocketPath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsSocketPath)
         const backendLogPath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsLogPath)
         const sourceMode = CF.StringUtils.shellSingleQuoteEscape(root.sourceMode)
         const backendKind = CF.StringUtils.shellSingleQuoteEscape(root.backendKind)
@@ -328,6 +362,7 @@ Singleton {
         const launchScript =
             `rm -f '${backendPidPath}'; ` +
             `: > '${backendLogPath}'; ` +
+            `: > '${backendStreamPath}'; ` +
             `backend_venv='${backendVenvPath}'; ` +
             `cuda_lib_path=''; ` +
             `for libdir in "$backend_venv"/lib/python*/site-packages/nvidia/*/lib; do ` +
@@ -336,8 +371,13 @@ Singleton {
             `done; ` +
             `if [ -n "$cuda_lib_path" ]; then export LD_LIBRARY_PATH="$cuda_lib_path\${LD_LIBRARY_PATH:+:\$LD_LIBRARY_PATH}"; fi; ` +
             `if [ -x '${backendPythonPath}' ]; then backend_python='${backendPythonPath}'; else backend_python='python3'; fi; ` +
-            `nohup "$backend_python" '${backendScriptPath}' ` +
+            // The resident daemon keeps models loaded between sessions and writes the pid file while one runs.
+            `"$backend_python" '${backendScriptPath}' ` +
+            `--daemon-command start ` +
+            `--daemon-socket '${backendSocketPath}' ` +
+            `--pid-file '${backendPidPath}' ` +
             `--state-file '${backendStatePath}' ` +
+            `--state-stream '${backendStreamPath}' ` +
             `--backend '${backendKind}' ` +
             `--source '${sourceMode}' ` +
             `--display-mode '${displayMode}' ` +
@@ -346,7 +386,7 @@ Singleton {
             `--model '${modelName}' ` +
             `--preset '${tuningPreset}' ` +
             `--model-cache-dir '${backendModelCachePath}' ` +
-            `>>'${backendLogPath}' 2>&1 & echo $! > '${backendPidPath}'`
+            `>>'${backendLogPath}' 2>&1`
         return [
             "bash",
             "-c",
@@ -367,10 +407,17 @@ Singleton {
     }
 
     function buildStopCommand() {
+        const backendPythonPath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsPythonPath)
+        const backendScriptPath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsBackendScriptPath)
         const backendPidPath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsPidPath)
+        const backendSocketPath = CF.StringUtils.shellSingleQuoteEscape(Directories.liveCaptionsSocketPath)
         return [
             "bash",
             "-c",
+            `if [ -x '${backendPythonPath}' ]; then backend_python='${backendPythonPath}'; else backend_python='python3'; fi; ` +
+            `if [ -S '${backendSocketPath}' ] && "$backend_python" '${backendScriptPath}' ` +
+            `--daemon-command stop --daemon-socket '${backendSocketPath}' >/dev/null 2>&1; then ` +
+            `rm -f '${backendPidPath}'; exit 0; fi; ` +
             `if [ -f '${backendPidPath}' ]; then ` +
             `pid="$(cat '${backendPidPath}')"; ` +
             `if [ -n "$pid" ]; then kill "$pid" 2>/dev/null || true; fi; ` +
@@ -446,6 +493,7 @@ Singleton {
         root.restartPending = false
         root.launchPending = true
         root.workerActive = false
+        root.lastStreamSeq = 0
         root.persistStatePayload(root.clearState("loading", Translation.tr("Starting live captions…")))
         Quickshell.execDetached(buildBackendLaunchCommand())
         launchTimeoutTimer.restart()
@@ -501,7 +549,8 @@ Singleton {
 
     Timer {
         id: statePollTimer
-        interval: 60
+        // The NDJSON stream carries live updates; the snapshot is only a fallback.
+        interval: stateStreamProc.running ? 1000 : 60
         repeat: true
         running: root.active || GlobalStates.liveCaptionsOpen
         onTriggered: stateFileView.reload()
@@ -537,6 +586,8 @@ Singleton {
         onLoaded: {
             try {
                 const parsed = JSON.parse(stateFileView.text() || "{}")
+                if (parsed.seq !== undefined && Number(parsed.seq) < root.lastStreamSeq)
+                    return
                 root.handleStatePayload(parsed)
             } catch (e) {
                 root.handleStatePayload({
@@ -578,6 +629,15 @@ Singleton {
         }
     }
 
+    Process {
+        id: stateStreamProc
+        running: root.active
+        command: ["tail", "-F", "-n", "+1", Directories.liveCaptionsStreamPath]
+        stdout: SplitParser {
+            onRead: line => root.handleStateEvent(line)
+        }
+    }
+
     Process {
         id: workerStatusProc
         onExited: (exitCode, exitStatus) => {